@@ -1,5 +1,6 @@
 """Orchestrator - Sequential workflow coordination using Microsoft Agent Framework."""
 
+import asyncio
 import logging
 from typing import Dict, Any, AsyncIterator, Optional
 import json
@@ -10,7 +11,12 @@ from app.agents.analyzer import HybridScoringAgent
 from app.agents.cv_parser import CVParserAgent
 from app.agents.job_parser import JobParserAgent
 from app.agents.report_generator import ReportGeneratorAgent
-from app.models.domain import AnalysisResult, SkillMatch
+from app.models.domain import (
+    AnalysisResult,
+    EducationMatch,
+    ExperienceMatch,
+    SkillMatchDict,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +27,7 @@ class CVCheckerOrchestrator:
 
     Workflow:
     1. JobParser → Extract job requirements
-    2. CVParser → Extract CV data
+    2. CVParser → Extract CV data (concurrently with step 1)
     3. Analyzer → Hybrid scoring (deterministic + LLM)
     4. ReportGenerator → Create recommendations
 
@@ -76,18 +82,26 @@ class CVCheckerOrchestrator:
         logger.info("=" * 60)
 
         try:
-            # Step 1: Parse job description
-            logger.info("Step 1/4: Parsing job description...")
+            # Steps 1-2: Parse job description and CV. The parsers are
+            # independent, so both LLM calls run concurrently.
+            logger.info("Steps 1-2/4: Parsing job description and CV...")
             yield {
                 "type": "progress",
                 "step": 1,
                 "total_steps": 4,
-                "message": "Parsing job description...",
+                "message": "Parsing job description and CV...",
                 "status": "in_progress"
             }
             
-            job_requirements = await self.job_parser.parse(job_description)
+            job_requirements, candidate_profile = await asyncio.gather(
+                self.job_parser.parse(job_description),
+                self.cv_parser.parse(cv_markdown),
+            )
             logger.info(f"✓ Job parsed - Title: {job_requirements.get('job_title')}")
+            logger.info(
+                f"✓ CV parsed - Candidate: {candidate_profile.get('candidate_name')}, "
+                f"Experience: {candidate_profile.get('total_years_experience')} years"
+            )
             
             yield {
                 "type": "progress",
@@ -96,23 +110,6 @@ class CVCheckerOrchestrator:
                 "message": "Job description parsed",
                 "status": "completed"
             }
-
-            # Step 2: Parse CV
-            logger.info("Step 2/4: Parsing CV...")
-            yield {
-                "type": "progress",
-                "step": 2,
-                "total_steps": 4,
-                "message": "Parsing CV...",
-                "status": "in_progress"
-            }
-            
-            candidate_profile = await self.cv_parser.parse(cv_markdown)
-            logger.info(
-                f"✓ CV parsed - Candidate: {candidate_profile.get('candidate_name')}, "
-                f"Experience: {candidate_profile.get('total_years_experience')} years"
-            )
-            
             yield {
                 "type": "progress",
                 "step": 2,
@@ -159,10 +156,23 @@ class CVCheckerOrchestrator:
                 "status": "in_progress"
             }
             
-            report_data = await self.report_generator.generate(
-                hybrid_score_dict=hybrid_score.to_dict(),
+            # Stream the report as it is generated, so the client sees
+            # output before the last agent finishes
+            hybrid_score_dict = hybrid_score.to_dict()
+            report_parts = []
+            async for text in self.report_generator.generate_stream(
+                hybrid_score_dict=hybrid_score_dict,
                 job_requirements=job_requirements,
                 candidate_profile=candidate_profile,
+            ):
+                report_parts.append(text)
+                yield {
+                    "type": "report_chunk",
+                    "step": 4,
+                    "text": text
+                }
+            report_data = self.report_generator.parse_report(
+                "".join(report_parts), hybrid_score_dict
             )
             logger.info(
                 f"✓ Report generated - {len(report_data.get('recommendations', []))} recommendations"
@@ -223,7 +233,7 @@ class CVCheckerOrchestrator:
         # Add matched skills
         for skill in hybrid_score.deterministic_component.matched_skills:
             skill_matches.append(
-                SkillMatch(
+                SkillMatchDict(
                     skill_name=skill,
                     required=True,
                     candidate_has=True,
@@ -236,7 +246,7 @@ class CVCheckerOrchestrator:
         # Add missing skills
         for skill in hybrid_score.deterministic_component.missing_skills:
             skill_matches.append(
-                SkillMatch(
+                SkillMatchDict(
                     skill_name=skill,
                     required=True,
                     candidate_has=False,
@@ -247,20 +257,20 @@ class CVCheckerOrchestrator:
             )
 
         # Build experience match
-        experience_match = {
-            "required_years": job_requirements.get("required_years", 0),
-            "candidate_years": candidate_profile.get("total_years_experience", 0),
-            "alignment_score": hybrid_score.deterministic_component.experience_alignment_percent,
-            "match": hybrid_score.deterministic_component.experience_alignment_percent >= 70,
-        }
+        experience_match = ExperienceMatch(
+            required_years=job_requirements.get("required_years", 0),
+            candidate_years=candidate_profile.get("total_years_experience", 0),
+            alignment_score=hybrid_score.deterministic_component.experience_alignment_percent,
+            match=hybrid_score.deterministic_component.experience_alignment_percent >= 70,
+        )
 
         # Build education match
-        education_match = {
-            "required": job_requirements.get("education_requirements", "Not specified"),
-            "candidate": self._format_education(candidate_profile.get("education", [])),
-            "match": True,  # Simplified for now
-            "score": 100.0,  # Simplified for now
-        }
+        education_match = EducationMatch(
+            required=job_requirements.get("education_requirements", "Not specified"),
+            candidate=self._format_education(candidate_profile.get("education", [])),
+            match=True,  # Simplified for now
+            score=100.0,  # Simplified for now
+        )
 
         # Format recommendations as simple list
         recommendations_list = self.report_generator.format_recommendations_as_list(
@@ -273,6 +283,8 @@ class CVCheckerOrchestrator:
                 "Continue developing skills aligned with career goals"
             )
 
+        # Scores and requirements come from agent output, so validate them here
+        # rather than at the response boundary or on the Cosmos write
         return AnalysisResult(
             overall_score=hybrid_score.final_score,
             skill_matches=skill_matches,
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from agent_framework.azure import AzureOpenAIChatClient
 
@@ -88,8 +88,107 @@ Ensure at least 5 total recommendations. Be constructive and encouraging."""
         )
 
         try:
-            # Build context for report generation
-            task = f"""**ANALYSIS RESULTS**:
+            task = self._build_task(hybrid_score_dict, job_requirements, candidate_profile)
+
+            # Run agent
+            response = await self.agent.run(task)
+
+            # Extract and parse response
+            response_text = response.content if hasattr(response, 'content') else str(response)
+            return self.parse_report(response_text, hybrid_score_dict)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Report generation failed: {e}")
+            raise
+
+    async def generate_stream(
+        self,
+        hybrid_score_dict: Dict[str, Any],
+        job_requirements: Dict[str, Any],
+        candidate_profile: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """
+        Generate the recommendations report, yielding the response as it streams.
+
+        Pass the concatenated chunks to parse_report() for the report data.
+
+        Args:
+            hybrid_score_dict: Hybrid score analysis results
+            job_requirements: Parsed job requirements
+            candidate_profile: Parsed candidate profile
+
+        Yields:
+            Response text chunks, in order
+        """
+        logger.info(
+            f"Streaming recommendations for score: {hybrid_score_dict.get('final_score')}"
+        )
+
+        task = self._build_task(hybrid_score_dict, job_requirements, candidate_profile)
+        try:
+            async for update in self.agent.run_stream(task):
+                text = update.text if hasattr(update, 'text') else str(update)
+                if text:
+                    yield text
+        except Exception as e:
+            logger.error(f"Report generation failed: {e}")
+            raise
+
+    def parse_report(
+        self, response_text: str, hybrid_score_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Parse the agent's JSON response into report data, filling in defaults.
+
+        Args:
+            response_text: Complete agent response
+            hybrid_score_dict: Hybrid score analysis results
+
+        Returns:
+            Dictionary with recommendations and report
+
+        Raises:
+            ValueError: If the response is not valid JSON
+        """
+        try:
+            report_data = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse report response: {e}")
+            raise ValueError(f"Invalid JSON from ReportGenerator: {e}")
+
+        # Ensure we have required fields
+        if "recommendations" not in report_data:
+            report_data["recommendations"] = []
+
+        if "executive_summary" not in report_data:
+            report_data["executive_summary"] = (
+                f"Candidate scored {hybrid_score_dict.get('final_score')}/100 "
+                f"with grade {hybrid_score_dict.get('grade')}."
+            )
+
+        # Ensure minimum recommendations
+        if len(report_data["recommendations"]) < 5:
+            logger.warning(
+                f"Only {len(report_data['recommendations'])} recommendations generated, "
+                "expected at least 5"
+            )
+
+        logger.info(
+            f"Report generated with {len(report_data['recommendations'])} recommendations"
+        )
+
+        return report_data
+
+    def _build_task(
+        self,
+        hybrid_score_dict: Dict[str, Any],
+        job_requirements: Dict[str, Any],
+        candidate_profile: Dict[str, Any],
+    ) -> str:
+        """Build the report generation prompt from the analysis outputs."""
+        return f"""**ANALYSIS RESULTS**:
 Final Score: {hybrid_score_dict.get('final_score')}/100 (Grade: {hybrid_score_dict.get('grade')})
 
 Strengths:
@@ -119,43 +218,6 @@ Skills: {', '.join(candidate_profile.get('skills', [])[:10])}
 
 Generate actionable recommendations to improve this candidate's match for this role."""
 
-            # Run agent
-            response = await self.agent.run(task)
-
-            # Extract and parse response
-            response_text = response.content if hasattr(response, 'content') else str(response)
-            report_data = json.loads(response_text)
-
-            # Ensure we have required fields
-            if "recommendations" not in report_data:
-                report_data["recommendations"] = []
-
-            if "executive_summary" not in report_data:
-                report_data["executive_summary"] = (
-                    f"Candidate scored {hybrid_score_dict.get('final_score')}/100 "
-                    f"with grade {hybrid_score_dict.get('grade')}."
-                )
-
-            # Ensure minimum recommendations
-            if len(report_data["recommendations"]) < 5:
-                logger.warning(
-                    f"Only {len(report_data['recommendations'])} recommendations generated, "
-                    "expected at least 5"
-                )
-
-            logger.info(
-                f"Report generated with {len(report_data['recommendations'])} recommendations"
-            )
-
-            return report_data
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse report response: {e}")
-            raise ValueError(f"Invalid JSON from ReportGenerator: {e}")
-        except Exception as e:
-            logger.error(f"Report generation failed: {e}")
-            raise
-
     def format_recommendations_as_list(
         self, report_data: Dict[str, Any]
     ) -> List[str]:
@@ -1,32 +1,41 @@
 """FastAPI application for CV Checker."""
 
+import asyncio
 import logging
 import uuid
 import json
 from contextlib import asynccontextmanager
 from time import time
+from typing import Any, Callable, TypeVar
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+import orjson
+from agent_framework.azure import AzureOpenAIChatClient
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from app import __version__
 from app.config import Settings, get_settings
-from app.models.requests import AnalyzeRequest, JobSubmissionRequest
+from app.models.requests import (
+    ANALYZE_REQUEST_ADAPTER,
+    JOB_SUBMISSION_ADAPTER,
+    AnalyzeRequest,
+    JobSubmissionRequest,
+)
 from app.models.responses import (
     AnalyzeResponse,
     ErrorResponse,
     HealthCheckResponse,
     JobSubmissionErrorResponse,
     JobSubmissionResponse,
-    SkillMatchResponse,
 )
 from app.repositories.analysis import AnalysisRepository, InMemoryAnalysisRepository
-from app.repositories.cosmos_repository import CosmosDBRepository
+from app.repositories.cosmos_repository import CosmosDBRepository, create_cosmos_client
 from app.services.cv_checker import CVCheckerService
 from app.services.linkedin_scraper import (
     AntiBotDetected,
@@ -35,7 +44,9 @@ from app.services.linkedin_scraper import (
     LinkedInScraperService,
     PageLoadTimeout,
 )
-from app.utils.azure_openai import get_openai_client
+from app.utils.azure_openai import close_openai_client, get_openai_client, init_openai_client
+from app.utils.concurrency import run_blocking
+from app.utils.credential import close_credential
 from app.utils.linkedin_validator import is_valid_linkedin_job_url
 
 # Configure logging
@@ -49,6 +60,44 @@ logger = logging.getLogger(__name__)
 limiter = Limiter(key_func=get_remote_address)
 
 
+async def _init_linkedin_scraper(app: FastAPI) -> None:
+    """Launch the LinkedIn scraper's browser (global instance)."""
+    app.state.linkedin_scraper = LinkedInScraperService()
+    await app.state.linkedin_scraper.initialize()
+    logger.info("LinkedIn scraper service initialized")
+
+
+async def _init_cosmos_repository(app: FastAPI, settings: Settings) -> None:
+    """
+    Create the Cosmos DB client and repository (if enabled) and warm them up.
+
+    The client is process-wide so its pooled connections are reused across
+    requests. Failures are logged and leave persistence disabled.
+    """
+    if not settings.is_cosmos_enabled:
+        logger.info("Cosmos DB not configured, persistence disabled")
+        return
+    try:
+        app.state.cosmos_client = create_cosmos_client(settings)
+        app.state.cosmos_repository = CosmosDBRepository.create_from_settings(
+            settings, client=app.state.cosmos_client
+        )
+        await app.state.cosmos_repository.warm_up()
+        logger.info("Cosmos DB repository initialized")
+    except Exception as e:
+        logger.error("Failed to initialize Cosmos DB repository: %s", e)
+        app.state.cosmos_repository = None
+
+
+async def _init_openai_client() -> AzureOpenAIChatClient | None:
+    """Create the shared Azure OpenAI client and warm its credential; None on failure."""
+    try:
+        return await init_openai_client()
+    except Exception as e:
+        logger.error("Failed to initialize CV Checker service: %s", e)
+        return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -59,26 +108,30 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("CV Checker API starting up...")
     settings = get_settings()
-    logger.info(f"Environment: {settings.app_env}")
-    logger.info(f"Log level: {settings.log_level}")
-    logger.info(f"Azure OpenAI endpoint: {settings.azure_openai_endpoint}")
-    
-    # Initialize LinkedIn scraper service (global instance)
-    app.state.linkedin_scraper = LinkedInScraperService()
-    await app.state.linkedin_scraper.initialize()
-    logger.info("LinkedIn scraper service initialized")
+    logger.info("Environment: %s", settings.app_env)
+    logger.info("Log level: %s", settings.log_level)
+    logger.info("Azure OpenAI endpoint: %s", settings.azure_openai_endpoint)
     
-    # Initialize Cosmos DB repository (if enabled)
-    if settings.is_cosmos_enabled:
-        try:
-            app.state.cosmos_repository = CosmosDBRepository.create_from_settings(settings)
-            logger.info("Cosmos DB repository initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Cosmos DB repository: {e}")
-            app.state.cosmos_repository = None
-    else:
-        logger.info("Cosmos DB not configured, persistence disabled")
-        app.state.cosmos_repository = None
+    # The scraper's browser launch, the Cosmos metadata read and the Azure
+    # OpenAI token acquisition are independent and each can take seconds, so
+    # they run concurrently and are all done before the first request
+    app.state.cosmos_client = None
+    app.state.cosmos_repository = None
+    _, _, openai_client = await asyncio.gather(
+        _init_linkedin_scraper(app),
+        _init_cosmos_repository(app, settings),
+        _init_openai_client(),
+    )
+
+    # Initialize CV Checker service once and share it across requests
+    app.state.cv_service = None
+    if openai_client is not None:
+        repository = app.state.cosmos_repository or InMemoryAnalysisRepository()
+        app.state.cv_service = CVCheckerService(repository, openai_client)
+        logger.info("CV Checker service initialized")
+
+    # Build the OpenAPI schema up front; FastAPI caches it on app.openapi_schema
+    app.openapi()
 
     yield
 
@@ -87,6 +140,11 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, 'linkedin_scraper'):
         await app.state.linkedin_scraper.close()
         logger.info("LinkedIn scraper service closed")
+    if app.state.cosmos_client is not None:
+        await app.state.cosmos_client.close()
+        logger.info("Cosmos DB client closed")
+    await close_openai_client()
+    await close_credential()
 
 
 # Create FastAPI application
@@ -162,27 +220,95 @@ def get_cosmos_repository(request: Request) -> CosmosDBRepository | None:
     return getattr(request.app.state, 'cosmos_repository', None)
 
 
-def get_service(
-    repository: AnalysisRepository = Depends(get_repository),
-) -> CVCheckerService:
+async def get_service(request: Request) -> CVCheckerService:
     """
-    Get CV Checker service instance.
+    Get CV Checker service instance from app state.
+
+    The service is built once during startup; if that did not happen
+    (e.g. lifespan not run), it is created on first use and cached.
 
     Args:
-        repository: Analysis repository
+        request: FastAPI request object
 
     Returns:
         CVCheckerService instance
     """
-    openai_client = get_openai_client()
-    return CVCheckerService(repository, openai_client)
+    service = getattr(request.app.state, 'cv_service', None)
+    if service is None:
+        service = CVCheckerService(get_repository(request), get_openai_client())
+        request.app.state.cv_service = service
+    return service
+
+
+# Request body parsing
+T = TypeVar("T")
+
+async def _validate_json_body(request: Request, validate: Callable[[bytes], T]) -> T:
+    """
+    Decode and validate a JSON request body in a single pass.
+
+    Hands the raw bytes straight to pydantic-core instead of going through
+    ``json.loads`` + ``model_validate``, which matters for large CV payloads.
+    Validation failures are re-raised as ``RequestValidationError`` so the
+    usual 422 handler applies.
+    """
+    body = await request.body()
+    try:
+        return validate(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body)
+
+
+def _inline_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Resolve local ``$defs`` references so a schema can be embedded in OpenAPI."""
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref and ref.startswith("#/$defs/"):
+                return resolve(defs[ref.removeprefix("#/$defs/")])
+            if "discriminator" in node:
+                # The mapping points at $defs entries that no longer exist once inlined
+                property_name = node["discriminator"]["propertyName"]
+                node = {**node, "discriminator": {"propertyName": property_name}}
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve(schema)
+
+
+def _json_body_openapi(schema: dict[str, Any]) -> dict[str, Any]:
+    """Build ``openapi_extra`` documenting a JSON body parsed by a dependency."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(schema)}},
+        }
+    }
+
+
+async def parse_analyze_request(request: Request) -> AnalyzeRequest:
+    """Parse and validate the body of the analyze endpoints."""
+    return await _validate_json_body(request, ANALYZE_REQUEST_ADAPTER.validate_json)
+
+
+async def parse_job_submission_request(request: Request) -> JobSubmissionRequest:
+    """Parse and validate the body of the job submission endpoint."""
+    return await _validate_json_body(request, JOB_SUBMISSION_ADAPTER.validate_json)
 
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Custom handler for Pydantic validation errors.
 
@@ -193,20 +319,26 @@ async def validation_exception_handler(
     Returns:
         JSON error response
     """
-    logger.warning(f"Validation error on {request.url}: {exc.errors()}")
+    logger.warning("Validation error on %s: %s", request.url, exc.errors())
 
-    return JSONResponse(
+    # exc.errors() may carry non-JSON-native values (e.g. the ValueError in ``ctx``),
+    # so fall back to str() for anything orjson can't serialize natively.
+    return Response(
+        content=orjson.dumps(
+            {
+                "error": "ValidationError",
+                "message": "Request validation failed",
+                "details": {"errors": exc.errors()},
+            },
+            default=str,
+        ),
+        media_type="application/json",
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "ValidationError",
-            "message": "Request validation failed",
-            "details": {"errors": exc.errors()},
-        },
     )
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Catch-all exception handler.
 
@@ -217,21 +349,77 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     Returns:
         JSON error response
     """
-    logger.error(f"Unhandled exception on {request.url}: {str(exc)}", exc_info=True)
-
-    return JSONResponse(
+    logger.error("Unhandled exception on %s: %s", request.url, exc, exc_info=True)
+
+    return Response(
+        content=orjson.dumps(
+            {
+                "error": "InternalServerError",
+                "message": "An unexpected error occurred",
+                "details": {"error_type": type(exc).__name__},
+            }
+        ),
+        media_type="application/json",
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "InternalServerError",
-            "message": "An unexpected error occurred",
-            "details": {"error_type": type(exc).__name__},
-        },
     )
 
 
 # API Endpoints
 
 
+# Health check cache (stale-while-revalidate): dependency probes run at most
+# once per TTL regardless of how often load balancers poll /health.
+HEALTH_CACHE_TTL_SECONDS = 5.0
+_health_state: dict[str, Any] = {
+    "azure_openai": "unknown",
+    "cosmos_db": "not_configured",
+    "ts": 0.0,
+}
+_health_lock = asyncio.Lock()
+
+
+def _probe_openai() -> str:
+    """
+    Probe Azure OpenAI client initialization.
+
+    Blocking; run via ``run_blocking`` from the health endpoint.
+
+    Returns:
+        Azure OpenAI status
+    """
+    try:
+        # Test Azure OpenAI client initialization
+        get_openai_client()
+        return "connected"
+    except Exception as e:
+        logger.error("Azure OpenAI health check failed: %s", e)
+        return "unavailable"
+
+
+async def _probe_cosmos() -> str:
+    """
+    Probe Cosmos DB connectivity with the shared client from app state.
+
+    Returns:
+        Cosmos DB status
+    """
+    # Check Cosmos DB connection (Phase 2)
+    if not settings.is_cosmos_enabled:
+        return "not_configured"
+
+    client = getattr(app.state, "cosmos_client", None)
+    if client is None:
+        return "unavailable"
+
+    try:
+        # Test connection by listing databases
+        _ = [database async for database in client.list_databases()]
+        return "connected"
+    except Exception as e:
+        logger.error("Cosmos DB health check failed: %s", e)
+        return "unavailable"
+
+
 @app.get(
     "/api/v1/health",
     response_model=HealthCheckResponse,
@@ -247,37 +435,25 @@ async def health_check() -> HealthCheckResponse:
     Returns:
         HealthCheckResponse with service status and version
     """
-    try:
-        # Test Azure OpenAI client initialization
-        client = get_openai_client()
-        azure_openai_status = "connected"
-    except Exception as e:
-        logger.error(f"Azure OpenAI health check failed: {e}")
-        azure_openai_status = "unavailable"
+    if time() - _health_state["ts"] >= HEALTH_CACHE_TTL_SECONDS:
+        if _health_lock.locked() and _health_state["ts"]:
+            # Another probe is already refreshing - serve the stale result
+            logger.debug("Health refresh in flight, serving cached status")
+        else:
+            async with _health_lock:
+                # Re-check: the refresh may have completed while we waited
+                if time() - _health_state["ts"] >= HEALTH_CACHE_TTL_SECONDS:
+                    azure_openai_status, cosmos_db_status = await asyncio.gather(
+                        run_blocking(_probe_openai), _probe_cosmos()
+                    )
+                    _health_state.update(
+                        azure_openai=azure_openai_status,
+                        cosmos_db=cosmos_db_status,
+                        ts=time(),
+                    )
 
-    # Check Cosmos DB connection (Phase 2)
-    cosmos_db_status = "not_configured"
-    if settings.is_cosmos_enabled:
-        try:
-            from azure.cosmos import CosmosClient
-            from azure.identity import DefaultAzureCredential
-            
-            # Check if using Azure AD authentication or connection string
-            connection_str = settings.cosmos_connection_string
-            if "AccountKey=" in connection_str:
-                # Using connection string with account key
-                client = CosmosClient.from_connection_string(connection_str)
-            else:
-                # Using Azure AD authentication (DefaultAzureCredential)
-                credential = DefaultAzureCredential()
-                client = CosmosClient(connection_str, credential)
-            
-            # Test connection by listing databases (convert to list to execute)
-            _ = list(client.list_databases())
-            cosmos_db_status = "connected"
-        except Exception as e:
-            logger.error(f"Cosmos DB health check failed: {e}")
-            cosmos_db_status = "unavailable"
+    azure_openai_status = _health_state["azure_openai"]
+    cosmos_db_status = _health_state["cosmos_db"]
 
     # Determine overall status
     is_healthy = azure_openai_status == "connected"
@@ -314,11 +490,12 @@ async def health_check() -> HealthCheckResponse:
         },
     },
     tags=["Jobs"],
+    openapi_extra=_json_body_openapi(JOB_SUBMISSION_ADAPTER.json_schema()),
 )
 @limiter.limit("5/minute;20/hour", methods=["POST"], error_message="Too many LinkedIn scraping requests. Please try again later.")
 async def submit_job(
     request: Request,
-    job_request: JobSubmissionRequest,
+    job_request: JobSubmissionRequest = Depends(parse_job_submission_request),
     scraper: LinkedInScraperService = Depends(get_linkedin_scraper),
 ) -> JobSubmissionResponse:
     """
@@ -350,7 +527,7 @@ async def submit_job(
     if job_request.source_type == "manual":
         content = job_request.content
         
-        logger.info(f"Manual job submission - {len(content)} characters")
+        logger.info("Manual job submission - %d characters", len(content))
         
         return JobSubmissionResponse(
             job_id=str(uuid.uuid4()),
@@ -367,7 +544,7 @@ async def submit_job(
         
         # Validate LinkedIn URL format
         if not is_valid_linkedin_job_url(url):
-            logger.warning(f"Invalid LinkedIn URL format: {url}")
+            logger.warning("Invalid LinkedIn URL format: %s", url)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -379,16 +556,16 @@ async def submit_job(
             )
         
         try:
-            logger.info(f"Scraping LinkedIn job from URL: {url}")
+            logger.info("Scraping LinkedIn job from URL: %s", url)
             content = await scraper.scrape_job_description(url)
             
             # Log warning if content is unusually short (but don't reject)
             if len(content) < 50:
                 logger.warning(
-                    f"Short LinkedIn content scraped: {len(content)} chars from {url}"
+                    "Short LinkedIn content scraped: %d chars from %s", len(content), url
                 )
             
-            logger.info(f"Successfully scraped {len(content)} characters from {url}")
+            logger.info("Successfully scraped %d characters from %s", len(content), url)
             
             return JobSubmissionResponse(
                 job_id=str(uuid.uuid4()),
@@ -400,7 +577,7 @@ async def submit_job(
             )
         
         except PageLoadTimeout as e:
-            logger.warning(f"Scraping timeout for {url}: {e}")
+            logger.warning("Scraping timeout for %s: %s", url, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -413,7 +590,7 @@ async def submit_job(
             )
         
         except ContentNotFound as e:
-            logger.warning(f"Content not found for {url}: {e}")
+            logger.warning("Content not found for %s: %s", url, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -426,7 +603,7 @@ async def submit_job(
             )
         
         except AntiBotDetected as e:
-            logger.error(f"Anti-bot detected for {url}: {e}")
+            logger.error("Anti-bot detected for %s: %s", url, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -439,7 +616,7 @@ async def submit_job(
             )
         
         except LinkedInScraperError as e:
-            logger.error(f"Scraping failed for {url}: {e}")
+            logger.error("Scraping failed for %s: %s", url, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -477,12 +654,13 @@ async def submit_job(
         },
     },
     tags=["Analysis"],
+    openapi_extra=_json_body_openapi(ANALYZE_REQUEST_ADAPTER.json_schema()),
 )
 async def analyze_cv(
-    request: AnalyzeRequest,
+    request: AnalyzeRequest = Depends(parse_analyze_request),
     service: CVCheckerService = Depends(get_service),
     cosmos_repository: CosmosDBRepository | None = Depends(get_cosmos_repository),
-) -> AnalyzeResponse:
+) -> Response:
     """
     Analyze CV against job description using AI agents.
 
@@ -498,7 +676,7 @@ async def analyze_cv(
         cosmos_repository: Cosmos DB repository (optional)
 
     Returns:
-        AnalyzeResponse with comprehensive matching results
+        AnalyzeResponse (pre-serialized JSON) with comprehensive matching results
 
     Raises:
         HTTPException: On validation or processing errors
@@ -507,36 +685,12 @@ async def analyze_cv(
 
     try:
         logger.info(
-            f"Starting CV analysis - CV length: {len(request.cv_markdown)}, "
-            f"JD length: {len(request.job_description)}"
+            "Starting CV analysis - CV length: %d, JD length: %d",
+            len(request.cv_markdown),
+            len(request.job_description),
         )
 
-        # Store CV and Job in Cosmos DB if configured
         user_id = "anonymous"  # v1 doesn't have auth yet
-        cv_id = ""
-        job_id = ""
-        
-        if cosmos_repository:
-            try:
-                # Store CV with filename
-                cv_id = await cosmos_repository.create_cv(
-                    user_id, 
-                    request.cv_markdown,
-                    filename=request.cv_filename or "resume.pdf"
-                )
-                logger.info(f"Stored CV: {cv_id}")
-                
-                # Store Job (determine source type from request or default to manual)
-                job_id = await cosmos_repository.create_job(
-                    user_id,
-                    request.job_description,
-                    source_type="manual",
-                    source_url=None
-                )
-                logger.info(f"Stored Job: {job_id}")
-            except Exception as e:
-                logger.warning(f"Failed to store CV/Job in Cosmos DB: {e}")
-                # Continue with analysis even if storage fails
 
         # Execute analysis workflow
         analysis_result = await service.analyze_cv(
@@ -548,25 +702,25 @@ async def analyze_cv(
         source_type = request.source_type or "manual"
         source_url = request.source_url
         
-        # If Cosmos DB is configured, create analysis document with full content
+        # If Cosmos DB is configured, store CV, job and analysis in one batch
         if cosmos_repository:
             try:
-                # Create analysis document with CV and job content
-                analysis_id = await cosmos_repository.create_analysis(
+                cv_id, job_id, analysis_id = await cosmos_repository.create_analysis_bundle(
                     user_id=user_id,
                     cv_markdown=request.cv_markdown,
                     job_description=request.job_description,
                     source_type=source_type,
                     source_url=source_url,
                     result=analysis_result,
-                    cv_id=cv_id,
-                    job_id=job_id,
+                    filename=request.cv_filename or "resume.pdf",
+                )
+                logger.info(
+                    "Stored CV: %s, Job: %s, Analysis: %s", cv_id, job_id, analysis_id
                 )
-                logger.info(f"Created analysis document: {analysis_id}")
                 # Update the analysis_result ID to match the Cosmos DB document
                 analysis_result.id = analysis_id
             except Exception as e:
-                logger.warning(f"Failed to create analysis document in Cosmos DB: {e}")
+                logger.warning("Failed to store analysis in Cosmos DB: %s", e)
                 # Analysis result is still valid even if Cosmos DB storage fails
 
         # Convert internal model to API response
@@ -577,10 +731,7 @@ async def analyze_cv(
             source_type=source_type,
             source_url=source_url,
             overall_score=analysis_result.overall_score,
-            skill_matches=[
-                SkillMatchResponse(**match.model_dump())
-                for match in analysis_result.skill_matches
-            ],
+            skill_matches=analysis_result.skill_matches,
             experience_match=analysis_result.experience_match,
             education_match=analysis_result.education_match,
             strengths=analysis_result.strengths,
@@ -590,14 +741,17 @@ async def analyze_cv(
 
         elapsed = time() - start_time
         logger.info(
-            f"Analysis completed successfully in {elapsed:.2f}s - "
-            f"Score: {response.overall_score}"
+            "Analysis completed successfully in %.2fs - Score: %s",
+            elapsed,
+            response.overall_score,
         )
 
-        return response
+        # Serialize straight to JSON bytes in pydantic-core rather than letting
+        # FastAPI re-validate and encode the response model
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except ValueError as e:
-        logger.warning(f"Validation error: {str(e)}")
+        logger.warning("Validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -607,7 +761,7 @@ async def analyze_cv(
             },
         )
     except Exception as e:
-        logger.error(f"Analysis failed: {str(e)}", exc_info=True)
+        logger.error("Analysis failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -641,9 +795,10 @@ async def analyze_cv(
         },
     },
     tags=["Analysis"],
+    openapi_extra=_json_body_openapi(ANALYZE_REQUEST_ADAPTER.json_schema()),
 )
 async def analyze_cv_stream(
-    request: AnalyzeRequest,
+    request: AnalyzeRequest = Depends(parse_analyze_request),
     service: CVCheckerService = Depends(get_service),
     cosmos_repository: CosmosDBRepository | None = Depends(get_cosmos_repository),
 ) -> StreamingResponse:
@@ -656,6 +811,9 @@ async def analyze_cv_stream(
     3. Perform comparative analysis
     4. Generate recommendations
 
+    While recommendations are generated, the model's output is streamed as
+    ``report_chunk`` lines; the final ``result`` line carries the parsed report.
+
     Args:
         request: AnalyzeRequest with CV and job description
         service: CV Checker service instance
@@ -672,31 +830,12 @@ async def analyze_cv_stream(
         """Generator for streaming progress updates."""
         try:
             logger.info(
-                f"Starting streaming CV analysis - CV length: {len(request.cv_markdown)}, "
-                f"JD length: {len(request.job_description)}"
+                "Starting streaming CV analysis - CV length: %d, JD length: %d",
+                len(request.cv_markdown),
+                len(request.job_description),
             )
 
-            # Store CV and Job in Cosmos DB if configured
             user_id = "anonymous"
-            cv_id = ""
-            job_id = ""
-            
-            if cosmos_repository:
-                try:
-                    cv_id = await cosmos_repository.create_cv(
-                        user_id, 
-                        request.cv_markdown,
-                        filename=request.cv_filename or "resume.pdf"
-                    )
-                    job_id = await cosmos_repository.create_job(
-                        user_id,
-                        request.job_description,
-                        source_type="manual",
-                        source_url=None
-                    )
-                    logger.info(f"Stored CV: {cv_id}, Job: {job_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to store CV/Job in Cosmos DB: {e}")
 
             # Execute analysis workflow with progress
             analysis_result = None
@@ -704,8 +843,8 @@ async def analyze_cv_stream(
                 cv_markdown=request.cv_markdown,
                 job_description=request.job_description,
             ):
-                # Stream progress updates
-                if chunk.get("type") == "progress":
+                # Stream progress updates and report text as it is generated
+                if chunk.get("type") in ("progress", "report_chunk"):
                     yield json.dumps(chunk) + "\n"
                 elif chunk.get("type") == "result":
                     analysis_result = chunk["data"]
@@ -714,23 +853,22 @@ async def analyze_cv_stream(
             source_type = request.source_type or "manual"
             source_url = request.source_url
             
-            # If Cosmos DB is configured, create analysis document
+            # If Cosmos DB is configured, store CV, job and analysis in one batch
             if cosmos_repository and analysis_result:
                 try:
-                    analysis_id = await cosmos_repository.create_analysis(
+                    cv_id, job_id, analysis_id = await cosmos_repository.create_analysis_bundle(
                         user_id=user_id,
                         cv_markdown=request.cv_markdown,
                         job_description=request.job_description,
                         source_type=source_type,
                         source_url=source_url,
                         result=analysis_result,
-                        cv_id=cv_id,
-                        job_id=job_id,
+                        filename=request.cv_filename or "resume.pdf",
                     )
-                    logger.info(f"Created analysis document: {analysis_id}")
+                    logger.info("Stored CV: %s, Job: %s, Analysis: %s", cv_id, job_id, analysis_id)
                     analysis_result.id = analysis_id
                 except Exception as e:
-                    logger.warning(f"Failed to create analysis document: {e}")
+                    logger.warning("Failed to store analysis in Cosmos DB: %s", e)
 
             # Convert to API response and stream final result
             if analysis_result:
@@ -741,9 +879,7 @@ async def analyze_cv_stream(
                     "source_type": source_type,
                     "source_url": source_url,
                     "overall_score": analysis_result.overall_score,
-                    "skill_matches": [
-                        match.model_dump() for match in analysis_result.skill_matches
-                    ],
+                    "skill_matches": analysis_result.skill_matches,
                     "experience_match": analysis_result.experience_match,
                     "education_match": analysis_result.education_match,
                     "strengths": analysis_result.strengths,
@@ -758,7 +894,8 @@ async def analyze_cv_stream(
                 yield json.dumps(final_chunk) + "\n"
                 
                 logger.info(
-                    f"Streaming analysis completed - Score: {analysis_result.overall_score}"
+                    "Streaming analysis completed - Score: %s",
+                    analysis_result.overall_score,
                 )
 
         except ValueError as e:
@@ -769,7 +906,7 @@ async def analyze_cv_stream(
             }
             yield json.dumps(error_chunk) + "\n"
         except Exception as e:
-            logger.error(f"Streaming analysis failed: {str(e)}", exc_info=True)
+            logger.error("Streaming analysis failed: %s", e, exc_info=True)
             error_chunk = {
                 "type": "error",
                 "error": "AnalysisError",
@@ -849,7 +986,7 @@ async def store_cv(
         cv_id = await repository.create_cv(user_id, cv_content)
         return {"cv_id": cv_id, "user_id": user_id}
     except Exception as e:
-        logger.error(f"Failed to store CV: {e}")
+        logger.error("Failed to store CV: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to store CV: {str(e)}",
@@ -893,7 +1030,7 @@ async def store_job(
         job_id = await repository.create_job(user_id, content, source_type, source_url)
         return {"job_id": job_id, "user_id": user_id, "source_type": source_type}
     except Exception as e:
-        logger.error(f"Failed to store job: {e}")
+        logger.error("Failed to store job: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to store job: {str(e)}",
@@ -903,13 +1040,13 @@ async def store_job(
 @app.get(
     "/api/v1/analyses",
     summary="List analyses",
-    description="List analysis results for a user (Phase 2)",
+    description="List analysis summaries for a user (Phase 2)",
     tags=["Persistence"],
 )
 async def list_analyses(
     user_id: str,
     limit: int = 50,
-    offset: int = 0,
+    continuation_token: str | None = None,
     repository: CosmosDBRepository | None = Depends(get_cosmos_repository),
 ) -> dict:
     """
@@ -918,11 +1055,12 @@ async def list_analyses(
     Args:
         user_id: User ID (partition key)
         limit: Maximum results (default 50)
-        offset: Results offset (default 0)
+        continuation_token: Opaque cursor returned with the previous page
         repository: Cosmos DB repository
         
     Returns:
-        List of analysis documents
+        One page of analysis summaries and the cursor of the next page
+        (None on the last page)
     """
     if not repository:
         raise HTTPException(
@@ -931,14 +1069,17 @@ async def list_analyses(
         )
     
     try:
-        analyses = await repository.list_analyses(user_id, limit, offset)
+        analyses, next_token = await repository.list_analyses_summary(
+            user_id, limit, continuation_token
+        )
         return {
             "user_id": user_id,
             "count": len(analyses),
             "analyses": [analysis.model_dump() for analysis in analyses],
+            "continuation_token": next_token,
         }
     except Exception as e:
-        logger.error(f"Failed to list analyses: {e}")
+        logger.error("Failed to list analyses: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list analyses: {str(e)}",
@@ -984,7 +1125,7 @@ async def get_analysis(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get analysis: {e}")
+        logger.error("Failed to get analysis: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get analysis: {str(e)}",
@@ -1021,24 +1162,22 @@ async def get_history(
     
     try:
         # Fetch analyses for the user
-        analyses = await repository.list_analyses(user_id, limit=limit, offset=0)
+        analyses, _ = await repository.list_analyses(user_id, limit=limit)
         
+        # Get CV filenames and job titles from references if available (deprecated);
+        # all reads are issued concurrently
+        linked_docs = await asyncio.gather(
+            *(
+                repository.get_analysis_bundle(user_id, analysis.cvId, analysis.jobId)
+                for analysis in analyses
+            )
+        )
+
         # Build history with full analysis data including CV and job content
         history_items = []
-        for analysis in analyses:
-            # Get CV filename and job title from references if available (deprecated)
-            cv_filename = "Unknown CV"
-            job_title = "Unknown Job"
-            
-            if analysis.cvId:
-                cv_doc = await repository.get_cv_by_id(user_id, analysis.cvId)
-                if cv_doc:
-                    cv_filename = cv_doc.filename
-            
-            if analysis.jobId:
-                job_doc = await repository.get_job_by_id(user_id, analysis.jobId)
-                if job_doc:
-                    job_title = job_doc.title
+        for analysis, (cv_doc, job_doc, _) in zip(analyses, linked_docs):
+            cv_filename = cv_doc.filename if cv_doc else "Unknown CV"
+            job_title = job_doc.title if job_doc else "Unknown Job"
             
             history_items.append({
                 "id": analysis.id,
@@ -1062,7 +1201,7 @@ async def get_history(
                 }
             })
         
-        logger.info(f"Retrieved {len(history_items)} history items for user: {user_id}")
+        logger.info("Retrieved %d history items for user: %s", len(history_items), user_id)
         return {
             "user_id": user_id,
             "count": len(history_items),
@@ -1070,7 +1209,7 @@ async def get_history(
         }
     
     except Exception as e:
-        logger.error(f"Failed to get history: {e}")
+        logger.error("Failed to get history: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get history: {str(e)}",
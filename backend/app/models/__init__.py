@@ -1,7 +1,20 @@
 """Models package initialization."""
 
-from app.models.domain import AnalysisResult, CVDocument, JobDescription, SkillMatch
-from app.models.requests import AnalyzeRequest
+from app.models.domain import (
+    AnalysisResult,
+    CVDocument,
+    JobDescription,
+    SkillMatch,
+    SkillMatchDict,
+)
+from app.models.requests import (
+    ANALYZE_REQUEST_ADAPTER,
+    JOB_SUBMISSION_ADAPTER,
+    AnalyzeRequest,
+    JobSubmissionRequest,
+    LinkedInJobRequest,
+    ManualJobRequest,
+)
 from app.models.responses import (
     AnalyzeResponse,
     ErrorResponse,
@@ -15,8 +28,14 @@ __all__ = [
     "CVDocument",
     "JobDescription",
     "SkillMatch",
+    "SkillMatchDict",
     # Request models
     "AnalyzeRequest",
+    "JobSubmissionRequest",
+    "LinkedInJobRequest",
+    "ManualJobRequest",
+    "ANALYZE_REQUEST_ADAPTER",
+    "JOB_SUBMISSION_ADAPTER",
     # Response models
     "AnalyzeResponse",
     "ErrorResponse",
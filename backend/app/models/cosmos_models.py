@@ -1,11 +1,18 @@
 """Pydantic models for Cosmos DB documents."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from app.models.examples import add_example
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC timestamp, matching the domain models."""
+    return datetime.now(timezone.utc)
+
 
 class DocumentType(str, Enum):
     """Document type enumeration."""
@@ -21,20 +28,10 @@ class BaseCosmosDocument(BaseModel):
     id: str = Field(..., description="Unique document identifier")
     userId: str = Field(..., description="User ID (partition key)")
     type: DocumentType = Field(..., description="Document type")
-    createdAt: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updatedAt: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "cv-550e8400-e29b-41d4-a716-446655440000",
-                "userId": "user-abc123def456",
-                "type": "cv",
-                "createdAt": "2026-01-01T12:00:00Z",
-                "updatedAt": "2026-01-01T12:00:00Z",
-            }
-        }
-    }
+    createdAt: datetime = Field(default_factory=_utcnow, description="Creation timestamp")
+    updatedAt: datetime = Field(default_factory=_utcnow, description="Last update timestamp")
+
+    model_config = {"json_schema_extra": add_example}
 
 
 class CVDocument(BaseCosmosDocument):
@@ -45,20 +42,7 @@ class CVDocument(BaseCosmosDocument):
     content: str = Field(..., description="CV content in markdown format")
     characterCount: int = Field(..., description="Character count of CV content")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "cv-550e8400-e29b-41d4-a716-446655440000",
-                "userId": "user-abc123def456",
-                "type": "cv",
-                "filename": "john_doe_resume.pdf",
-                "content": "# John Doe\n\n## Experience\n...",
-                "characterCount": 1543,
-                "createdAt": "2026-01-01T12:00:00Z",
-                "updatedAt": "2026-01-01T12:00:00Z",
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
 
 
 class JobDocument(BaseCosmosDocument):
@@ -71,22 +55,7 @@ class JobDocument(BaseCosmosDocument):
     sourceUrl: Optional[str] = Field(default=None, description="Source URL if scraped from LinkedIn")
     characterCount: int = Field(..., description="Character count of job content")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "job-550e8400-e29b-41d4-a716-446655440001",
-                "userId": "user-abc123def456",
-                "type": "job",
-                "title": "Senior Python Developer",
-                "content": "Senior Python Developer needed...",
-                "sourceType": "linkedin_url",
-                "sourceUrl": "https://www.linkedin.com/jobs/view/123456789/",
-                "characterCount": 2341,
-                "createdAt": "2026-01-01T12:00:00Z",
-                "updatedAt": "2026-01-01T12:00:00Z",
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
 
 
 class SkillMatch(BaseModel):
@@ -108,6 +77,9 @@ class AnalysisDocument(BaseCosmosDocument):
     jobId: str = Field(default="", description="Reference to job document ID (deprecated, use jobDescription)")
     cvMarkdown: str = Field(..., description="Full CV content in Markdown format")
     jobDescription: str = Field(..., description="Full job description text")
+    contentEncoding: Optional[str] = Field(
+        default=None, description="Encoding of cvMarkdown and jobDescription (zlib+b64), None for plain text"
+    )
     sourceType: str = Field(default="manual", description="Job source type: manual or linkedin_url")
     sourceUrl: Optional[str] = Field(default=None, description="LinkedIn URL if job was scraped")
     overallScore: float = Field(..., ge=0.0, le=100.0, description="Overall match score (0-100)")
@@ -118,23 +90,17 @@ class AnalysisDocument(BaseCosmosDocument):
     gaps: list[str] = Field(default_factory=list, description="Identified gaps")
     recommendations: list[str] = Field(default_factory=list, description="Recommendations")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "analysis-550e8400-e29b-41d4-a716-446655440002",
-                "userId": "user-abc123def456",
-                "type": "analysis",
-                "cvId": "cv-550e8400-e29b-41d4-a716-446655440000",
-                "jobId": "job-550e8400-e29b-41d4-a716-446655440001",
-                "overallScore": 85.5,
-                "skillMatches": [],
-                "experienceMatch": {},
-                "educationMatch": {},
-                "strengths": ["Strong Python expertise"],
-                "gaps": ["Limited Kubernetes experience"],
-                "recommendations": ["Consider Kubernetes certification"],
-                "createdAt": "2026-01-01T12:00:00Z",
-                "updatedAt": "2026-01-01T12:00:00Z",
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
+
+
+class AnalysisSummary(BaseModel):
+    """Projected summary of an analysis document for list views."""
+
+    id: str = Field(..., description="Analysis document ID")
+    cvId: str = Field(default="", description="Reference to CV document ID")
+    jobId: str = Field(default="", description="Reference to job document ID")
+    sourceType: str = Field(default="manual", description="Job source type: manual or linkedin_url")
+    overallScore: float = Field(..., ge=0.0, le=100.0, description="Overall match score (0-100)")
+    createdAt: datetime = Field(..., description="Creation timestamp")
+
+    model_config = {"json_schema_extra": add_example}
@@ -1,10 +1,23 @@
 """Domain models for CV Checker - Cosmos DB ready."""
 
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 from typing import Any, Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
+from typing_extensions import NotRequired, TypedDict
+
+from app.models.examples import add_example
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC timestamp (replaces deprecated ``datetime.utcnow``)."""
+    return datetime.now(timezone.utc)
+
+
+def new_id() -> str:
+    """Generate a new document identifier (32 hex chars, no dashes)."""
+    return uuid.uuid4().hex
 
 
 class SkillMatch(BaseModel):
@@ -27,18 +40,51 @@ class SkillMatch(BaseModel):
         description="Match score for this skill (0.0 to 1.0)",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "skill_name": "Python",
-                "required": True,
-                "candidate_has": True,
-                "proficiency_level": "advanced",
-                "years_experience": 5.0,
-                "match_score": 1.0,
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
+
+
+class SkillMatchDict(TypedDict):
+    """
+    Lightweight skill match entry used inside analysis results.
+
+    Same shape as ``SkillMatch`` but validated as a plain dict, which avoids
+    building a model instance per skill on the analysis hot path.
+    """
+
+    skill_name: str
+    required: bool
+    candidate_has: bool
+    proficiency_level: NotRequired[Optional[str]]
+    years_experience: NotRequired[Optional[float]]
+    match_score: float
+
+
+class ExperienceMatch(TypedDict, total=False):
+    """
+    Experience level comparison between job requirements and candidate.
+
+    The years come straight from the LLM parsers (e.g. ``"5+"``), so they are
+    left untyped rather than rejected at the response boundary.
+    """
+
+    required_years: Any
+    candidate_years: Any
+    alignment_score: float
+    match: bool
+
+
+class EducationMatch(TypedDict, total=False):
+    """
+    Education requirements comparison.
+
+    ``required`` is the job parser's raw output, a string or a list of
+    requirements.
+    """
+
+    required: Any
+    candidate: str
+    match: bool
+    score: float
 
 
 class AnalysisResult(BaseModel):
@@ -46,7 +92,7 @@ class AnalysisResult(BaseModel):
 
     # Cosmos DB metadata (unused in v1, ready for v2)
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=new_id,
         description="Unique analysis identifier",
     )
     partition_key: str = Field(
@@ -59,7 +105,7 @@ class AnalysisResult(BaseModel):
         description="Document type for Cosmos DB",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Analysis creation timestamp",
     )
 
@@ -69,15 +115,15 @@ class AnalysisResult(BaseModel):
         le=100.0,
         description="Overall match score (0-100)",
     )
-    skill_matches: list[SkillMatch] = Field(
+    skill_matches: list[SkillMatchDict] = Field(
         default_factory=list,
         description="Detailed skill matching results",
     )
-    experience_match: dict[str, Any] = Field(
+    experience_match: ExperienceMatch = Field(
         default_factory=dict,
         description="Experience level analysis",
     )
-    education_match: dict[str, Any] = Field(
+    education_match: EducationMatch = Field(
         default_factory=dict,
         description="Education requirements analysis",
     )
@@ -112,48 +158,28 @@ class AnalysisResult(BaseModel):
 
     model_config = {
         "populate_by_name": True,
-        "json_schema_extra": {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "partitionKey": "analysis",
-                "document_type": "cv_analysis",
-                "overall_score": 85.5,
-                "skill_matches": [
-                    {
-                        "skill_name": "Python",
-                        "required": True,
-                        "candidate_has": True,
-                        "proficiency_level": "advanced",
-                        "years_experience": 5.0,
-                        "match_score": 1.0,
-                    }
-                ],
-                "experience_match": {
-                    "required_years": 5,
-                    "candidate_years": 6,
-                    "match": True,
-                },
-                "education_match": {
-                    "required": "Bachelor's in Computer Science",
-                    "candidate": "Master's in Computer Science",
-                    "match": True,
-                },
-                "strengths": [
-                    "Strong Python experience",
-                    "Cloud architecture skills",
-                ],
-                "gaps": ["Kubernetes experience needed"],
-                "recommendations": ["Consider Kubernetes certification"],
-            }
-        },
+        "json_schema_extra": add_example,
     }
 
+    @classmethod
+    def new(cls, **data: Any) -> "AnalysisResult":
+        """
+        Build an analysis result from server-trusted data without validation.
+
+        Uses ``model_construct`` to skip pydantic-core's field validation;
+        only call this with data the application has already produced or
+        validated.
+        """
+        data.setdefault("id", new_id())
+        data.setdefault("created_at", _utcnow())
+        return cls.model_construct(**data)
+
 
 class JobDescription(BaseModel):
     """Job description document - Cosmos DB ready."""
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=new_id,
         description="Unique job description identifier",
     )
     partition_key: str = Field(
@@ -166,7 +192,7 @@ class JobDescription(BaseModel):
         description="Document type for Cosmos DB",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Creation timestamp",
     )
 
@@ -198,12 +224,25 @@ class JobDescription(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    @classmethod
+    def new(cls, **data: Any) -> "JobDescription":
+        """
+        Build a job description from server-trusted data without validation.
+
+        Uses ``model_construct`` to skip pydantic-core's field validation;
+        only call this with data the application has already produced or
+        validated.
+        """
+        data.setdefault("id", new_id())
+        data.setdefault("created_at", _utcnow())
+        return cls.model_construct(**data)
+
 
 class CVDocument(BaseModel):
     """CV document - Cosmos DB ready."""
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=new_id,
         description="Unique CV identifier",
     )
     partition_key: str = Field(
@@ -216,7 +255,7 @@ class CVDocument(BaseModel):
         description="Document type for Cosmos DB",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Creation timestamp",
     )
 
@@ -239,3 +278,16 @@ class CVDocument(BaseModel):
     )
 
     model_config = {"populate_by_name": True}
+
+    @classmethod
+    def new(cls, **data: Any) -> "CVDocument":
+        """
+        Build a CV document from server-trusted data without validation.
+
+        Uses ``model_construct`` to skip pydantic-core's field validation;
+        only call this with data the application has already produced or
+        validated.
+        """
+        data.setdefault("id", new_id())
+        data.setdefault("created_at", _utcnow())
+        return cls.model_construct(**data)
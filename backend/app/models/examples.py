@@ -0,0 +1,250 @@
+"""
+Example payloads for the API and storage models.
+
+These are only needed when a JSON schema is generated (OpenAPI docs), so
+they are built on first use instead of being held on every model class.
+"""
+
+from functools import cache
+from typing import Any
+
+
+def add_example(schema: dict[str, Any], model: type) -> None:
+    """``json_schema_extra`` hook that attaches the model's documented example."""
+    module = model.__module__.rsplit(".", 1)[-1]
+    schema.update(_examples()[module].get(model.__name__, {}))
+
+
+@cache
+def _examples() -> dict[str, dict[str, dict[str, Any]]]:
+    """Build example schema extras, keyed by model module and class name."""
+    return {
+        "domain": {
+            "SkillMatch": {
+                "example": {
+                    "skill_name": "Python",
+                    "required": True,
+                    "candidate_has": True,
+                    "proficiency_level": "advanced",
+                    "years_experience": 5.0,
+                    "match_score": 1.0,
+                }
+            },
+            "AnalysisResult": {
+                "example": {
+                    "id": "550e8400-e29b-41d4-a716-446655440000",
+                    "partitionKey": "analysis",
+                    "document_type": "cv_analysis",
+                    "overall_score": 85.5,
+                    "skill_matches": [
+                        {
+                            "skill_name": "Python",
+                            "required": True,
+                            "candidate_has": True,
+                            "proficiency_level": "advanced",
+                            "years_experience": 5.0,
+                            "match_score": 1.0,
+                        }
+                    ],
+                    "experience_match": {
+                        "required_years": 5,
+                        "candidate_years": 6,
+                        "match": True,
+                    },
+                    "education_match": {
+                        "required": "Bachelor's in Computer Science",
+                        "candidate": "Master's in Computer Science",
+                        "match": True,
+                    },
+                    "strengths": [
+                        "Strong Python experience",
+                        "Cloud architecture skills",
+                    ],
+                    "gaps": ["Kubernetes experience needed"],
+                    "recommendations": ["Consider Kubernetes certification"],
+                }
+            },
+        },
+        "requests": {
+            "AnalyzeRequest": {
+                "example": {
+                    "cv_markdown": "# John Doe\n\n## Experience\n\n**Senior Python Developer** (2019-2024)\n- Built scalable APIs with FastAPI\n- Deployed to Azure\n\n## Skills\n- Python (5 years)\n- FastAPI\n- Azure",
+                    "cv_filename": "john_doe_resume.pdf",
+                    "job_description": "We are seeking a Senior Python Developer with 5+ years of experience in building REST APIs using FastAPI and deploying to cloud platforms like Azure.",
+                    "source_type": "manual",
+                    "source_url": None,
+                }
+            },
+            "ManualJobRequest": {
+                "example": {
+                    "source_type": "manual",
+                    "content": "We are seeking a Senior Python Developer with 5+ years of experience...",
+                }
+            },
+            "LinkedInJobRequest": {
+                "example": {
+                    "source_type": "linkedin_url",
+                    "url": "https://www.linkedin.com/jobs/view/123456789/",
+                }
+            },
+        },
+        "responses": {
+            "AnalyzeResponse": {
+                "example": {
+                    "analysis_id": "550e8400-e29b-41d4-a716-446655440000",
+                    "cv_markdown": "# John Doe\n\n## Experience\nSoftware Engineer at TechCorp...",
+                    "job_description": "We are seeking a Senior Software Engineer with Python expertise...",
+                    "source_type": "manual",
+                    "source_url": None,
+                    "overall_score": 85.5,
+                    "skill_matches": [
+                        {
+                            "skill_name": "Python",
+                            "required": True,
+                            "candidate_has": True,
+                            "proficiency_level": "advanced",
+                            "years_experience": 5.0,
+                            "match_score": 1.0,
+                        }
+                    ],
+                    "experience_match": {
+                        "required_years": 5,
+                        "candidate_years": 6,
+                        "match": True,
+                    },
+                    "education_match": {
+                        "required": "Bachelor's in Computer Science",
+                        "candidate": "Master's in Computer Science",
+                        "match": True,
+                    },
+                    "strengths": [
+                        "Strong Python expertise with 6 years experience",
+                        "Advanced cloud architecture skills",
+                        "Excellent leadership experience",
+                    ],
+                    "gaps": [
+                        "Limited Kubernetes experience",
+                        "No mention of GraphQL",
+                    ],
+                    "recommendations": [
+                        "Consider Kubernetes certification to strengthen DevOps profile",
+                        "Add GraphQL projects to portfolio",
+                        "Highlight any microservices experience more prominently",
+                    ],
+                }
+            },
+            "ErrorResponse": {
+                "example": {
+                    "error": "ValidationError",
+                    "message": "Request validation failed",
+                    "details": {
+                        "field": "cv_markdown",
+                        "issue": "Content too short",
+                    },
+                }
+            },
+            "HealthCheckResponse": {
+                "example": {
+                    "status": "healthy",
+                    "version": "1.0.0",
+                    "service": "cv-checker-api",
+                    "azure_openai": "connected",
+                    "cosmos_db": "connected",
+                }
+            },
+            "JobSubmissionResponse": {
+                "examples": [
+                    {
+                        "job_id": "550e8400-e29b-41d4-a716-446655440001",
+                        "content": "We are seeking a Senior Python Developer...",
+                        "source_type": "manual",
+                        "source_url": None,
+                        "fetch_status": "not_applicable",
+                        "character_count": 1543,
+                    },
+                    {
+                        "job_id": "550e8400-e29b-41d4-a716-446655440002",
+                        "content": "About the job\n\nWe are looking for a talented...",
+                        "source_type": "linkedin_url",
+                        "source_url": "https://www.linkedin.com/jobs/view/123456789/",
+                        "fetch_status": "success",
+                        "character_count": 2341,
+                    },
+                ]
+            },
+            "JobSubmissionErrorResponse": {
+                "example": {
+                    "success": False,
+                    "error": "scraping_failed",
+                    "message": "Failed to fetch job description. Please try manual input.",
+                    "details": "Request timeout after 15 seconds",
+                    "fallback": "manual_input",
+                }
+            },
+        },
+        "cosmos_models": {
+            "BaseCosmosDocument": {
+                "example": {
+                    "id": "cv-550e8400-e29b-41d4-a716-446655440000",
+                    "userId": "user-abc123def456",
+                    "type": "cv",
+                    "createdAt": "2026-01-01T12:00:00Z",
+                    "updatedAt": "2026-01-01T12:00:00Z",
+                }
+            },
+            "CVDocument": {
+                "example": {
+                    "id": "cv-550e8400-e29b-41d4-a716-446655440000",
+                    "userId": "user-abc123def456",
+                    "type": "cv",
+                    "filename": "john_doe_resume.pdf",
+                    "content": "# John Doe\n\n## Experience\n...",
+                    "characterCount": 1543,
+                    "createdAt": "2026-01-01T12:00:00Z",
+                    "updatedAt": "2026-01-01T12:00:00Z",
+                }
+            },
+            "JobDocument": {
+                "example": {
+                    "id": "job-550e8400-e29b-41d4-a716-446655440001",
+                    "userId": "user-abc123def456",
+                    "type": "job",
+                    "title": "Senior Python Developer",
+                    "content": "Senior Python Developer needed...",
+                    "sourceType": "linkedin_url",
+                    "sourceUrl": "https://www.linkedin.com/jobs/view/123456789/",
+                    "characterCount": 2341,
+                    "createdAt": "2026-01-01T12:00:00Z",
+                    "updatedAt": "2026-01-01T12:00:00Z",
+                }
+            },
+            "AnalysisDocument": {
+                "example": {
+                    "id": "analysis-550e8400-e29b-41d4-a716-446655440002",
+                    "userId": "user-abc123def456",
+                    "type": "analysis",
+                    "cvId": "cv-550e8400-e29b-41d4-a716-446655440000",
+                    "jobId": "job-550e8400-e29b-41d4-a716-446655440001",
+                    "overallScore": 85.5,
+                    "skillMatches": [],
+                    "experienceMatch": {},
+                    "educationMatch": {},
+                    "strengths": ["Strong Python expertise"],
+                    "gaps": ["Limited Kubernetes experience"],
+                    "recommendations": ["Consider Kubernetes certification"],
+                    "createdAt": "2026-01-01T12:00:00Z",
+                    "updatedAt": "2026-01-01T12:00:00Z",
+                }
+            },
+            "AnalysisSummary": {
+                "example": {
+                    "id": "analysis-550e8400-e29b-41d4-a716-446655440002",
+                    "cvId": "cv-550e8400-e29b-41d4-a716-446655440000",
+                    "jobId": "job-550e8400-e29b-41d4-a716-446655440001",
+                    "sourceType": "linkedin_url",
+                    "overallScore": 85.5,
+                    "createdAt": "2026-01-01T12:00:00Z",
+                }
+            },
+        },
+    }
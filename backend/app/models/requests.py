@@ -1,8 +1,23 @@
 """API request models."""
 
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from app.models.examples import add_example
+
+
+def _strip_checked(value: str, message: str, min_length: int = 1) -> str:
+    """
+    Strip surrounding whitespace and enforce a minimum stripped length.
+
+    Shared by the request validators below; ``message`` may reference the
+    stripped length as ``{length}``.
+    """
+    stripped = value.strip()
+    if len(stripped) < min_length:
+        raise ValueError(message.format(length=len(stripped)))
+    return stripped
 
 
 class AnalyzeRequest(BaseModel):
@@ -39,84 +54,68 @@ class AnalyzeRequest(BaseModel):
     @classmethod
     def validate_not_empty(cls, v: str) -> str:
         """Validate that content is not empty or whitespace only."""
-        if not v.strip():
-            raise ValueError("Content cannot be empty or whitespace only")
-        return v.strip()
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "cv_markdown": "# John Doe\n\n## Experience\n\n**Senior Python Developer** (2019-2024)\n- Built scalable APIs with FastAPI\n- Deployed to Azure\n\n## Skills\n- Python (5 years)\n- FastAPI\n- Azure",
-                "cv_filename": "john_doe_resume.pdf",
-                "job_description": "We are seeking a Senior Python Developer with 5+ years of experience in building REST APIs using FastAPI and deploying to cloud platforms like Azure.",
-                "source_type": "manual",
-                "source_url": None,
-            }
-        }
-    }
-
-
-class JobSubmissionRequest(BaseModel):
-    """Request model for job submission (manual or LinkedIn URL)."""
-
-    source_type: Literal["manual", "linkedin_url"] = Field(
+        return _strip_checked(v, "Content cannot be empty or whitespace only")
+
+    model_config = {"json_schema_extra": add_example}
+
+
+class ManualJobRequest(BaseModel):
+    """Job submission with pasted job description text."""
+
+    source_type: Literal["manual"] = Field(
         ...,
-        description="Source type: 'manual' for pasted text, 'linkedin_url' for URL scraping",
+        description="Source type: 'manual' for pasted text",
     )
-    content: Optional[str] = Field(
-        default=None,
+    content: str = Field(
+        ...,
         max_length=50000,
-        description="Job description text (required for manual source type)",
-    )
-    url: Optional[str] = Field(
-        default=None,
-        max_length=500,
-        description="LinkedIn job posting URL (required for linkedin_url source type)",
+        description="Job description text",
     )
 
     @field_validator("content")
     @classmethod
-    def validate_manual_content(cls, v: Optional[str], info) -> Optional[str]:
-        """Validate manual content if source_type is manual."""
-        # Access source_type from validation context
-        data = info.data
-        source_type = data.get("source_type")
-        
-        if source_type == "manual":
-            if not v:
-                raise ValueError("Content is required for manual source type")
-            if len(v.strip()) < 50:
-                raise ValueError(
-                    f"Job description is too short (minimum 50 characters required). "
-                    f"Received {len(v.strip())} characters."
-                )
-        
-        return v.strip() if v else None
+    def validate_manual_content(cls, v: str) -> str:
+        """Validate manual content meets the minimum length."""
+        return _strip_checked(
+            v,
+            "Job description is too short (minimum 50 characters required). "
+            "Received {length} characters.",
+            min_length=50,
+        )
+
+    model_config = {"json_schema_extra": add_example}
+
+
+class LinkedInJobRequest(BaseModel):
+    """Job submission with a LinkedIn job posting URL to scrape."""
+
+    source_type: Literal["linkedin_url"] = Field(
+        ...,
+        description="Source type: 'linkedin_url' for URL scraping",
+    )
+    url: str = Field(
+        ...,
+        max_length=500,
+        description="LinkedIn job posting URL",
+    )
 
     @field_validator("url")
     @classmethod
-    def validate_linkedin_url_field(cls, v: Optional[str], info) -> Optional[str]:
-        """Validate URL field if source_type is linkedin_url."""
-        data = info.data
-        source_type = data.get("source_type")
-        
-        if source_type == "linkedin_url":
-            if not v:
-                raise ValueError("URL is required for linkedin_url source type")
-        
-        return v.strip() if v else None
-
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "source_type": "manual",
-                    "content": "We are seeking a Senior Python Developer with 5+ years of experience...",
-                },
-                {
-                    "source_type": "linkedin_url",
-                    "url": "https://www.linkedin.com/jobs/view/123456789/",
-                },
-            ]
-        }
-    }
+    def validate_linkedin_url_field(cls, v: str) -> str:
+        """Validate URL field is not empty."""
+        return _strip_checked(v, "URL is required for linkedin_url source type")
+
+    model_config = {"json_schema_extra": add_example}
+
+
+# Tagged union: Pydantic dispatches on ``source_type`` directly instead of
+# trying each variant in turn.
+JobSubmissionRequest = Annotated[
+    Union[ManualJobRequest, LinkedInJobRequest],
+    Field(discriminator="source_type"),
+]
+
+
+# Shared validators, built once at import time and reused by the API routes.
+ANALYZE_REQUEST_ADAPTER: TypeAdapter[AnalyzeRequest] = TypeAdapter(AnalyzeRequest)
+JOB_SUBMISSION_ADAPTER: TypeAdapter[JobSubmissionRequest] = TypeAdapter(JobSubmissionRequest)
@@ -4,6 +4,9 @@ from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.models.domain import EducationMatch, ExperienceMatch, SkillMatchDict
+from app.models.examples import add_example
+
 
 class SkillMatchResponse(BaseModel):
     """Individual skill match in API response."""
@@ -32,7 +35,9 @@ class AnalyzeResponse(BaseModel):
     analysis_id: str = Field(description="Unique analysis identifier")
     cv_markdown: str = Field(description="Full CV content in Markdown format")
     job_description: str = Field(description="Full job description text")
-    source_type: str = Field(description="Job source type: manual or linkedin_url")
+    source_type: Literal["manual", "linkedin_url"] = Field(
+        description="Job source type: manual or linkedin_url"
+    )
     source_url: Optional[str] = Field(
         default=None,
         description="LinkedIn URL if job was scraped"
@@ -42,61 +47,16 @@ class AnalyzeResponse(BaseModel):
         le=100.0,
         description="Overall match score (0-100)",
     )
-    skill_matches: list[SkillMatchResponse] = Field(
+    skill_matches: list[SkillMatchDict] = Field(
         description="Detailed skill matching results"
     )
-    experience_match: dict[str, Any] = Field(description="Experience level analysis")
-    education_match: dict[str, Any] = Field(description="Education requirements analysis")
+    experience_match: ExperienceMatch = Field(description="Experience level analysis")
+    education_match: EducationMatch = Field(description="Education requirements analysis")
     strengths: list[str] = Field(description="Candidate strengths for this role")
     gaps: list[str] = Field(description="Identified skill/experience gaps")
     recommendations: list[str] = Field(description="Actionable recommendations")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "analysis_id": "550e8400-e29b-41d4-a716-446655440000",
-                "cv_markdown": "# John Doe\n\n## Experience\nSoftware Engineer at TechCorp...",
-                "job_description": "We are seeking a Senior Software Engineer with Python expertise...",
-                "source_type": "manual",
-                "source_url": None,
-                "overall_score": 85.5,
-                "skill_matches": [
-                    {
-                        "skill_name": "Python",
-                        "required": True,
-                        "candidate_has": True,
-                        "proficiency_level": "advanced",
-                        "years_experience": 5.0,
-                        "match_score": 1.0,
-                    }
-                ],
-                "experience_match": {
-                    "required_years": 5,
-                    "candidate_years": 6,
-                    "match": True,
-                },
-                "education_match": {
-                    "required": "Bachelor's in Computer Science",
-                    "candidate": "Master's in Computer Science",
-                    "match": True,
-                },
-                "strengths": [
-                    "Strong Python expertise with 6 years experience",
-                    "Advanced cloud architecture skills",
-                    "Excellent leadership experience",
-                ],
-                "gaps": [
-                    "Limited Kubernetes experience",
-                    "No mention of GraphQL",
-                ],
-                "recommendations": [
-                    "Consider Kubernetes certification to strengthen DevOps profile",
-                    "Add GraphQL projects to portfolio",
-                    "Highlight any microservices experience more prominently",
-                ],
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
 
 
 class ErrorResponse(BaseModel):
@@ -109,24 +69,13 @@ class ErrorResponse(BaseModel):
         description="Additional error context",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "error": "ValidationError",
-                "message": "Request validation failed",
-                "details": {
-                    "field": "cv_markdown",
-                    "issue": "Content too short",
-                },
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
 
 
 class HealthCheckResponse(BaseModel):
     """Health check response."""
 
-    status: str = Field(description="Service status")
+    status: Literal["healthy", "degraded", "unhealthy"] = Field(description="Service status")
     version: str = Field(description="API version")
     service: str = Field(description="Service name")
     azure_openai: Optional[str] = Field(
@@ -138,17 +87,7 @@ class HealthCheckResponse(BaseModel):
         description="Cosmos DB connection status",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "healthy",
-                "version": "1.0.0",
-                "service": "cv-checker-api",
-                "azure_openai": "connected",
-                "cosmos_db": "connected",
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
 
 
 class JobSubmissionResponse(BaseModel):
@@ -168,28 +107,7 @@ class JobSubmissionResponse(BaseModel):
     )
     character_count: int = Field(description="Character count of the content")
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "job_id": "550e8400-e29b-41d4-a716-446655440001",
-                    "content": "We are seeking a Senior Python Developer...",
-                    "source_type": "manual",
-                    "source_url": None,
-                    "fetch_status": "not_applicable",
-                    "character_count": 1543,
-                },
-                {
-                    "job_id": "550e8400-e29b-41d4-a716-446655440002",
-                    "content": "About the job\n\nWe are looking for a talented...",
-                    "source_type": "linkedin_url",
-                    "source_url": "https://www.linkedin.com/jobs/view/123456789/",
-                    "fetch_status": "success",
-                    "character_count": 2341,
-                },
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
 
 
 class JobSubmissionErrorResponse(BaseModel):
@@ -204,14 +122,4 @@ class JobSubmissionErrorResponse(BaseModel):
         description="Suggested fallback method",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": False,
-                "error": "scraping_failed",
-                "message": "Failed to fetch job description. Please try manual input.",
-                "details": "Request timeout after 15 seconds",
-                "fallback": "manual_input",
-            }
-        }
-    }
+    model_config = {"json_schema_extra": add_example}
@@ -1,13 +1,25 @@
 """Repositories package initialization."""
 
-from app.repositories.analysis import (
-    AnalysisRepository,
-    CosmosDBAnalysisRepository,
-    InMemoryAnalysisRepository,
-)
+from typing import Any
+
+from app.repositories.analysis import AnalysisRepository, InMemoryAnalysisRepository
 
 __all__ = [
     "AnalysisRepository",
     "InMemoryAnalysisRepository",
     "CosmosDBAnalysisRepository",
+    "CosmosDBRepository",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import Cosmos-backed repositories so azure-cosmos loads only on use."""
+    if name == "CosmosDBAnalysisRepository":
+        from app.repositories.analysis import CosmosDBAnalysisRepository
+
+        return CosmosDBAnalysisRepository
+    if name == "CosmosDBRepository":
+        from app.repositories.cosmos_repository import CosmosDBRepository
+
+        return CosmosDBRepository
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 """Repository pattern for analysis results."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import Any, Optional
 
 from app.models.domain import AnalysisResult
@@ -10,25 +12,59 @@ class AnalysisRepository(ABC):
     """Abstract repository for analysis results."""
 
     @abstractmethod
-    async def save(self, analysis: AnalysisResult) -> str:
+    async def save(self, analysis_id: str, data: Mapping[str, Any]) -> str:
         """
         Save analysis result.
 
+        Takes the result as a plain mapping (``AnalysisResult`` field names)
+        so callers need not build and re-serialize a model just to persist it.
+
         Args:
-            analysis: AnalysisResult to save
+            analysis_id: Unique analysis identifier
+            data: Analysis result fields
 
         Returns:
             Document ID
         """
         pass
 
+    async def save_many(
+        self, analyses: Sequence[AnalysisResult], batch_size: int = 32
+    ) -> list[str]:
+        """
+        Save several analysis results.
+
+        Writes are issued concurrently, ``batch_size`` at a time, so
+        implementations backed by a remote store overlap their round trips.
+
+        Args:
+            analyses: AnalysisResults to save
+            batch_size: Maximum number of concurrent writes
+
+        Returns:
+            Document IDs, in input order
+        """
+        ids: list[str] = []
+        for start in range(0, len(analyses), batch_size):
+            batch = analyses[start : start + batch_size]
+            ids.extend(
+                await asyncio.gather(
+                    *(self.save(analysis.id, vars(analysis)) for analysis in batch)
+                )
+            )
+        return ids
+
     @abstractmethod
-    async def get_by_id(self, analysis_id: str) -> Optional[AnalysisResult]:
+    async def get_by_id(self, analysis_id: str, user_id: str) -> Optional[AnalysisResult]:
         """
         Retrieve analysis by ID.
 
+        The owning user ID is required so partitioned stores can serve the
+        lookup as a point read instead of a cross-partition query.
+
         Args:
             analysis_id: Unique analysis identifier
+            user_id: Owning user ID (partition key)
 
         Returns:
             AnalysisResult if found, None otherwise
@@ -52,7 +88,7 @@ class AnalysisRepository(ABC):
 class InMemoryAnalysisRepository(AnalysisRepository):
     """V1 implementation: No persistence, returns immediately."""
 
-    async def save(self, analysis: AnalysisResult) -> str:
+    async def save(self, analysis_id: str, data: Mapping[str, Any]) -> str:
         """
         No-op save - returns ID without persisting.
 
@@ -60,19 +96,36 @@ class InMemoryAnalysisRepository(AnalysisRepository):
         the service layer to work unchanged when we add Cosmos DB in v2+.
 
         Args:
-            analysis: AnalysisResult to save
+            analysis_id: Unique analysis identifier
+            data: Analysis result fields (ignored)
 
         Returns:
             Analysis ID
         """
-        return analysis.id
+        return analysis_id
+
+    async def save_many(
+        self, analyses: Sequence[AnalysisResult], batch_size: int = 32
+    ) -> list[str]:
+        """
+        No-op batch save - returns IDs without persisting.
+
+        Args:
+            analyses: AnalysisResults to save
+            batch_size: Unused in v1
+
+        Returns:
+            Analysis IDs
+        """
+        return [analysis.id for analysis in analyses]
 
-    async def get_by_id(self, analysis_id: str) -> Optional[AnalysisResult]:
+    async def get_by_id(self, analysis_id: str, user_id: str) -> Optional[AnalysisResult]:
         """
         Always returns None in v1.
 
         Args:
             analysis_id: Unique analysis identifier
+            user_id: Owning user ID (ignored)
 
         Returns:
             None (no persistence in v1)
@@ -112,11 +165,11 @@ class CosmosDBAnalysisRepository(AnalysisRepository):
         """
         raise NotImplementedError("Cosmos DB support will be added in v2+")
 
-    async def save(self, analysis: AnalysisResult) -> str:
+    async def save(self, analysis_id: str, data: Mapping[str, Any]) -> str:
         """Save to Cosmos DB with partition key."""
         raise NotImplementedError("Cosmos DB support will be added in v2+")
 
-    async def get_by_id(self, analysis_id: str) -> Optional[AnalysisResult]:
+    async def get_by_id(self, analysis_id: str, user_id: str) -> Optional[AnalysisResult]:
         """Retrieve from Cosmos DB."""
         raise NotImplementedError("Cosmos DB support will be added in v2+")
 
@@ -1,45 +1,202 @@
 """Cosmos DB repository implementation."""
 
+import asyncio
+import base64
 import logging
-import uuid
+import re
+import zlib
+from collections.abc import Mapping, Sequence
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from azure.cosmos import ContainerProxy, CosmosClient, exceptions
-from azure.identity import DefaultAzureCredential
+import aiohttp
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.cosmos import exceptions
+from azure.cosmos.aio import ContainerProxy, CosmosClient
+from azure.cosmos.http_constants import StatusCodes
+from pydantic import TypeAdapter
 
 from app.config import Settings
-from app.models.cosmos_models import AnalysisDocument, CVDocument, JobDocument
+from app.models.cosmos_models import AnalysisDocument, AnalysisSummary, CVDocument, JobDocument
+from app.models.domain import new_id
 from app.repositories.analysis import AnalysisRepository, AnalysisResult
+from app.utils.credential import get_credential
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of query results in one pass
+_ANALYSIS_LIST_ADAPTER = TypeAdapter(list[AnalysisDocument])
+_ANALYSIS_SUMMARY_LIST_ADAPTER = TypeAdapter(list[AnalysisSummary])
+
+# Partition used for analyses saved without a user (v1 doesn't have auth yet)
+_ANONYMOUS_USER_ID = "anonymous"
+
+# First non-blank line of a job description (used as its title)
+_FIRST_LINE_RE = re.compile(r"\S[^\n]*")
+
+# Stored encoding of an analysis document's CV and job text. Texts shorter
+# than the threshold are kept plain, as base64 would outweigh the savings.
+_TEXT_ENCODING = "zlib+b64"
+_COMPRESS_MIN_CHARS = 1024
+
+# Cosmos DB limit on operations in a single transactional batch
+_MAX_BATCH_OPERATIONS = 100
+
+# Container indexing policy (applied by scripts/init_cosmos.py). The composite
+# index matches the list_analyses/list_analyses_summary filter and ORDER BY
+# exactly; the large text fields are never queried, so they are not indexed.
+ANALYSIS_INDEXING_POLICY: dict[str, Any] = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    "includedPaths": [{"path": "/*"}],
+    "excludedPaths": [
+        {"path": "/cvMarkdown/?"},
+        {"path": "/jobDescription/?"},
+        {"path": "/content/?"},
+        {"path": '/"_etag"/?'},
+    ],
+    "compositeIndexes": [
+        [
+            {"path": "/userId", "order": "ascending"},
+            {"path": "/type", "order": "ascending"},
+            {"path": "/createdAt", "order": "descending"},
+        ]
+    ],
+}
+
+
+# Throughput bucket for list queries. Configure the bucket on the container
+# with a capped share of its RU/s (e.g. 40%) so bursts of list traffic cannot
+# starve writes, which are left unbucketed and may use the full throughput.
+LIST_THROUGHPUT_BUCKET = 1
+
+
+# HTTP connection pool for the shared Cosmos client, sized for concurrent
+# requests; the SDK's default aiohttp session caps at 100 connections overall
+_POOL_CONNECTION_LIMIT = 200
+_POOL_CONNECTIONS_PER_HOST = 100
+_POOL_KEEPALIVE_SECONDS = 75
+
+
+class _PooledAioHttpTransport(AioHttpTransport):
+    """aiohttp transport whose session uses a tuned, keep-alive connection pool."""
+
+    async def open(self) -> None:
+        """Create the pooled session on first use (aiohttp needs a running loop)."""
+        if self.session is None and self._session_owner:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_POOL_CONNECTION_LIMIT,
+                    limit_per_host=_POOL_CONNECTIONS_PER_HOST,
+                    keepalive_timeout=_POOL_KEEPALIVE_SECONDS,
+                ),
+                trust_env=True,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False,
+            )
+        await super().open()
+
+
+def _compress_text(text: str) -> str:
+    """Compress text for storage as a JSON string."""
+    return base64.b64encode(zlib.compress(text.encode(), 6)).decode("ascii")
+
+
+def _decompress_text(text: str) -> str:
+    """Inverse of _compress_text."""
+    return zlib.decompress(base64.b64decode(text)).decode()
+
+
+def _decode_analysis_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Return a stored analysis item with its CV and job text decompressed."""
+    if item.get("contentEncoding") != _TEXT_ENCODING:
+        return item
+    return {
+        **item,
+        "cvMarkdown": _decompress_text(item["cvMarkdown"]),
+        "jobDescription": _decompress_text(item["jobDescription"]),
+        "contentEncoding": None,
+    }
+
+
+async def _no_document() -> None:
+    """Stand-in for a skipped read in get_analysis_bundle."""
+    return None
+
+
+def create_cosmos_client(settings: Settings) -> CosmosClient:
+    """
+    Create the async Cosmos client.
+    
+    Meant to be called once per process (at application startup) and shared:
+    the client's pooled transport keeps connections alive across requests.
+    Azure AD authentication goes through the process-wide credential (see
+    ``get_credential``), whose token cache is shared with Azure OpenAI.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        Async Cosmos client
+    """
+    connection_str = settings.cosmos_connection_string
+    client_options: dict[str, Any] = {
+        "transport": _PooledAioHttpTransport(connection_timeout=5, read_timeout=30),
+        # Writes only need the locally generated ID, not the echoed document
+        "no_response_on_write": True,
+    }
+    if "AccountKey=" in connection_str:
+        # Using connection string with account key
+        client = CosmosClient.from_connection_string(connection_str, **client_options)
+    else:
+        # Using Azure AD authentication
+        client = CosmosClient(connection_str, get_credential(), **client_options)
+
+    logger.info("Cosmos DB client created")
+    return client
+
 
 class CosmosDBRepository(AnalysisRepository):
     """
     Cosmos DB implementation of the analysis repository.
     
     Stores CVs, jobs, and analysis results in a single Cosmos DB container
-    partitioned by userId.
+    partitioned by userId. Every read takes the userId so it can be served
+    as a ``read_item`` point read rather than a cross-partition query.
     """
 
-    def __init__(self, container: ContainerProxy):
+    def __init__(
+        self,
+        container: ContainerProxy,
+        client: Optional[CosmosClient] = None,
+    ):
         """
         Initialize the Cosmos DB repository.
         
         Args:
-            container: Cosmos DB container proxy
+            container: Async Cosmos DB container proxy
+            client: Cosmos client owned by this repository, closed by close()
         """
         self.container = container
+        self._client = client
         logger.info("CosmosDBRepository initialized")
 
     @classmethod
-    def create_from_settings(cls, settings: Settings) -> "CosmosDBRepository":
+    def create_from_settings(
+        cls,
+        settings: Settings,
+        client: Optional[CosmosClient] = None,
+    ) -> "CosmosDBRepository":
         """
         Factory method to create repository from settings.
         
+        Pass the application-wide ``client`` (see ``create_cosmos_client``)
+        to only bind the container; the caller then owns closing it. Without
+        one, a client is created and owned (closed) by the repository.
+        
         Args:
             settings: Application settings
+            client: Shared async Cosmos client (optional)
             
         Returns:
             CosmosDBRepository instance
@@ -50,30 +207,45 @@ class CosmosDBRepository(AnalysisRepository):
         if not settings.is_cosmos_enabled:
             raise ValueError("Cosmos DB is not configured")
 
-        # Create Cosmos client with appropriate authentication
-        connection_str = settings.cosmos_connection_string
-        if "AccountKey=" in connection_str:
-            # Using connection string with account key
-            client = CosmosClient.from_connection_string(connection_str)
-        else:
-            # Using Azure AD authentication
-            credential = DefaultAzureCredential()
-            client = CosmosClient(connection_str, credential)
+        owned_client = None
+        if client is None:
+            client = owned_client = create_cosmos_client(settings)
 
         # Get database and container
         database = client.get_database_client(settings.cosmos_database_name)
         container = database.get_container_client(settings.cosmos_container_name)
 
         logger.info(
-            f"Cosmos DB client created: database={settings.cosmos_database_name}, "
-            f"container={settings.cosmos_container_name}"
+            "Cosmos DB container bound: database=%s, container=%s",
+            settings.cosmos_database_name,
+            settings.cosmos_container_name,
         )
 
-        return cls(container)
+        return cls(container, client=owned_client)
+
+    async def warm_up(self) -> None:
+        """
+        Read the container's metadata ahead of the first request.
+        
+        The first call through a new client discovers the account's endpoints
+        and the container's partition key definition; doing it at startup
+        keeps that latency off the first user request. Failures are logged
+        and left for the first real request to surface.
+        """
+        try:
+            await self.container.read()
+            logger.info("Cosmos DB container metadata loaded")
+        except exceptions.CosmosHttpResponseError as e:
+            logger.warning("Cosmos DB warm-up failed: %s", e)
+
+    async def close(self) -> None:
+        """Close the Cosmos client owned by this repository, if any."""
+        if self._client is not None:
+            await self._client.close()
 
     def _generate_id(self, prefix: str) -> str:
         """Generate a unique document ID with prefix."""
-        return f"{prefix}-{uuid.uuid4()}"
+        return f"{prefix}-{new_id()}"
 
     async def create_cv(self, user_id: str, content: str, filename: str = "resume.pdf") -> str:
         """
@@ -87,20 +259,14 @@ class CosmosDBRepository(AnalysisRepository):
         Returns:
             CV document ID
         """
-        cv_doc = CVDocument(
-            id=self._generate_id("cv"),
-            userId=user_id,
-            filename=filename,
-            content=content,
-            characterCount=len(content),
-        )
+        cv_doc = self._build_cv_document(user_id, content, filename)
 
         try:
-            self.container.create_item(body=cv_doc.model_dump(mode="json"))
-            logger.info(f"Created CV document: {cv_doc.id} for user: {user_id}")
+            await self.container.create_item(body=cv_doc.model_dump(mode="json"))
+            logger.info("Created CV document: %s for user: %s", cv_doc.id, user_id)
             return cv_doc.id
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to create CV document: {e}")
+            logger.error("Failed to create CV document: %s", e)
             raise
 
     async def create_job(
@@ -119,26 +285,14 @@ class CosmosDBRepository(AnalysisRepository):
         Returns:
             Job document ID
         """
-        # Extract title if not provided
-        if not title:
-            title = self._extract_job_title(content, source_url)
-        
-        job_doc = JobDocument(
-            id=self._generate_id("job"),
-            userId=user_id,
-            title=title,
-            content=content,
-            sourceType=source_type,
-            sourceUrl=source_url,
-            characterCount=len(content),
-        )
+        job_doc = self._build_job_document(user_id, content, source_type, source_url, title)
 
         try:
-            self.container.create_item(body=job_doc.model_dump(mode="json"))
-            logger.info(f"Created job document: {job_doc.id} for user: {user_id}")
+            await self.container.create_item(body=job_doc.model_dump(mode="json"))
+            logger.info("Created job document: %s for user: %s", job_doc.id, user_id)
             return job_doc.id
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to create job document: {e}")
+            logger.error("Failed to create job document: %s", e)
             raise
 
     def _extract_job_title(self, content: str, source_url: Optional[str] = None) -> str:
@@ -157,10 +311,10 @@ class CosmosDBRepository(AnalysisRepository):
             return f"LinkedIn Job ({source_url.split('/')[-2] if '/' in source_url else 'Unknown'})"
         
         # Try to extract first line as title
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
-        if lines:
+        match = _FIRST_LINE_RE.search(content)
+        if match:
             # First non-empty line is likely the title
-            first_line = lines[0]
+            first_line = match.group().strip()
             # Remove markdown formatting
             title = first_line.strip('#').strip('*').strip()
             # Limit length
@@ -170,45 +324,100 @@ class CosmosDBRepository(AnalysisRepository):
         
         return "Job Description"
 
-    async def save(self, result: AnalysisResult) -> str:
+    async def save(self, analysis_id: str, data: Mapping[str, Any]) -> str:
         """
         Save analysis result to Cosmos DB.
         
-        This method is called by the CVCheckerService after analysis completes.
-        It stores the analysis result with a default user ID (anonymous).
+        Stores the analysis result with a default user ID (anonymous).
         
         Args:
-            result: Analysis result to save
+            analysis_id: Analysis ID to store the document under
+            data: Analysis result fields (``AnalysisResult`` field names)
             
         Returns:
             Analysis document ID
         """
-        # Use default user ID for anonymous analyses (v1 doesn't have auth yet)
-        user_id = "anonymous"
-        
-        # Store the analysis result
-        analysis_doc = AnalysisDocument(
-            id=result.id,  # Use the existing analysis ID
-            userId=user_id,
-            cvId="",  # Will be set when we add full document storage
-            jobId="",  # Will be set when we add full document storage
-            overallScore=result.overall_score,
-            skillMatches=[match.model_dump() for match in result.skill_matches],
-            experienceMatch=result.experience_match,
-            educationMatch=result.education_match,
-            strengths=result.strengths,
-            gaps=result.gaps,
-            recommendations=result.recommendations,
-        )
+        analysis_doc = self._build_saved_analysis_document(analysis_id, data)
 
         try:
-            self.container.create_item(body=analysis_doc.model_dump(mode="json"))
-            logger.info(f"Created analysis document: {analysis_doc.id} for user: {user_id}")
+            await self.container.create_item(body=analysis_doc.model_dump(mode="json"))
+            logger.info(
+                "Created analysis document: %s for user: %s",
+                analysis_doc.id,
+                analysis_doc.userId,
+            )
             return analysis_doc.id
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to create analysis document: {e}")
+            logger.error("Failed to create analysis document: %s", e)
             raise
 
+    async def save_many(
+        self, analyses: Sequence[AnalysisResult], batch_size: int = 32
+    ) -> list[str]:
+        """
+        Save several analysis results to Cosmos DB.
+        
+        All saved analyses share the anonymous partition, so they are grouped
+        into transactional batches of up to ``batch_size`` creates (capped at
+        the service limit of 100) and the batches are sent concurrently.
+        
+        Args:
+            analyses: AnalysisResults to save
+            batch_size: Maximum number of documents per batch request
+            
+        Returns:
+            Analysis document IDs, in input order
+        """
+        # Read field values straight off the validated models; the only
+        # serialization pass is the single model_dump of each document below
+        docs = [
+            self._build_saved_analysis_document(analysis.id, vars(analysis))
+            for analysis in analyses
+        ]
+        size = max(1, min(batch_size, _MAX_BATCH_OPERATIONS))
+
+        try:
+            await asyncio.gather(
+                *(
+                    self.container.execute_item_batch(
+                        batch_operations=[
+                            ("create", (doc.model_dump(mode="json"),))
+                            for doc in docs[start : start + size]
+                        ],
+                        partition_key=_ANONYMOUS_USER_ID,
+                    )
+                    for start in range(0, len(docs), size)
+                )
+            )
+            logger.info(
+                "Created %d analysis documents for user: %s", len(docs), _ANONYMOUS_USER_ID
+            )
+            return [doc.id for doc in docs]
+        except exceptions.CosmosHttpResponseError as e:
+            logger.error("Failed to create analysis documents: %s", e)
+            raise
+
+    def _build_saved_analysis_document(
+        self, analysis_id: str, data: Mapping[str, Any]
+    ) -> AnalysisDocument:
+        """Build the analysis document stored by save() and save_many()."""
+        return AnalysisDocument(
+            id=analysis_id,
+            # Use default user ID for anonymous analyses (v1 doesn't have auth yet)
+            userId=_ANONYMOUS_USER_ID,
+            cvId="",  # Will be set when we add full document storage
+            jobId="",  # Will be set when we add full document storage
+            cvMarkdown="",  # Content is stored via create_analysis/create_analysis_bundle
+            jobDescription="",  # Content is stored via create_analysis/create_analysis_bundle
+            overallScore=data["overall_score"],
+            skillMatches=data.get("skill_matches", []),
+            experienceMatch=data.get("experience_match", {}),
+            educationMatch=data.get("education_match", {}),
+            strengths=data.get("strengths", []),
+            gaps=data.get("gaps", []),
+            recommendations=data.get("recommendations", []),
+        )
+
     async def create_analysis(
         self,
         user_id: str,
@@ -236,17 +445,169 @@ class CosmosDBRepository(AnalysisRepository):
         Returns:
             Analysis document ID
         """
-        analysis_doc = AnalysisDocument(
+        analysis_doc = self._build_analysis_document(
+            user_id, cv_markdown, job_description, source_type, source_url, result, cv_id, job_id
+        )
+
+        try:
+            await self.container.create_item(body=analysis_doc.model_dump(mode="json"))
+            logger.info("Created analysis document: %s for user: %s", analysis_doc.id, user_id)
+            return analysis_doc.id
+        except exceptions.CosmosHttpResponseError as e:
+            logger.error("Failed to create analysis document: %s", e)
+            raise
+
+    async def create_analysis_bundle(
+        self,
+        user_id: str,
+        cv_markdown: str,
+        job_description: str,
+        source_type: str,
+        source_url: Optional[str],
+        result: AnalysisResult,
+        filename: str = "resume.pdf",
+    ) -> tuple[str, str, str]:
+        """
+        Create the CV, job, and analysis documents in one transactional batch.
+        
+        All three documents share the userId partition, so they are written
+        in a single round trip and either all succeed or none are stored.
+        Documents too large for a batch request are written individually
+        instead, with the independent CV and job inserts issued concurrently.
+        
+        Args:
+            user_id: User ID (partition key)
+            cv_markdown: Full CV content in Markdown
+            job_description: Full job description text
+            source_type: Job source type (manual or linkedin_url)
+            source_url: LinkedIn URL if applicable
+            result: Analysis result
+            filename: Original CV filename
+            
+        Returns:
+            Tuple of (CV document ID, job document ID, analysis document ID)
+        """
+        cv_doc = self._build_cv_document(user_id, cv_markdown, filename)
+        job_doc = self._build_job_document(user_id, job_description, source_type, source_url)
+        analysis_doc = self._build_analysis_document(
+            user_id,
+            cv_markdown,
+            job_description,
+            source_type,
+            source_url,
+            result,
+            cv_doc.id,
+            job_doc.id,
+        )
+
+        try:
+            await self.container.execute_item_batch(
+                batch_operations=[
+                    ("create", (cv_doc.model_dump(mode="json"),)),
+                    ("create", (job_doc.model_dump(mode="json"),)),
+                    ("create", (analysis_doc.model_dump(mode="json"),)),
+                ],
+                partition_key=user_id,
+            )
+            logger.info(
+                "Created CV %s, job %s and analysis %s for user: %s",
+                cv_doc.id,
+                job_doc.id,
+                analysis_doc.id,
+                user_id,
+            )
+            return cv_doc.id, job_doc.id, analysis_doc.id
+        except exceptions.CosmosHttpResponseError as e:
+            if e.status_code != StatusCodes.REQUEST_ENTITY_TOO_LARGE:
+                logger.error("Failed to create analysis bundle: %s", e)
+                raise
+            logger.warning("Analysis bundle too large for a batch, writing documents individually")
+
+        try:
+            await asyncio.gather(
+                self.container.create_item(body=cv_doc.model_dump(mode="json")),
+                self.container.create_item(body=job_doc.model_dump(mode="json")),
+            )
+            await self.container.create_item(body=analysis_doc.model_dump(mode="json"))
+            logger.info(
+                "Created CV %s, job %s and analysis %s for user: %s",
+                cv_doc.id,
+                job_doc.id,
+                analysis_doc.id,
+                user_id,
+            )
+            return cv_doc.id, job_doc.id, analysis_doc.id
+        except exceptions.CosmosHttpResponseError as e:
+            logger.error("Failed to create analysis bundle: %s", e)
+            raise
+
+    def _build_cv_document(self, user_id: str, content: str, filename: str) -> CVDocument:
+        """Build a new CV document."""
+        return CVDocument(
+            id=self._generate_id("cv"),
+            userId=user_id,
+            filename=filename,
+            content=content,
+            characterCount=len(content),
+        )
+
+    def _build_job_document(
+        self,
+        user_id: str,
+        content: str,
+        source_type: str,
+        source_url: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> JobDocument:
+        """Build a new job document, extracting the title if not provided."""
+        if not title:
+            title = self._extract_job_title(content, source_url)
+
+        return JobDocument(
+            id=self._generate_id("job"),
+            userId=user_id,
+            title=title,
+            content=content,
+            sourceType=source_type,
+            sourceUrl=source_url,
+            characterCount=len(content),
+        )
+
+    def _build_analysis_document(
+        self,
+        user_id: str,
+        cv_markdown: str,
+        job_description: str,
+        source_type: str,
+        source_url: Optional[str],
+        result: AnalysisResult,
+        cv_id: str = "",
+        job_id: str = "",
+    ) -> AnalysisDocument:
+        """
+        Build a new analysis document from an analysis result.
+        
+        The CV and job text make up most of the document, and write RUs scale
+        with its size, so they are stored compressed once they are large.
+        """
+        content_encoding = None
+        if len(cv_markdown) + len(job_description) >= _COMPRESS_MIN_CHARS:
+            cv_markdown = _compress_text(cv_markdown)
+            job_description = _compress_text(job_description)
+            content_encoding = _TEXT_ENCODING
+
+        return AnalysisDocument(
             id=self._generate_id("analysis"),
             userId=user_id,
             cvId=cv_id,
             jobId=job_id,
             cvMarkdown=cv_markdown,
             jobDescription=job_description,
+            contentEncoding=content_encoding,
             sourceType=source_type,
             sourceUrl=source_url,
             overallScore=result.overall_score,
-            skillMatches=[match.model_dump() for match in result.skill_matches],
+            skillMatches=result.skill_matches,
             experienceMatch=result.experience_match,
             educationMatch=result.education_match,
             strengths=result.strengths,
@@ -254,30 +615,37 @@ class CosmosDBRepository(AnalysisRepository):
             recommendations=result.recommendations,
         )
 
-        try:
-            self.container.create_item(body=analysis_doc.model_dump(mode="json"))
-            logger.info(f"Created analysis document: {analysis_doc.id} for user: {user_id}")
-            return analysis_doc.id
-        except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to create analysis document: {e}")
-            raise
-
-    async def get_by_id(self, analysis_id: str) -> Optional[AnalysisResult]:
+    async def get_by_id(self, analysis_id: str, user_id: str) -> Optional[AnalysisResult]:
         """
         Retrieve analysis by ID.
         
-        Note: This requires knowing the userId (partition key).
-        For now, this is a placeholder - proper implementation needs partition key.
-        
         Args:
             analysis_id: Analysis document ID
+            user_id: User ID (partition key)
             
         Returns:
             AnalysisResult or None if not found
         """
-        # This is a placeholder - need to implement with proper partition key handling
-        logger.warning("get_by_id not fully implemented - requires partition key")
-        return None
+        try:
+            item = await self.container.read_item(item=analysis_id, partition_key=user_id)
+        except exceptions.CosmosResourceNotFoundError:
+            logger.warning("Analysis not found: %s for user: %s", analysis_id, user_id)
+            return None
+        except exceptions.CosmosHttpResponseError as e:
+            logger.error("Failed to get analysis: %s", e)
+            raise
+
+        return AnalysisResult(
+            id=item["id"],
+            created_at=item["createdAt"],
+            overall_score=item["overallScore"],
+            skill_matches=item.get("skillMatches", []),
+            experience_match=item.get("experienceMatch", {}),
+            education_match=item.get("educationMatch", {}),
+            strengths=item.get("strengths", []),
+            gaps=item.get("gaps", []),
+            recommendations=item.get("recommendations", []),
+        )
 
     async def list_recent(self, limit: int = 10) -> list[AnalysisResult]:
         """
@@ -294,48 +662,110 @@ class CosmosDBRepository(AnalysisRepository):
         logger.warning("list_recent is limited - use list_analyses(user_id) for partition-scoped queries")
         return []
 
+    async def _query_page(
+        self,
+        query: str,
+        user_id: str,
+        limit: int,
+        continuation_token: Optional[str],
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """
+        Run a list query over a user's analyses and return one page of it.
+        
+        Resuming from a continuation token costs the same however deep the
+        page is, unlike OFFSET, which reads and discards every skipped item.
+        
+        Args:
+            query: Query filtering on @userId and @type
+            user_id: User ID (partition key)
+            limit: Maximum number of items in the page
+            continuation_token: Token of the page to read, None for the first
+            
+        Returns:
+            Tuple of (items, continuation token of the next page or None)
+        """
+        pages = self.container.query_items(
+            query=query,
+            parameters=[
+                {"name": "@userId", "value": user_id},
+                {"name": "@type", "value": "analysis"},
+            ],
+            partition_key=user_id,
+            max_item_count=limit,
+            throughput_bucket=LIST_THROUGHPUT_BUCKET,
+        ).by_page(continuation_token)
+
+        try:
+            page = await pages.__anext__()
+        except StopAsyncIteration:
+            return [], None
+        items = [item async for item in page]
+        return items, pages.continuation_token
+
     async def list_analyses(
-        self, user_id: str, limit: int = 50, offset: int = 0
-    ) -> list[AnalysisDocument]:
+        self, user_id: str, limit: int = 50, continuation_token: Optional[str] = None
+    ) -> tuple[list[AnalysisDocument], Optional[str]]:
         """
-        List analysis documents for a user.
+        List analysis documents for a user, newest first.
         
         Args:
             user_id: User ID (partition key)
             limit: Maximum number of results
-            offset: Number of results to skip
+            continuation_token: Token returned with the previous page, if any
             
         Returns:
-            List of analysis documents
+            Tuple of (analysis documents, continuation token of the next page or None)
         """
         try:
             query = """
                 SELECT * FROM c 
                 WHERE c.userId = @userId AND c.type = @type
                 ORDER BY c.createdAt DESC
-                OFFSET @offset LIMIT @limit
             """
-            parameters = [
-                {"name": "@userId", "value": user_id},
-                {"name": "@type", "value": "analysis"},
-                {"name": "@offset", "value": offset},
-                {"name": "@limit", "value": limit},
-            ]
-
-            items = list(
-                self.container.query_items(
-                    query=query,
-                    parameters=parameters,
-                    partition_key=user_id,
-                )
+            items, next_token = await self._query_page(query, user_id, limit, continuation_token)
+
+            analyses = _ANALYSIS_LIST_ADAPTER.validate_python(
+                [_decode_analysis_item(item) for item in items]
             )
+            logger.info("Retrieved %d analyses for user: %s", len(analyses), user_id)
+            return analyses, next_token
 
-            analyses = [AnalysisDocument(**item) for item in items]
-            logger.info(f"Retrieved {len(analyses)} analyses for user: {user_id}")
-            return analyses
+        except exceptions.CosmosHttpResponseError as e:
+            logger.error("Failed to list analyses: %s", e)
+            raise
+
+    async def list_analyses_summary(
+        self, user_id: str, limit: int = 50, continuation_token: Optional[str] = None
+    ) -> tuple[list[AnalysisSummary], Optional[str]]:
+        """
+        List analysis summaries for a user, newest first.
+        
+        Projects only the list-view fields, so the CV and job text and the
+        detailed match data are neither read nor transferred.
+        
+        Args:
+            user_id: User ID (partition key)
+            limit: Maximum number of results
+            continuation_token: Token returned with the previous page, if any
+            
+        Returns:
+            Tuple of (analysis summaries, continuation token of the next page or None)
+        """
+        try:
+            query = """
+                SELECT c.id, c.cvId, c.jobId, c.sourceType, c.overallScore, c.createdAt
+                FROM c 
+                WHERE c.userId = @userId AND c.type = @type
+                ORDER BY c.createdAt DESC
+            """
+            items, next_token = await self._query_page(query, user_id, limit, continuation_token)
+
+            summaries = _ANALYSIS_SUMMARY_LIST_ADAPTER.validate_python(items)
+            logger.info("Retrieved %d analysis summaries for user: %s", len(summaries), user_id)
+            return summaries, next_token
 
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to list analyses: {e}")
+            logger.error("Failed to list analysis summaries: %s", e)
             raise
 
     async def get_cv_by_id(self, user_id: str, cv_id: str) -> Optional[CVDocument]:
@@ -350,13 +780,13 @@ class CosmosDBRepository(AnalysisRepository):
             CV document or None
         """
         try:
-            item = self.container.read_item(item=cv_id, partition_key=user_id)
-            return CVDocument(**item)
+            item = await self.container.read_item(item=cv_id, partition_key=user_id)
+            return CVDocument.model_validate(item)
         except exceptions.CosmosResourceNotFoundError:
-            logger.warning(f"CV not found: {cv_id} for user: {user_id}")
+            logger.warning("CV not found: %s for user: %s", cv_id, user_id)
             return None
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to get CV: {e}")
+            logger.error("Failed to get CV: %s", e)
             raise
 
     async def get_job_by_id(self, user_id: str, job_id: str) -> Optional[JobDocument]:
@@ -371,13 +801,13 @@ class CosmosDBRepository(AnalysisRepository):
             Job document or None
         """
         try:
-            item = self.container.read_item(item=job_id, partition_key=user_id)
-            return JobDocument(**item)
+            item = await self.container.read_item(item=job_id, partition_key=user_id)
+            return JobDocument.model_validate(item)
         except exceptions.CosmosResourceNotFoundError:
-            logger.warning(f"Job not found: {job_id} for user: {user_id}")
+            logger.warning("Job not found: %s for user: %s", job_id, user_id)
             return None
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to get job: {e}")
+            logger.error("Failed to get job: %s", e)
             raise
 
     async def get_analysis_by_id(
@@ -394,47 +824,73 @@ class CosmosDBRepository(AnalysisRepository):
             Analysis document or None
         """
         try:
-            item = self.container.read_item(item=analysis_id, partition_key=user_id)
-            return AnalysisDocument(**item)
+            item = await self.container.read_item(item=analysis_id, partition_key=user_id)
+            return AnalysisDocument.model_validate(_decode_analysis_item(item))
         except exceptions.CosmosResourceNotFoundError:
-            logger.warning(f"Analysis not found: {analysis_id} for user: {user_id}")
+            logger.warning("Analysis not found: %s for user: %s", analysis_id, user_id)
             return None
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to get analysis: {e}")
+            logger.error("Failed to get analysis: %s", e)
             raise
 
+    async def get_analysis_bundle(
+        self, user_id: str, cv_id: str, job_id: str, analysis_id: str = ""
+    ) -> tuple[Optional[CVDocument], Optional[JobDocument], Optional[AnalysisDocument]]:
+        """
+        Get the CV, job, and analysis documents of one analysis together.
+        
+        The three point reads are issued concurrently, so the bundle costs one
+        round trip of latency instead of three. Empty IDs are not read and
+        come back as None.
+        
+        Args:
+            user_id: User ID (partition key)
+            cv_id: CV document ID
+            job_id: Job document ID
+            analysis_id: Analysis document ID
+            
+        Returns:
+            Tuple of (CV document, job document, analysis document); None if not found
+        """
+        cv_doc, job_doc, analysis_doc = await asyncio.gather(
+            self.get_cv_by_id(user_id, cv_id) if cv_id else _no_document(),
+            self.get_job_by_id(user_id, job_id) if job_id else _no_document(),
+            self.get_analysis_by_id(user_id, analysis_id) if analysis_id else _no_document(),
+        )
+        return cv_doc, job_doc, analysis_doc
+
     async def delete_cv(self, user_id: str, cv_id: str) -> bool:
         """Delete CV document."""
         try:
-            self.container.delete_item(item=cv_id, partition_key=user_id)
-            logger.info(f"Deleted CV: {cv_id} for user: {user_id}")
+            await self.container.delete_item(item=cv_id, partition_key=user_id)
+            logger.info("Deleted CV: %s for user: %s", cv_id, user_id)
             return True
         except exceptions.CosmosResourceNotFoundError:
             return False
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to delete CV: {e}")
+            logger.error("Failed to delete CV: %s", e)
             raise
 
     async def delete_job(self, user_id: str, job_id: str) -> bool:
         """Delete job document."""
         try:
-            self.container.delete_item(item=job_id, partition_key=user_id)
-            logger.info(f"Deleted job: {job_id} for user: {user_id}")
+            await self.container.delete_item(item=job_id, partition_key=user_id)
+            logger.info("Deleted job: %s for user: %s", job_id, user_id)
             return True
         except exceptions.CosmosResourceNotFoundError:
             return False
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to delete job: {e}")
+            logger.error("Failed to delete job: %s", e)
             raise
 
     async def delete_analysis(self, user_id: str, analysis_id: str) -> bool:
         """Delete analysis document."""
         try:
-            self.container.delete_item(item=analysis_id, partition_key=user_id)
-            logger.info(f"Deleted analysis: {analysis_id} for user: {user_id}")
+            await self.container.delete_item(item=analysis_id, partition_key=user_id)
+            logger.info("Deleted analysis: %s for user: %s", analysis_id, user_id)
             return True
         except exceptions.CosmosResourceNotFoundError:
             return False
         except exceptions.CosmosHttpResponseError as e:
-            logger.error(f"Failed to delete analysis: {e}")
+            logger.error("Failed to delete analysis: %s", e)
             raise
@@ -1,16 +1,31 @@
 """CV Checker service - business logic layer."""
 
+import asyncio
 import logging
+import re
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime, timezone
 from typing import Optional, AsyncIterator, Dict, Any
 
 from agent_framework.azure import AzureOpenAIChatClient
 
 from app.agents.orchestrator import CVCheckerOrchestrator
-from app.models.domain import AnalysisResult
+from app.models.domain import AnalysisResult, new_id
 from app.repositories.analysis import AnalysisRepository
+from app.utils.hashing import content_key
 
 logger = logging.getLogger(__name__)
 
+# Inputs shorter than this (stripped) cannot produce a meaningful analysis;
+# the same minimums the API enforces on AnalyzeRequest
+MIN_CV_CHARS = 100
+MIN_JD_CHARS = 50
+
+# A CV with no Markdown heading and no mention of experience or skills has
+# nothing for the CV parser to extract
+_CV_STRUCTURE_RE = re.compile(r"^#{1,6}\s|experience|skill", re.IGNORECASE | re.MULTILINE)
+
 
 class CVCheckerService:
     """
@@ -18,12 +33,19 @@ class CVCheckerService:
 
     This service orchestrates the CV analysis workflow while being
     independent of the storage mechanism (in-memory v1, Cosmos DB v2+).
+
+    Results of recent analyses are kept in an in-process LRU cache keyed on
+    the exact CV and job description, so re-running an identical analysis
+    skips the agent workflow entirely. Inputs too short or unstructured to
+    analyze are answered with a fixed zero-score result, also without
+    running the workflow.
     """
 
     def __init__(
         self,
         repository: AnalysisRepository,
         openai_client: AzureOpenAIChatClient,
+        cache_size: int = 256,
     ):
         """
         Initialize CV Checker service.
@@ -31,9 +53,12 @@ class CVCheckerService:
         Args:
             repository: Analysis repository implementation
             openai_client: Microsoft Agent Framework Azure OpenAI chat client
+            cache_size: Maximum number of cached analysis results (0 disables)
         """
         self.repository = repository
         self.orchestrator = CVCheckerOrchestrator(openai_client)
+        self._cache_size = cache_size
+        self._result_cache: OrderedDict[str, AnalysisResult] = OrderedDict()
         logger.info(
             f"CVCheckerService initialized with {type(repository).__name__} "
             "and AI agent orchestrator"
@@ -47,7 +72,7 @@ class CVCheckerService:
 
         Executes sequential workflow:
         1. JobParser Agent - Extract job requirements
-        2. CVParser Agent - Extract CV data
+        2. CVParser Agent - Extract CV data (concurrently with step 1)
         3. Analyzer Agent - Hybrid scoring (deterministic + LLM)
         4. ReportGenerator Agent - Create recommendations
 
@@ -66,6 +91,16 @@ class CVCheckerService:
             f"JD length: {len(job_description)}"
         )
 
+        rejected = self._check_input(cv_markdown, job_description)
+        if rejected is not None:
+            return rejected
+
+        cache_key = self._cache_key(cv_markdown, job_description)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"Analysis served from cache with ID: {cached.id}")
+            return cached
+
         try:
             # Execute agent workflow
             result = await self.orchestrator.execute(
@@ -75,12 +110,48 @@ class CVCheckerService:
 
             logger.info(f"Analysis completed with ID: {result.id}")
 
+            self._put_cached(cache_key, result)
             return result
 
         except Exception as e:
             logger.error(f"CV analysis failed: {e}", exc_info=True)
             raise
 
+    async def analyze_cv_batch(
+        self, items: Sequence[tuple[str, str]], batch_size: int = 4
+    ) -> list[AnalysisResult]:
+        """
+        Analyze several CVs against their job descriptions.
+
+        Analyses run concurrently, ``batch_size`` at a time, so their LLM
+        calls are in flight together and the backend can batch them instead
+        of serving each workflow's four round trips one after another.
+
+        Args:
+            items: (cv_markdown, job_description) pairs
+            batch_size: Maximum number of concurrent analyses
+
+        Returns:
+            AnalysisResults, in input order
+
+        Raises:
+            Exception: If any agent workflow fails
+        """
+        logger.info(f"Starting batch CV analysis - {len(items)} items")
+
+        results: list[AnalysisResult] = []
+        for start in range(0, len(items), batch_size):
+            batch = items[start : start + batch_size]
+            results.extend(
+                await asyncio.gather(
+                    *(
+                        self.analyze_cv(cv_markdown, job_description)
+                        for cv_markdown, job_description in batch
+                    )
+                )
+            )
+        return results
+
     async def analyze_cv_with_progress(
         self, cv_markdown: str, job_description: str
     ) -> AsyncIterator[Dict[str, Any]]:
@@ -89,7 +160,7 @@ class CVCheckerService:
 
         Executes sequential workflow with streaming progress:
         1. JobParser Agent - Extract job requirements
-        2. CVParser Agent - Extract CV data
+        2. CVParser Agent - Extract CV data (concurrently with step 1)
         3. Analyzer Agent - Hybrid scoring (deterministic + LLM)
         4. ReportGenerator Agent - Create recommendations
 
@@ -108,33 +179,117 @@ class CVCheckerService:
             f"JD length: {len(job_description)}"
         )
 
+        rejected = self._check_input(cv_markdown, job_description)
+        if rejected is not None:
+            yield {"type": "result", "data": rejected}
+            return
+
+        cache_key = self._cache_key(cv_markdown, job_description)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"Analysis served from cache with ID: {cached.id}")
+            yield {"type": "result", "data": cached}
+            return
+
         try:
             # Execute agent workflow with progress
             async for chunk in self.orchestrator.execute_with_progress(
                 cv_markdown=cv_markdown,
                 job_description=job_description,
             ):
-                yield chunk
-                
                 if chunk.get("type") == "result":
                     result = chunk["data"]
                     logger.info(f"Analysis completed with ID: {result.id}")
+                    self._put_cached(cache_key, result)
+
+                yield chunk
 
         except Exception as e:
             logger.error(f"CV analysis failed: {e}", exc_info=True)
             raise
 
-    async def get_analysis(self, analysis_id: str) -> Optional[AnalysisResult]:
+    @staticmethod
+    def _check_input(
+        cv_markdown: str, job_description: str
+    ) -> Optional[AnalysisResult]:
+        """
+        Reject inputs that cannot produce a meaningful analysis.
+
+        Returns:
+            A zero-score result explaining what is missing, or None if the
+            input is fit for the agent workflow
+        """
+        gaps: list[str] = []
+        if len(cv_markdown.strip()) < MIN_CV_CHARS:
+            gaps.append(f"CV is too short (minimum {MIN_CV_CHARS} characters)")
+        elif _CV_STRUCTURE_RE.search(cv_markdown) is None:
+            gaps.append("CV has no sections, experience or skills to analyze")
+        if len(job_description.strip()) < MIN_JD_CHARS:
+            gaps.append(
+                f"Job description is too short (minimum {MIN_JD_CHARS} characters)"
+            )
+        if not gaps:
+            return None
+
+        logger.info(f"Analysis skipped, insufficient input: {'; '.join(gaps)}")
+        return AnalysisResult.new(
+            overall_score=0.0,
+            skill_matches=[],
+            experience_match={},
+            education_match={},
+            strengths=[],
+            gaps=gaps,
+            recommendations=[
+                "Provide a complete CV with experience and skills sections, "
+                "and the full job description, to get a match analysis"
+            ],
+        )
+
+    @staticmethod
+    def _cache_key(cv_markdown: str, job_description: str) -> str:
+        """Digest identifying an exact (CV, job description) pair."""
+        return content_key(cv_markdown, job_description)
+
+    def _get_cached(self, key: str) -> Optional[AnalysisResult]:
+        """
+        Look up a cached analysis result.
+
+        Returns:
+            A copy of the cached result under a new ID and timestamp (each
+            analysis is stored as its own record), or None on a miss
+        """
+        result = self._result_cache.get(key)
+        if result is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return result.model_copy(
+            update={"id": new_id(), "created_at": datetime.now(timezone.utc)},
+            deep=True,
+        )
+
+    def _put_cached(self, key: str, result: AnalysisResult) -> None:
+        """Cache an analysis result, evicting the least recently used."""
+        if self._cache_size <= 0:
+            return
+        self._result_cache[key] = result.model_copy(deep=True)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._cache_size:
+            self._result_cache.popitem(last=False)
+
+    async def get_analysis(
+        self, analysis_id: str, user_id: str
+    ) -> Optional[AnalysisResult]:
         """
         Retrieve analysis by ID.
 
         Args:
             analysis_id: Unique analysis identifier
+            user_id: Owning user ID (partition key)
 
         Returns:
             AnalysisResult if found, None otherwise
         """
-        return await self.repository.get_by_id(analysis_id)
+        return await self.repository.get_by_id(analysis_id, user_id)
 
     async def list_recent_analyses(self, limit: int = 10) -> list[AnalysisResult]:
         """
@@ -6,12 +6,131 @@ Extracts job description text from LinkedIn job posting URLs using headless brow
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional
 
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Route,
+    async_playwright,
+)
+from playwright.async_api import (
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+from app.utils.linkedin_validator import normalize_linkedin_url
 
 logger = logging.getLogger(__name__)
 
+# Selectors for the job description, covering different LinkedIn page layouts
+_DESCRIPTION_SELECTORS = [
+    '.description__text',
+    '.show-more-less-html__markup',
+    '.jobs-description__content',
+    '[class*="description"]',
+    '.jobs-box__html-content',
+]
+
+# Returns the first visible selector match with more than minLength chars of
+# text, as {selector, text}, or null
+_FIND_DESCRIPTION_JS = """([selectors, minLength]) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (!element || element.getClientRects().length === 0) continue;
+        const text = element.innerText;
+        if (text && text.trim().length > minLength) return {selector, text};
+    }
+    return null;
+}"""
+
+# True once any description selector matches or the DOM is fully parsed
+_PAGE_READY_JS = """(selectors) => document.readyState !== 'loading'
+    || selectors.some((selector) => document.querySelector(selector) !== null)"""
+
+# CAPTCHA and challenge indicators: CSS selectors, plus texts that make up the
+# whole (whitespace-normalized) text of some element
+_ANTI_BOT_SELECTORS = [
+    'iframe[src*="captcha"]',
+    '[id*="captcha"]',
+    '[class*="captcha"]',
+]
+_ANTI_BOT_TEXTS = [
+    'Verify you are human',
+    'Security Verification',
+]
+
+# Returns the first anti-bot selector or text found on the page, or null
+_FIND_ANTI_BOT_JS = """([selectors, texts]) => selectors.find(
+        (selector) => document.querySelector(selector) !== null)
+    || texts.find((text) => document.evaluate(
+        `//*[normalize-space(.)="${text}"]`, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null)
+    || null"""
+
+# Polls the page every 100ms for an anti-bot challenge or a job description
+# with more than minLength chars, resolving with {antiBot} or {selector, text}.
+# At the deadline, settles for a description of any length, or null. Runs as
+# a single evaluate call, so the browser is asked once rather than per check.
+_FIND_CONTENT_JS = """async ([selectors, minLength, antiBotSelectors, antiBotTexts, timeout]) => {
+    const findDescription = """ + _FIND_DESCRIPTION_JS + """;
+    const findAntiBot = """ + _FIND_ANTI_BOT_JS + """;
+    const deadline = Date.now() + timeout;
+    for (;;) {
+        const antiBot = findAntiBot([antiBotSelectors, antiBotTexts]);
+        if (antiBot) return {antiBot};
+        const found = findDescription([selectors, minLength]);
+        if (found) return found;
+        if (Date.now() >= deadline) return findDescription([selectors, 0]);
+        await new Promise((resolve) => setTimeout(resolve, 100));
+    }
+}"""
+
+# Resource types not needed for text extraction, blocked in every context.
+# Matched by type rather than URL, as LinkedIn's CDN serves images without a
+# file extension. Stylesheets still load, as visibility checks depend on them.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack", "manifest"})
+
+# Chromium launch flags: the sandbox is unavailable in containers, /dev/shm is
+# often too small there, and GPU, extensions, audio, sync and the background
+# throttling of hidden pages are of no use to a headless scraper
+_CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--mute-audio',
+    '--no-first-run',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+]
+
+# Browser context settings shared by every pooled context
+_VIEWPORT = {"width": 1920, "height": 1080}
+_USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Longest wait for the browser to close or Playwright to stop (seconds);
+# a hung browser must not stall application shutdown
+_SHUTDOWN_TIMEOUT = 5.0
+
+
+async def _route_request(route: Route) -> None:
+    """Abort requests for blocked resource types and let the rest through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class LinkedInScraperError(Exception):
     """Base exception for LinkedIn scraping errors."""
@@ -33,50 +152,154 @@ class AntiBotDetected(LinkedInScraperError):
     pass
 
 
+class _SharedBrowser:
+    """
+    Process-wide Playwright instance and Chromium browser.
+    
+    Launching Chromium takes hundreds of milliseconds and a sizeable chunk of
+    memory, so every scraper in the process borrows the same browser. It is
+    launched on the first acquire and stopped when the last holder releases it.
+    """
+    
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._refs = 0
+    
+    async def acquire(self) -> Browser:
+        """
+        Take a reference to the shared browser, launching it if needed.
+        
+        A browser that has disconnected is replaced by a fresh launch.
+        
+        Returns:
+            Connected Chromium browser
+        """
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                await self._stop()
+                logger.info("Launching shared Playwright browser")
+                self._playwright = await async_playwright().start()
+                try:
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=True, args=_CHROMIUM_ARGS
+                    )
+                except Exception:
+                    await self._stop()
+                    raise
+            self._refs += 1
+            return self._browser
+    
+    async def release(self) -> None:
+        """Drop a reference taken by acquire, stopping the browser after the last one."""
+        async with self._lock:
+            self._refs = max(self._refs - 1, 0)
+            if self._refs == 0:
+                await self._stop()
+    
+    async def _stop(self) -> None:
+        """
+        Close the browser and stop Playwright, ignoring an already dead browser.
+        
+        Each step is given _SHUTDOWN_TIMEOUT seconds; one that takes longer is
+        left to finish in the background rather than blocking the caller.
+        """
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(browser.close()), _SHUTDOWN_TIMEOUT)
+                logger.info("Browser closed")
+            except TimeoutError:
+                logger.warning(f"Browser did not close within {_SHUTDOWN_TIMEOUT}s")
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+        if playwright is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(playwright.stop()), _SHUTDOWN_TIMEOUT)
+                logger.info("Playwright stopped")
+            except TimeoutError:
+                logger.warning(f"Playwright did not stop within {_SHUTDOWN_TIMEOUT}s")
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {e}")
+
+
+_shared_browser = _SharedBrowser()
+
+
 class LinkedInScraperService:
     """
     Service for scraping LinkedIn job postings using Playwright.
     
     Uses headless Chromium browser to navigate to LinkedIn job pages,
     extract job description text, and handle various error scenarios.
+    
+    Pages are pooled, each in a browser context of its own: each scrape
+    checks one out and returns it blanked and with its context's cookies
+    cleared, rather than creating and destroying a context and a page.
+    A page that fails is disposed of with its context and replaced on its
+    next checkout.
+    The pool size also bounds the number of concurrent scrapes. The browser
+    itself is shared with every other scraper in the process.
+    
+    Scraped descriptions are cached for a short time, keyed on the normalized
+    URL, and concurrent scrapes of the same posting share one navigation.
     """
     
-    def __init__(self, timeout: int = 15000):
+    def __init__(
+        self,
+        timeout: int = 15000,
+        pool_size: int = 4,
+        cache_size: int = 1024,
+        cache_ttl: float = 900.0,
+    ):
         """
         Initialize LinkedIn scraper service.
         
         Args:
             timeout: Maximum time to wait for page load and selectors (milliseconds)
+            pool_size: Number of pooled pages (and browser contexts)
+            cache_size: Maximum number of cached job descriptions (0 disables caching)
+            cache_ttl: Time a cached job description stays valid (seconds)
         """
         self.browser: Optional[Browser] = None
-        self._playwright = None
-        self._playwright_context_manager = None
+        # Whether this scraper holds a reference to the shared browser
+        self._holds_browser = False
         self.timeout = timeout
         self.max_retries = 2
+        self.pool_size = pool_size
+        # Idle pages; None marks a slot whose page is created on checkout
+        self._page_pool: Optional[asyncio.Queue[Optional[Page]]] = None
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        # Normalized URL -> (expiry on the monotonic clock, description)
+        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Normalized URL -> scrape in progress, awaited by duplicate requests
+        self._in_flight: dict[str, asyncio.Task[str]] = {}
         
     async def initialize(self):
         """
-        Initialize Playwright and launch browser instance.
+        Attach to the shared headless Chromium browser and fill the page pool.
         
-        Creates a headless Chromium browser with anti-detection configurations.
+        The browser is launched, with anti-detection configurations, only if
+        no other scraper has it running. A disconnected browser is replaced.
         """
-        if self.browser:
+        if self.browser and self.browser.is_connected():
             return
         
         logger.info("Initializing Playwright browser")
         try:
-            # Store the context manager to prevent it from being garbage collected
-            self._playwright_context_manager = async_playwright()
-            self._playwright = await self._playwright_context_manager.__aenter__()
-            
-            self.browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                ]
-            )
+            if self._holds_browser:
+                # Let go of the disconnected browser so acquire() relaunches it
+                self._holds_browser = False
+                await _shared_browser.release()
+            self.browser = await _shared_browser.acquire()
+            self._holds_browser = True
+            self._page_pool = asyncio.Queue()
+            pages = await asyncio.gather(*(self._new_page() for _ in range(self.pool_size)))
+            for page in pages:
+                self._page_pool.put_nowait(page)
             logger.info("Playwright browser initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Playwright browser: {e}")
@@ -101,147 +324,215 @@ class LinkedInScraperService:
             AntiBotDetected: If LinkedIn anti-bot challenge detected
             LinkedInScraperError: For other scraping failures
         """
+        key = normalize_linkedin_url(url)
+        cached = self._get_cached(key)
+        if cached is not None:
+            logger.info(f"Job description served from cache for {key}")
+            return cached
+        
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._scrape(url))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so that a cancelled caller does not abort the scrape
+        # other callers are waiting on
+        content = await asyncio.shield(task)
+        self._put_cached(key, content)
+        return content
+    
+    async def _scrape(self, url: str) -> str:
+        """Scrape a job description, bypassing the cache (see scrape_job_description)."""
         # Initialize or verify browser is ready
         if not self.browser or not self.browser.is_connected():
             logger.warning("Browser not connected, reinitializing...")
             await self.initialize()
         
-        page: Optional[Page] = None
-        context = None
+        page = await self._acquire_page()
+        reusable = False
         
         try:
-            # Create a new browser context for isolation
-            context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = await context.new_page()
-            
-            # Navigate to job posting
+            # Navigate to job posting; return on the first response and then
+            # wait only until the description is in the DOM or the DOM is
+            # parsed, whichever comes first (the description is server-rendered)
             logger.info(f"Navigating to LinkedIn job: {url}")
             try:
-                await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+                await page.goto(url, timeout=self.timeout, wait_until='commit')
+                await page.wait_for_function(
+                    _PAGE_READY_JS, arg=_DESCRIPTION_SELECTORS, timeout=self.timeout
+                )
             except PlaywrightTimeoutError:
                 raise PageLoadTimeout(f"Page load timeout after {self.timeout}ms")
             
-            # Check for anti-bot detection
-            if await self._is_anti_bot_page(page):
-                raise AntiBotDetected("LinkedIn anti-bot challenge detected")
-            
-            # Wait for and extract job description using multiple selectors
             content = await self._extract_job_description(page)
             
             if not content or len(content.strip()) == 0:
                 raise ContentNotFound("Job description content is empty")
             
             logger.info(f"Successfully scraped job description ({len(content)} chars) from {url}")
+            reusable = True
             return content.strip()
             
-        except (PageLoadTimeout, ContentNotFound, AntiBotDetected):
+        except (ContentNotFound, AntiBotDetected):
+            # The page was served; the page itself is still usable
+            reusable = True
+            raise
+        except PageLoadTimeout:
             raise
         except Exception as e:
             logger.error(f"Unexpected error scraping LinkedIn: {e}")
             raise LinkedInScraperError(f"Failed to scrape LinkedIn job: {e}")
         
         finally:
-            # Clean up page and context
-            if page and not page.is_closed():
-                await page.close()
-            if context:
-                await context.close()
+            await self._release_page(page, reusable)
     
-    async def _extract_job_description(self, page: Page) -> str:
+    def _get_cached(self, key: str) -> Optional[str]:
+        """Look up an unexpired cached job description."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return content
+    
+    def _put_cached(self, key: str, content: str) -> None:
+        """Cache a job description, evicting the least recently used."""
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = (time.monotonic() + self._cache_ttl, content)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+    
+    async def _new_context(self) -> BrowserContext:
         """
-        Extract job description text using multiple fallback selectors.
+        Create a browser context with the scraper's viewport and user agent.
         
-        Tries different CSS selectors in order, using the first one that returns content.
+        Images, media and fonts are never needed for text extraction, so
+        requests for them are aborted.
+        """
+        context = await self.browser.new_context(viewport=_VIEWPORT, user_agent=_USER_AGENT)
+        await context.route("**/*", _route_request)
+        return context
+    
+    async def _new_page(self) -> Page:
+        """Create a page in a browser context of its own."""
+        context = await self._new_context()
+        try:
+            return await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+    
+    async def _acquire_page(self) -> Page:
+        """
+        Check a page out of the pool, waiting if all are in use.
         
-        Args:
-            page: Playwright page object
-            
         Returns:
-            Extracted job description text
-            
-        Raises:
-            ContentNotFound: If no selector returns valid content
+            Page, created now (with its context) if its pool slot was empty
         """
-        # Multiple selectors to handle different LinkedIn page layouts
-        selectors = [
-            '.description__text',
-            '.show-more-less-html__markup',
-            '.jobs-description__content',
-            '[class*="description"]',
-            '.jobs-box__html-content',
-        ]
-        
-        content = None
-        for selector in selectors:
+        if self._page_pool is None:
+            # Browser set up without initialize(): create pages on demand
+            self._page_pool = asyncio.Queue()
+            for _ in range(self.pool_size):
+                self._page_pool.put_nowait(None)
+        
+        page = await self._page_pool.get()
+        if page is None:
             try:
-                # Wait for selector with shorter timeout (5 seconds per selector)
-                await page.wait_for_selector(selector, timeout=5000, state='visible')
-                
-                # Extract text content
-                content = await page.evaluate(f'''() => {{
-                    const element = document.querySelector("{selector}");
-                    return element ? element.innerText : null;
-                }}''')
-                
-                # Use this content if it's substantial (>100 chars)
-                if content and len(content.strip()) > 100:
-                    logger.info(f"Successfully extracted content using selector: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                logger.debug(f"Selector not found: {selector}")
-                continue
-            except Exception as e:
-                logger.warning(f"Error with selector {selector}: {e}")
-                continue
+                page = await self._new_page()
+            except Exception:
+                self._page_pool.put_nowait(None)
+                raise
+        return page
+    
+    async def _release_page(self, page: Page, reusable: bool) -> None:
+        """
+        Return a page to the pool.
         
-        if not content:
-            raise ContentNotFound("Job description not found using any known selector")
+        Reusable pages go back navigated to about:blank, so the posting's
+        scripts stop running while the page is idle, and with their context's
+        cookies cleared. Others are closed along with their context, and their
+        slot is refilled on the next checkout.
         
-        return content
+        Args:
+            page: Page checked out by _acquire_page
+            reusable: Whether the scrape left the page in a usable state
+        """
+        pool = self._page_pool
+        browser = self.browser
+        context = page.context
+        if (
+            pool is not None
+            and reusable
+            and browser is not None
+            and context.browser is browser
+            and browser.is_connected()
+        ):
+            try:
+                await page.goto("about:blank")
+                await context.clear_cookies()
+                pool.put_nowait(page)
+                return
+            except Exception as e:
+                logger.warning(f"Discarding pooled page: {e}")
+        
+        try:
+            await context.close()
+        except Exception:
+            pass
+        if pool is not None:
+            pool.put_nowait(None)
     
-    async def _is_anti_bot_page(self, page: Page) -> bool:
+    async def _extract_job_description(self, page: Page) -> str:
         """
-        Check if page contains anti-bot challenge (CAPTCHA, verification).
+        Extract job description text, checking for an anti-bot challenge.
+        
+        The page is polled by a single in-page script that looks for both a
+        challenge and the first visible description selector with substantial
+        content, settling for shorter content once the wait runs out. Every
+        check is done in the browser, so the scrape costs one round trip.
         
         Args:
             page: Playwright page object
             
         Returns:
-            True if anti-bot challenge detected, False otherwise
-        """
-        # Check for CAPTCHA or challenge indicators
-        captcha_selectors = [
-            'iframe[src*="captcha"]',
-            '[id*="captcha"]',
-            '[class*="captcha"]',
-            'text="Verify you are human"',
-            'text="Security Verification"',
-        ]
-        
-        for selector in captcha_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    logger.warning(f"Anti-bot challenge detected using selector: {selector}")
-                    return True
-            except Exception:
-                pass
+            Extracted job description text
+            
+        Raises:
+            AntiBotDetected: If an anti-bot challenge is found on the page
+            ContentNotFound: If no selector returns valid content
+        """
+        found = await page.evaluate(
+            _FIND_CONTENT_JS,
+            [_DESCRIPTION_SELECTORS, 100, _ANTI_BOT_SELECTORS, _ANTI_BOT_TEXTS, 5000],
+        )
+        
+        if found and found.get("antiBot"):
+            logger.warning(f"Anti-bot challenge detected using indicator: {found['antiBot']}")
+            raise AntiBotDetected("LinkedIn anti-bot challenge detected")
+        if not found:
+            raise ContentNotFound("Job description not found using any known selector")
         
-        return False
+        logger.info(f"Successfully extracted content using selector: {found['selector']}")
+        return found["text"]
     
     async def close(self):
-        """Close browser and Playwright instances."""
-        if self.browser:
-            await self.browser.close()
-            logger.info("Browser closed")
-            self.browser = None
-            
-        if self._playwright_context_manager:
-            await self._playwright_context_manager.__aexit__(None, None, None)
-            logger.info("Playwright stopped")
-            self._playwright = None
-            self._playwright_context_manager = None
+        """Close pooled pages and release the shared browser."""
+        # Pages checked out now are closed when released, as the pool is gone
+        pool, self._page_pool = self._page_pool, None
+        while pool is not None and not pool.empty():
+            page = pool.get_nowait()
+            if page is not None:
+                try:
+                    await page.context.close()
+                except Exception:
+                    pass
+        
+        self.browser = None
+        if self._holds_browser:
+            self._holds_browser = False
+            await _shared_browser.release()
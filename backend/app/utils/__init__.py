@@ -5,9 +5,16 @@ from app.utils.azure_openai import (
     get_openai_client,
     get_openai_config,
 )
+from app.utils.concurrency import run_blocking
+from app.utils.credential import close_credential, get_credential
+from app.utils.hashing import content_key
 
 __all__ = [
     "AzureOpenAIConfig",
     "get_openai_config",
     "get_openai_client",
+    "run_blocking",
+    "get_credential",
+    "close_credential",
+    "content_key",
 ]
@@ -2,15 +2,37 @@
 
 import logging
 import os
-from functools import lru_cache
+import threading
+from typing import Optional
 
-from azure.identity import DefaultAzureCredential
+import httpx
+from azure.identity.aio import DefaultAzureCredential, get_bearer_token_provider
 from agent_framework.azure import AzureOpenAIChatClient
+from openai import AsyncAzureOpenAI
 
 from app.config import Settings, get_settings
+from app.utils.concurrency import run_blocking
+from app.utils.credential import get_credential
 
 logger = logging.getLogger(__name__)
 
+# Token scope requested by the Azure OpenAI client for Entra ID authentication
+_COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# Connection pool of the client's HTTP/2 transport; the agents' sequential
+# calls reuse a warm connection instead of each paying a TLS handshake
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Process-wide client, its HTTP transport, and its credential when Entra ID is
+# used; see get_openai_client() and close_openai_client()
+_client: Optional[AzureOpenAIChatClient] = None
+_http_client: Optional[httpx.AsyncClient] = None
+_credential: Optional[DefaultAzureCredential] = None
+_client_lock = threading.Lock()
+
 
 class AzureOpenAIConfig:
     """Azure OpenAI configuration manager."""
@@ -23,6 +45,8 @@ class AzureOpenAIConfig:
             settings: Application settings
         """
         self.settings = settings
+        self.credential: Optional[DefaultAzureCredential] = None
+        self.http_client: Optional[httpx.AsyncClient] = None
         self.endpoint = settings.azure_openai_endpoint
         self.deployment = settings.azure_openai_deployment
         self.api_version = settings.azure_openai_api_version
@@ -46,6 +70,11 @@ class AzureOpenAIConfig:
            - Managed Identity (for Azure-hosted apps)
            - Azure CLI (az login)
            - Visual Studio Code Azure extension
+           The credential is the process-wide one from get_credential(),
+           shared with the Cosmos DB client.
+
+        The underlying OpenAI client uses an HTTP/2 connection pool, so the
+        workflow's agent calls share long-lived connections.
 
         Returns:
             AzureOpenAIChatClient from Microsoft Agent Framework
@@ -55,53 +84,103 @@ class AzureOpenAIConfig:
         
         if api_key:
             logger.info("Creating Microsoft Agent Framework Azure OpenAI client with API key")
-            client = AzureOpenAIChatClient(
-                api_key=api_key,
-                endpoint=self.endpoint,
-                deployment_name=self.deployment,
-                api_version=self.api_version,
-            )
+            auth: dict = {"api_key": api_key}
         else:
             logger.info("Creating Microsoft Agent Framework Azure OpenAI client with DefaultAzureCredential")
-            # Create credential for Entra ID authentication
-            credential = DefaultAzureCredential()
-            client = AzureOpenAIChatClient(
-                credential=credential,
-                endpoint=self.endpoint,
-                deployment_name=self.deployment,
-                api_version=self.api_version,
-            )
+            # Shared credential for Entra ID authentication; the token provider
+            # refreshes tokens from the credential's cache as they expire
+            self.credential = get_credential()
+            auth = {
+                "azure_ad_token_provider": get_bearer_token_provider(
+                    self.credential, _COGNITIVE_SERVICES_SCOPE
+                )
+            }
+
+        self.http_client = httpx.AsyncClient(
+            http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+        )
+        async_client = AsyncAzureOpenAI(
+            azure_endpoint=self.endpoint,
+            azure_deployment=self.deployment,
+            api_version=self.api_version,
+            http_client=self.http_client,
+            **auth,
+        )
+        client = AzureOpenAIChatClient(
+            async_client=async_client,
+            endpoint=self.endpoint,
+            deployment_name=self.deployment,
+            api_version=self.api_version,
+        )
 
         logger.info("Microsoft Agent Framework Azure OpenAI client created successfully")
         return client
 
 
-@lru_cache()
-def get_openai_config(settings: Settings = None) -> AzureOpenAIConfig:
+def get_openai_config() -> AzureOpenAIConfig:
+    """
+    Get Azure OpenAI configuration from the application settings.
+
+    Returns:
+        AzureOpenAIConfig instance
+    """
+    return AzureOpenAIConfig(get_settings())
+
+
+def get_openai_client() -> AzureOpenAIChatClient:
     """
-    Get cached Azure OpenAI configuration instance.
+    Get the process-wide Microsoft Agent Framework Azure OpenAI client.
 
-    Args:
-        settings: Application settings (optional, uses default if not provided)
+    The client is created once on first use. Creation is guarded by a lock, as
+    the health check calls this from a worker thread.
 
     Returns:
-        Cached AzureOpenAIConfig instance
+        Shared AzureOpenAIChatClient instance from Microsoft Agent Framework
+    """
+    global _client, _http_client, _credential
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                config = get_openai_config()
+                _client = config.create_client()
+                _http_client = config.http_client
+                _credential = config.credential
+    return _client
+
+
+async def close_openai_client() -> None:
+    """
+    Close the shared client's HTTP transport, if it was created.
+
+    Call at shutdown before closing the shared credential; the next
+    get_openai_client() call creates a fresh client.
     """
-    if settings is None:
-        settings = get_settings()
-    return AzureOpenAIConfig(settings)
+    global _client, _http_client, _credential
+    http_client = _http_client
+    with _client_lock:
+        _client = _http_client = _credential = None
+    if http_client is not None:
+        await http_client.aclose()
+        logger.info("Azure OpenAI client closed")
 
 
-@lru_cache()
-def get_openai_client(settings: Settings = None) -> AzureOpenAIChatClient:
+async def init_openai_client() -> AzureOpenAIChatClient:
     """
-    Get cached Microsoft Agent Framework Azure OpenAI client instance.
+    Create the shared client at startup and warm its credential.
 
-    Args:
-        settings: Application settings (optional, uses default if not provided)
+    With Entra ID authentication, an access token is acquired up front, so
+    the first analysis does not wait on the credential chain (the managed
+    identity probe can take seconds). A failure there is only logged; the
+    token is then acquired on first use.
 
     Returns:
-        Cached AzureOpenAIChatClient instance from Microsoft Agent Framework
+        Shared AzureOpenAIChatClient instance from Microsoft Agent Framework
     """
-    config = get_openai_config(settings)
-    return config.create_client()
+    client = await run_blocking(get_openai_client)
+    if _credential is not None:
+        try:
+            await _credential.get_token(_COGNITIVE_SERVICES_SCOPE)
+            logger.info("Azure OpenAI access token acquired")
+        except Exception as e:
+            logger.warning(f"Azure OpenAI token pre-fetch failed: {e}")
+    return client
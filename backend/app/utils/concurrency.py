@@ -0,0 +1,25 @@
+"""Helpers for running blocking work from async code."""
+
+import asyncio
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking function in the event loop's default thread pool.
+
+    Unlike ``asyncio.to_thread``, the current ``contextvars`` context is not
+    copied into the worker thread, so use this only for functions that do
+    not read context variables.
+
+    Args:
+        fn: Blocking function to call
+        *args: Positional arguments for ``fn``
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, fn, *args)
@@ -0,0 +1,36 @@
+"""Process-wide Azure AD credential shared by the Azure SDK clients."""
+
+from functools import lru_cache
+
+from azure.identity.aio import DefaultAzureCredential
+
+from app.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_credential() -> DefaultAzureCredential:
+    """
+    Get the process-wide DefaultAzureCredential.
+
+    Azure OpenAI and Cosmos DB authenticate through this one instance, so the
+    credential chain is probed (including the managed identity endpoint, which
+    can take seconds) and tokens are cached once per process rather than once
+    per client. In production, the credentials that shell out or read local
+    developer caches are skipped, as they never succeed on a hosted deployment.
+
+    Returns:
+        Shared async DefaultAzureCredential instance
+    """
+    is_production = get_settings().is_production
+    return DefaultAzureCredential(
+        exclude_cli_credential=is_production,
+        exclude_visual_studio_code_credential=is_production,
+        exclude_shared_token_cache_credential=is_production,
+    )
+
+
+async def close_credential() -> None:
+    """Close the shared credential, if it was created, so the next use gets a fresh one."""
+    if get_credential.cache_info().currsize:
+        await get_credential().close()
+        get_credential.cache_clear()
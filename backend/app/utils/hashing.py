@@ -0,0 +1,26 @@
+"""Content hashing for cache and de-duplication keys."""
+
+import blake3
+
+
+def content_key(*parts: str) -> str:
+    """
+    Key identifying an exact sequence of text parts.
+
+    Each part is length-prefixed, so different splits of the same text never
+    collide (("ab", "c") and ("a", "bc") get different keys). BLAKE3 is used
+    as it hashes the 1-10 KB CVs and job descriptions several times faster
+    than SHA-256 or BLAKE2.
+
+    Args:
+        parts: Texts to hash, in order
+
+    Returns:
+        128-bit hex digest
+    """
+    digest = blake3.blake3()
+    for part in parts:
+        data = part.encode()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest(16)
@@ -5,7 +5,6 @@ Provides functions to validate and normalize LinkedIn job posting URLs.
 """
 
 import re
-from urllib.parse import urlparse
 
 
 # LinkedIn job URL patterns
@@ -14,6 +13,23 @@ LINKEDIN_JOB_PATTERNS = [
     r"^https?://(?:www\.)?linkedin\.com/jobs/collections/[^/]+/\d+/?",
 ]
 
+# Compiled once at import; the patterns anchor the scheme and host, so a
+# single match also covers the domain check.
+_LINKEDIN_JOB_RE = re.compile("|".join(f"(?:{pattern})" for pattern in LINKEDIN_JOB_PATTERNS))
+
+# Every job URL starts with one of these; checked before the regex so that
+# other URLs are rejected without running it
+_LINKEDIN_JOB_PREFIXES = (
+    "https://www.linkedin.com/jobs/",
+    "https://linkedin.com/jobs/",
+    "http://www.linkedin.com/jobs/",
+    "http://linkedin.com/jobs/",
+)
+
+# Splits a URL into scheme, authority and path, leaving out the query and
+# fragment (RFC 3986, appendix B); always matches
+_URL_PARTS_RE = re.compile(r"^(?:([^:/?#]+):)?(?://([^/?#]*))?([^?#]*)")
+
 
 def is_valid_linkedin_job_url(url: str) -> bool:
     """
@@ -33,20 +49,9 @@ def is_valid_linkedin_job_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    # Remove whitespace
+    # Check domain and path pattern (whitespace removed)
     url = url.strip()
-    
-    # Check domain
-    try:
-        parsed = urlparse(url)
-    except ValueError:
-        return False
-    
-    if parsed.netloc not in ["linkedin.com", "www.linkedin.com"]:
-        return False
-    
-    # Check path pattern
-    return any(re.match(pattern, url) for pattern in LINKEDIN_JOB_PATTERNS)
+    return url.startswith(_LINKEDIN_JOB_PREFIXES) and _LINKEDIN_JOB_RE.match(url) is not None
 
 
 def normalize_linkedin_url(url: str) -> str:
@@ -70,18 +75,14 @@ def normalize_linkedin_url(url: str) -> str:
     if not url or not isinstance(url, str):
         raise ValueError("URL must be a non-empty string")
     
-    url = url.strip()
-    
-    try:
-        parsed = urlparse(url)
-    except ValueError as e:
-        raise ValueError(f"Invalid URL format: {e}")
-    
-    # Reconstruct URL without query params and fragments
-    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    scheme, netloc, path = _URL_PARTS_RE.match(url.strip()).groups()
     
-    # Remove trailing slash if present
-    if normalized.endswith("/"):
-        normalized = normalized[:-1]
+    # Reconstruct URL without query params, fragments or trailing slash, the
+    # way urlunsplit() would: components absent from the input stay absent
+    normalized = path.rstrip("/")
+    if netloc is not None:
+        normalized = f"//{netloc}{normalized}"
+    if scheme:
+        normalized = f"{scheme.lower()}:{normalized}"
     
     return normalized
@@ -4,15 +4,16 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
+from typing import Any
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from azure.cosmos import CosmosClient, PartitionKey, exceptions
-from azure.cosmos.aio import CosmosClient as AsyncCosmosClient
-from azure.identity import DefaultAzureCredential
+from azure.cosmos import PartitionKey, exceptions
 
 from app.config import get_settings
+from app.repositories.cosmos_repository import ANALYSIS_INDEXING_POLICY, create_cosmos_client
+from app.utils.credential import close_credential
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,123 +22,102 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def initialize_cosmos_db_sync() -> bool:
+def _indexing_policy_current(container_properties: dict[str, Any]) -> bool:
     """
-    Initialize Cosmos DB database and container synchronously.
-    
-    Returns:
-        True if successful, False otherwise
+    Check whether an existing container already has the analysis indexing policy.
+
+    Only the parts we configure are compared; the service fills in defaults
+    (index kinds, precision) that never appear in ANALYSIS_INDEXING_POLICY.
     """
-    settings = get_settings()
-    
-    if not settings.cosmos_connection_string:
-        logger.error("COSMOS_CONNECTION_STRING not configured")
-        return False
-    
-    try:
-        # Check if using Azure AD authentication or connection string
-        if "AccountKey=" in settings.cosmos_connection_string:
-            # Using connection string with account key
-            client = CosmosClient.from_connection_string(settings.cosmos_connection_string)
-            logger.info("Connected to Cosmos DB using account key")
-        else:
-            # Using Azure AD authentication (DefaultAzureCredential)
-            # Extract endpoint from connection string or use directly
-            endpoint = settings.cosmos_connection_string.replace("AccountEndpoint=", "").replace(";", "").strip()
-            if not endpoint.startswith("https://"):
-                endpoint = f"https://{settings.cosmos_database_name}.documents.azure.com:443/"
-            
-            credential = DefaultAzureCredential()
-            client = CosmosClient(endpoint, credential)
-            logger.info(f"Connected to Cosmos DB using Azure AD authentication: {endpoint}")
-        
-        # Create database
-        try:
-            database = client.create_database(id=settings.cosmos_database_name)
-            logger.info(f"Created database: {settings.cosmos_database_name}")
-        except exceptions.CosmosResourceExistsError:
-            database = client.get_database_client(settings.cosmos_database_name)
-            logger.info(f"Database already exists: {settings.cosmos_database_name}")
-        
-        # Create container with partition key
-        try:
-            container = database.create_container(
-                id=settings.cosmos_container_name,
-                partition_key=PartitionKey(path="/userId"),
-                offer_throughput=400  # Minimum RU/s for manual throughput
-            )
-            logger.info(f"Created container: {settings.cosmos_container_name}")
-            logger.info(f"Partition key: /userId")
-            logger.info(f"Throughput: 400 RU/s")
-        except exceptions.CosmosResourceExistsError:
-            container = database.get_container_client(settings.cosmos_container_name)
-            logger.info(f"Container already exists: {settings.cosmos_container_name}")
-        
-        # Verify container configuration
-        container_properties = container.read()
-        logger.info(f"Container properties: {container_properties.get('id')}")
-        logger.info(f"Partition key path: {container_properties.get('partitionKey', {}).get('paths')}")
-        
-        logger.info("✅ Cosmos DB initialization successful")
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize Cosmos DB: {e}", exc_info=True)
-        return False
+    policy = container_properties.get("indexingPolicy", {})
+    excluded = {path["path"] for path in policy.get("excludedPaths", [])}
+    expected_excluded = {path["path"] for path in ANALYSIS_INDEXING_POLICY["excludedPaths"]}
+    return (
+        excluded == expected_excluded
+        and policy.get("compositeIndexes") == ANALYSIS_INDEXING_POLICY["compositeIndexes"]
+    )
 
 
 async def initialize_cosmos_db_async() -> bool:
     """
     Initialize Cosmos DB database and container asynchronously.
-    
+
+    The database and container are read concurrently first, so a re-run
+    against an existing deployment costs a single round trip; resources are
+    only created when the read reports them missing, and the indexing policy
+    is only replaced when it has drifted.
+
     Returns:
         True if successful, False otherwise
     """
     settings = get_settings()
-    
+
     if not settings.cosmos_connection_string:
         logger.error("COSMOS_CONNECTION_STRING not configured")
         return False
-    
+
     try:
-        # Create async Cosmos client
-        async with AsyncCosmosClient.from_connection_string(
-            settings.cosmos_connection_string
-        ) as client:
-            logger.info("Connected to Cosmos DB (async)")
-            
-            # Create database
-            try:
-                database = await client.create_database(id=settings.cosmos_database_name)
-                logger.info(f"Created database: {settings.cosmos_database_name}")
-            except exceptions.CosmosResourceExistsError:
+        # Same client setup as the application: account-key connection string,
+        # or the account endpoint with the shared Azure AD credential
+        client = create_cosmos_client(settings)
+        try:
+            async with client:
                 database = client.get_database_client(settings.cosmos_database_name)
-                logger.info(f"Database already exists: {settings.cosmos_database_name}")
-            
-            # Create container with partition key
-            try:
-                container = await database.create_container(
-                    id=settings.cosmos_container_name,
-                    partition_key=PartitionKey(path="/userId"),
-                    offer_throughput=400  # Minimum RU/s for manual throughput
-                )
-                logger.info(f"Created container: {settings.cosmos_container_name}")
-                logger.info(f"Partition key: /userId")
-                logger.info(f"Throughput: 400 RU/s")
-            except exceptions.CosmosResourceExistsError:
                 container = database.get_container_client(settings.cosmos_container_name)
-                logger.info(f"Container already exists: {settings.cosmos_container_name}")
-            
-            # Verify container configuration
-            container_properties = await container.read()
-            logger.info(f"Container properties: {container_properties.get('id')}")
-            logger.info(f"Partition key path: {container_properties.get('partitionKey', {}).get('paths')}")
-            
-            logger.info("✅ Cosmos DB initialization successful (async)")
-            return True
-            
+
+                database_read, container_read = await asyncio.gather(
+                    database.read(), container.read(), return_exceptions=True
+                )
+                for result in (database_read, container_read):
+                    if isinstance(result, BaseException) and not isinstance(
+                        result, exceptions.CosmosResourceNotFoundError
+                    ):
+                        raise result
+
+                if isinstance(database_read, exceptions.CosmosResourceNotFoundError):
+                    database = await client.create_database(id=settings.cosmos_database_name)
+                    logger.info(f"Created database: {settings.cosmos_database_name}")
+                else:
+                    logger.info(f"Database already exists: {settings.cosmos_database_name}")
+
+                if isinstance(container_read, BaseException):
+                    container = await database.create_container(
+                        id=settings.cosmos_container_name,
+                        partition_key=PartitionKey(path="/userId"),
+                        indexing_policy=ANALYSIS_INDEXING_POLICY,
+                        offer_throughput=400  # Minimum RU/s for manual throughput
+                    )
+                    logger.info(f"Created container: {settings.cosmos_container_name}")
+                    logger.info(f"Partition key: /userId")
+                    logger.info(f"Throughput: 400 RU/s")
+                    container_properties = await container.read()
+                elif not _indexing_policy_current(container_read):
+                    # Re-apply the indexing policy so existing containers pick up changes
+                    container = await database.replace_container(
+                        settings.cosmos_container_name,
+                        partition_key=PartitionKey(path="/userId"),
+                        indexing_policy=ANALYSIS_INDEXING_POLICY,
+                    )
+                    logger.info(f"Container already exists: {settings.cosmos_container_name}")
+                    logger.info("Indexing policy updated")
+                    container_properties = await container.read()
+                else:
+                    logger.info(f"Container already exists: {settings.cosmos_container_name}")
+                    logger.info("Indexing policy up to date")
+                    container_properties = container_read
+
+                # Verify container configuration
+                logger.info(f"Container properties: {container_properties.get('id')}")
+                logger.info(f"Partition key path: {container_properties.get('partitionKey', {}).get('paths')}")
+                logger.info(f"Composite indexes: {container_properties.get('indexingPolicy', {}).get('compositeIndexes')}")
+
+                logger.info("✅ Cosmos DB initialization successful")
+                return True
+        finally:
+            await close_credential()
+
     except Exception as e:
-        logger.error(f"❌ Failed to initialize Cosmos DB (async): {e}", exc_info=True)
+        logger.error(f"❌ Failed to initialize Cosmos DB: {e}", exc_info=True)
         return False
 
 
@@ -146,8 +126,7 @@ def main():
     logger.info("Starting Cosmos DB initialization...")
     logger.info("=" * 60)
     
-    # Try synchronous initialization first
-    success = initialize_cosmos_db_sync()
+    success = asyncio.run(initialize_cosmos_db_async())
     
     if not success:
         logger.error("Initialization failed")
@@ -13,6 +13,7 @@ exec uvicorn app.main:app \
     --host 0.0.0.0 \
     --port "${PORT:-8000}" \
     --workers "${WORKERS:-4}" \
+    --loop uvloop \
     --log-level info \
     --access-log \
     --proxy-headers \
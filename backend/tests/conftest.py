@@ -1,32 +1,150 @@
 """Pytest configuration and fixtures."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import orjson
 import pytest
+from agent_framework.azure import AzureOpenAIChatClient
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.main import app as _app
 from app.repositories.analysis import InMemoryAnalysisRepository
 from app.services.cv_checker import CVCheckerService
 
 
-@pytest.fixture
-def test_client():
-    """Create a test client for the FastAPI app."""
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported once here rather than by each test module."""
+    return _app
+
+
+@pytest.fixture(scope="session")
+def test_client(app):
+    """Create a test client for the FastAPI app, shared by the session."""
     return TestClient(app)
 
 
-@pytest.fixture
-def repository():
-    """Create a repository instance for testing."""
-    return InMemoryAnalysisRepository()
+@pytest.fixture(scope="session")
+def post_json(test_client):
+    """
+    POST a JSON body through ``test_client``, serialized with orjson.
+
+    orjson encodes straight to bytes and is several times faster than the
+    ``json=`` path, which matters for the multi-KB CV payloads.
+    """
+
+    def post(path: str, payload: dict):
+        return test_client.post(
+            path, content=orjson.dumps(payload), headers={"Content-Type": "application/json"}
+        )
+
+    return post
 
 
-@pytest.fixture
-def service(repository):
-    """Create a service instance for testing."""
-    return CVCheckerService(repository)
+@pytest.fixture(scope="session")
+async def async_client(app):
+    """
+    Create an async HTTP client calling the app in-process, shared by the session.
+
+    Unlike ``test_client``, requests are awaited on the test's event loop,
+    so several can be in flight at once.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _restore_app_state(app):
+    """Undo a test's changes to ``app.state``, dependency overrides and rate limits."""
+    state = dict(app.state._state)
+    yield
+    app.state._state.clear()
+    app.state._state.update(state)
+    app.dependency_overrides.clear()
+    app.state.limiter.reset()
+
+
+@pytest.fixture(scope="session")
+def repository():
+    """
+    Create a repository instance for testing, shared by the session.
+
+    The in-memory repository keeps no state, so there is nothing to reset
+    between tests.
+    """
+    return InMemoryAnalysisRepository()
 
 
-@pytest.fixture
+# Canned JSON replies of the four agents, keyed by agent name
+_AGENT_REPLIES = {
+    "JobParser": {
+        "job_title": "Senior Python Developer",
+        "required_skills": ["Python", "FastAPI", "Azure", "Kubernetes"],
+        "required_years": 5,
+        "role_type": "senior",
+        "education_requirements": "BS in Computer Science",
+    },
+    "CVParser": {
+        "candidate_name": "John Doe",
+        "skills": ["Python", "FastAPI", "Azure", "Docker"],
+        "total_years_experience": 6,
+        "work_experience": [],
+        "education": [{"degree": "BS Computer Science", "institution": "State University"}],
+    },
+    "SemanticValidator": {
+        "semantic_match_percent": 80,
+        "soft_skills_match_percent": 90,
+        "reasoning": "Solid backend experience with relevant cloud exposure",
+        "transferable_skills": ["Docker"],
+        "cultural_fit_notes": "Has led a small team",
+    },
+    "ReportGenerator": {
+        "executive_summary": "Strong candidate with a Kubernetes gap.",
+        "recommendations": [
+            {
+                "priority": "HIGH",
+                "category": "SKILLS",
+                "recommendation": f"Gain hands-on experience with {topic}",
+                "rationale": "Listed in the job requirements",
+            }
+            for topic in ("Kubernetes", "Helm", "AKS", "service meshes", "GitOps")
+        ],
+    },
+}
+
+
+def _mock_agent(name: str, **kwargs) -> MagicMock:
+    """Agent whose run() and run_stream() return the canned reply for ``name``."""
+    reply = orjson.dumps(_AGENT_REPLIES[name]).decode()
+
+    async def run_stream(task):
+        yield SimpleNamespace(text=reply)
+
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value=SimpleNamespace(content=reply))
+    agent.run_stream = MagicMock(side_effect=run_stream)
+    return agent
+
+
+@pytest.fixture(scope="session")
+def service():
+    """
+    Create a service instance for testing, shared by the session.
+
+    Building the service wires up the orchestrator and all four agents, so
+    it is done once. The OpenAI client is a mock whose agents answer with
+    canned replies, so the full workflow runs without network calls or
+    credential lookups; the in-memory repository is stateless.
+    """
+    openai_client = MagicMock(spec=AzureOpenAIChatClient)
+    openai_client.create_agent.side_effect = _mock_agent
+    return CVCheckerService(InMemoryAnalysisRepository(), openai_client)
+
+
+@pytest.fixture(scope="session")
 def sample_cv_markdown():
     """Sample CV in Markdown format for testing."""
     return """# John Doe
@@ -63,7 +181,7 @@ University of Technology, 2019
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_description():
     """Sample job description for testing."""
     return """Senior Python Developer
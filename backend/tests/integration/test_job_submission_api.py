@@ -4,35 +4,54 @@ Integration tests for job submission API endpoint.
 Tests the unified /api/v1/jobs endpoint with both manual and LinkedIn URL inputs.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
-from app.main import app
 from app.services.linkedin_scraper import (
     ContentNotFound,
     PageLoadTimeout,
     AntiBotDetected,
+    LinkedInScraperService,
 )
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+# Scraper failures and the error code the endpoint reports for each
+_SCRAPE_ERRORS = [
+    (PageLoadTimeout("Page load timeout after 15000ms"), "timeout"),
+    (ContentNotFound("Job description not found"), "content_not_found"),
+    (AntiBotDetected("LinkedIn anti-bot challenge detected"), "anti_bot_detected"),
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_scrape(monkeypatch, app):
+    """
+    Mock the browser-driven part of LinkedIn scraping for every test in this module.
+
+    Only the Playwright page load is replaced, so requests still go through the
+    scraper's real URL normalization, cache and in-flight deduplication. The
+    app state gets a fresh scraper whose browser is never launched, since the
+    lifespan does not run under the shared test client.
+    """
+    scrape = AsyncMock()
+    monkeypatch.setattr(LinkedInScraperService, "_scrape", scrape)
+    app.state.linkedin_scraper = LinkedInScraperService()
+    return scrape
 
 
 class TestJobSubmissionEndpoint:
     """Test cases for POST /api/v1/jobs endpoint."""
     
-    def test_submit_manual_job_success(self, client):
+    def test_submit_manual_job_success(self, post_json):
         """Test successful manual job submission."""
         payload = {
             "source_type": "manual",
             "content": "We are seeking a Senior Python Developer with 5+ years of experience in building REST APIs using FastAPI.",
         }
         
-        response = client.post("/api/v1/jobs", json=payload)
+        response = post_json("/api/v1/jobs", payload)
         
         assert response.status_code == 201
         data = response.json()
@@ -42,37 +61,14 @@ class TestJobSubmissionEndpoint:
         assert data["character_count"] == len(payload["content"])
         assert "job_id" in data
     
-    def test_submit_manual_job_too_short(self, client):
-        """Test manual job submission with content too short."""
-        payload = {
-            "source_type": "manual",
-            "content": "Short job description",  # Less than 50 characters
-        }
-        
-        response = client.post("/api/v1/jobs", json=payload)
-        
-        assert response.status_code == 422
-        data = response.json()
-        assert "validation" in data["error"].lower() or "too short" in str(data).lower()
-    
-    def test_submit_manual_job_missing_content(self, client):
-        """Test manual job submission without content."""
-        payload = {
-            "source_type": "manual",
-        }
-        
-        response = client.post("/api/v1/jobs", json=payload)
-        
-        assert response.status_code == 422
-    
-    def test_submit_linkedin_url_invalid_format(self, client):
+    def test_submit_linkedin_url_invalid_format(self, post_json):
         """Test LinkedIn URL submission with invalid URL format."""
         payload = {
             "source_type": "linkedin_url",
             "url": "https://google.com/jobs/123",
         }
         
-        response = client.post("/api/v1/jobs", json=payload)
+        response = post_json("/api/v1/jobs", payload)
         
         assert response.status_code == 400
         data = response.json()
@@ -80,97 +76,64 @@ class TestJobSubmissionEndpoint:
         assert detail.get("error") == "invalid_url"
         assert detail.get("fallback") == "manual_input"
     
-    @patch("app.main.LinkedInScraperService.scrape_job_description")
-    def test_submit_linkedin_url_success(self, mock_scrape, client):
+    def test_submit_linkedin_url_success(self, mock_scrape, post_json):
         """Test successful LinkedIn URL job submission."""
         # Mock successful scraping
-        mock_scrape.return_value = AsyncMock(
-            return_value="About the job\n\nWe are looking for a talented Senior Python Developer with expertise in FastAPI and Azure cloud platforms. The ideal candidate will have 5+ years of experience..."
-        )
-        
-        payload = {
-            "source_type": "linkedin_url",
-            "url": "https://www.linkedin.com/jobs/view/123456789/",
-        }
-        
-        response = client.post("/api/v1/jobs", json=payload)
-        
-        # Note: This test may fail if the scraper is not properly mocked in the app state
-        # In real integration test, we'd need to mock the app.state.linkedin_scraper
-        # For now, we expect this to work with proper mocking setup
-    
-    @patch("app.services.linkedin_scraper.LinkedInScraperService.scrape_job_description")
-    async def test_submit_linkedin_url_timeout(self, mock_scrape, client):
-        """Test LinkedIn URL submission with timeout error."""
-        # Mock timeout error
-        mock_scrape.side_effect = PageLoadTimeout("Page load timeout after 15000ms")
+        content = "About the job\n\nWe are looking for a talented Senior Python Developer with expertise in FastAPI and Azure cloud platforms. The ideal candidate will have 5+ years of experience..."
+        mock_scrape.return_value = content
         
         payload = {
             "source_type": "linkedin_url",
             "url": "https://www.linkedin.com/jobs/view/123456789/",
         }
         
-        response = client.post("/api/v1/jobs", json=payload)
-        
-        assert response.status_code == 400
-        data = response.json()
-        detail = data.get("detail", {})
-        assert detail.get("error") == "timeout"
-        assert detail.get("fallback") == "manual_input"
-    
-    @patch("app.services.linkedin_scraper.LinkedInScraperService.scrape_job_description")
-    async def test_submit_linkedin_url_content_not_found(self, mock_scrape, client):
-        """Test LinkedIn URL submission with content not found."""
-        mock_scrape.side_effect = ContentNotFound("Job description not found")
+        response = post_json("/api/v1/jobs", payload)
         
-        payload = {
-            "source_type": "linkedin_url",
-            "url": "https://www.linkedin.com/jobs/view/999999999/",
-        }
-        
-        response = client.post("/api/v1/jobs", json=payload)
-        
-        assert response.status_code == 400
+        assert response.status_code == 201
         data = response.json()
-        detail = data.get("detail", {})
-        assert detail.get("error") == "content_not_found"
-        assert detail.get("fallback") == "manual_input"
+        assert data["fetch_status"] == "success"
+        assert data["content"] == content
+        assert data["source_url"] == payload["url"]
+        mock_scrape.assert_awaited_once_with(payload["url"])
     
-    @patch("app.services.linkedin_scraper.LinkedInScraperService.scrape_job_description")
-    async def test_submit_linkedin_url_anti_bot_detected(self, mock_scrape, client):
-        """Test LinkedIn URL submission with anti-bot challenge."""
-        mock_scrape.side_effect = AntiBotDetected("LinkedIn anti-bot challenge detected")
+    @pytest.mark.parametrize("error, error_code", _SCRAPE_ERRORS)
+    async def test_submit_linkedin_url_error(self, mock_scrape, async_client, error, error_code):
+        """Test LinkedIn URL submission when scraping fails."""
+        mock_scrape.side_effect = error
         
         payload = {
             "source_type": "linkedin_url",
             "url": "https://www.linkedin.com/jobs/view/123456789/",
         }
         
-        response = client.post("/api/v1/jobs", json=payload)
+        response = await async_client.post("/api/v1/jobs", json=payload)
         
         assert response.status_code == 400
         data = response.json()
         detail = data.get("detail", {})
-        assert detail.get("error") == "anti_bot_detected"
+        assert detail.get("error") == error_code
         assert detail.get("fallback") == "manual_input"
     
-    def test_submit_job_missing_source_type(self, client):
-        """Test job submission without source_type."""
-        payload = {
-            "content": "Some job description",
+    async def test_submit_linkedin_url_errors_concurrent(self, mock_scrape, async_client):
+        """Test concurrent LinkedIn URL submissions each report their own failure."""
+        errors = {
+            f"https://www.linkedin.com/jobs/view/{job_id}/": error
+            for job_id, (error, _) in enumerate(_SCRAPE_ERRORS, start=1)
         }
         
-        response = client.post("/api/v1/jobs", json=payload)
+        async def scrape(url):
+            raise errors[url]
         
-        assert response.status_code == 422
-    
-    def test_submit_job_invalid_source_type(self, client):
-        """Test job submission with invalid source_type."""
-        payload = {
-            "source_type": "invalid_type",
-            "content": "Some job description",
-        }
+        mock_scrape.side_effect = scrape
         
-        response = client.post("/api/v1/jobs", json=payload)
+        responses = await asyncio.gather(
+            *(
+                async_client.post("/api/v1/jobs", json={"source_type": "linkedin_url", "url": url})
+                for url in errors
+            )
+        )
         
-        assert response.status_code == 422
+        assert [response.status_code for response in responses] == [400] * len(errors)
+        assert [response.json()["detail"]["error"] for response in responses] == [
+            error_code for _, error_code in _SCRAPE_ERRORS
+        ]
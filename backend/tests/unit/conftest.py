@@ -0,0 +1,104 @@
+"""Unit test fixtures."""
+
+from unittest.mock import Mock
+
+import pytest
+from azure.cosmos import exceptions
+
+
+async def _async_items(items):
+    """Yield items like a page of the async SDK's query pager."""
+    for item in items:
+        yield item
+
+
+class _FakeItemPaged:
+    """Query result serving items as a single page, like ``AsyncItemPaged``."""
+
+    def __init__(self, items):
+        self._items = items
+        self.continuation_token = None
+
+    def by_page(self, continuation_token=None):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._items is None:
+            raise StopAsyncIteration
+        items, self._items = self._items, None
+        return _async_items(items)
+
+
+class FakeContainer:
+    """
+    Dict-backed stand-in for the async Cosmos container proxy.
+
+    Items are stored by (partition key, id). Queries ignore the SQL text and
+    return every item of the requested partition.
+    """
+
+    def __init__(self):
+        self.items: dict[tuple[str, str], dict] = {}
+
+    def put(self, doc: dict) -> None:
+        """Store a document as if it had been written earlier."""
+        self.items[(doc["userId"], doc["id"])] = doc
+
+    def clear(self) -> None:
+        self.items.clear()
+
+    async def read(self, **kwargs):
+        return {"id": "fake-container"}
+
+    async def create_item(self, body, **kwargs):
+        key = (body["userId"], body["id"])
+        if key in self.items:
+            raise exceptions.CosmosResourceExistsError(status_code=409, message="Conflict")
+        self.items[key] = body
+        return None  # no_response_on_write
+
+    async def read_item(self, item, partition_key, **kwargs):
+        try:
+            return self.items[(partition_key, item)]
+        except KeyError:
+            raise exceptions.CosmosResourceNotFoundError(status_code=404, message="Not found")
+
+    async def delete_item(self, item, partition_key, **kwargs):
+        if self.items.pop((partition_key, item), None) is None:
+            raise exceptions.CosmosResourceNotFoundError(status_code=404, message="Not found")
+
+    async def execute_item_batch(self, batch_operations, partition_key, **kwargs):
+        results = []
+        for operation, args in batch_operations:
+            assert operation == "create", f"unsupported batch operation: {operation}"
+            await self.create_item(body=args[0])
+            results.append({"statusCode": 201})
+        return results
+
+    def query_items(self, query, partition_key=None, **kwargs):
+        return _FakeItemPaged(
+            [doc for (pk, _), doc in self.items.items() if partition_key in (None, pk)]
+        )
+
+
+@pytest.fixture(scope="session")
+def fake_container():
+    """Fake Cosmos container shared by the session; emptied after each test."""
+    return FakeContainer()
+
+
+@pytest.fixture(scope="session")
+def mock_container(fake_container):
+    """The fake container wrapped in a Mock, to assert on and override calls."""
+    return Mock(wraps=fake_container)
+
+
+@pytest.fixture(autouse=True)
+def _reset_container(fake_container, mock_container):
+    """Clear the fake's items and the mock's calls and overrides after each test."""
+    yield
+    fake_container.clear()
+    mock_container.reset_mock(return_value=True, side_effect=True)
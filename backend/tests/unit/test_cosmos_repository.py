@@ -1,26 +1,172 @@
 """Unit tests for Cosmos DB repository."""
 
+import asyncio
+import importlib.util
 import uuid
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from azure.cosmos import exceptions
 
 from app.models.cosmos_models import AnalysisDocument, CVDocument, DocumentType, JobDocument
-from app.models.domain import AnalysisResult, SkillMatch
-from app.repositories.cosmos_repository import CosmosDBRepository
+from app.models.domain import AnalysisResult
+from app.repositories.cosmos_repository import CosmosDBRepository, _PooledAioHttpTransport
 
 
-@pytest.fixture
-def mock_container():
-    """Create mock Cosmos DB container."""
-    container = MagicMock()
-    container.create_item = MagicMock()
-    container.read_item = MagicMock()
-    container.delete_item = MagicMock()
-    container.query_items = MagicMock()
-    return container
+# Keep the repository tests on one xdist worker under --dist=loadgroup, so
+# they share its session fixtures and imports
+pytestmark = pytest.mark.xdist_group("cosmos-repo")
+
+# Canned SDK errors for side effects; the SDK parses a response in __init__
+_NOT_FOUND = exceptions.CosmosResourceNotFoundError(status_code=404, message="Not found")
+_SERVER_ERROR = exceptions.CosmosHttpResponseError(status_code=500, message="Internal error")
+
+# Canned documents, built once at import with a fixed timestamp
+_FROZEN_ISO = "2024-01-01T00:00:00"
+
+_CV_DOC = {
+    "id": "cv-456",
+    "userId": "user-123",
+    "type": "cv",
+    "filename": "resume.pdf",
+    "content": "# CV Content",
+    "characterCount": 12,
+    "createdAt": _FROZEN_ISO,
+    "updatedAt": _FROZEN_ISO,
+}
+
+_JOB_DOC = {
+    "id": "job-456",
+    "userId": "user-123",
+    "type": "job",
+    "title": "Senior Python Developer",
+    "content": "Job content",
+    "sourceType": "manual",
+    "sourceUrl": None,
+    "characterCount": 11,
+    "createdAt": _FROZEN_ISO,
+    "updatedAt": _FROZEN_ISO,
+}
+
+_ANALYSIS_DOC = {
+    "id": "analysis-456",
+    "userId": "user-123",
+    "type": "analysis",
+    "cvId": "cv-123",
+    "jobId": "job-123",
+    "cvMarkdown": "# CV Content",
+    "jobDescription": "Job content",
+    "overallScore": 85.5,
+    "skillMatches": [],
+    "experienceMatch": {},
+    "educationMatch": {},
+    "strengths": ["Python"],
+    "gaps": [],
+    "recommendations": [],
+    "createdAt": _FROZEN_ISO,
+    "updatedAt": _FROZEN_ISO,
+}
+
+_ANALYSIS_DOC_1 = {
+    "id": "analysis-1",
+    "userId": "user-123",
+    "type": "analysis",
+    "cvId": "cv-1",
+    "jobId": "job-1",
+    "cvMarkdown": "# CV One",
+    "jobDescription": "Job one",
+    "overallScore": 85.0,
+    "skillMatches": [],
+    "experienceMatch": {},
+    "educationMatch": {},
+    "strengths": [],
+    "gaps": [],
+    "recommendations": [],
+    "createdAt": _FROZEN_ISO,
+    "updatedAt": _FROZEN_ISO,
+}
+
+_ANALYSIS_DOC_2 = {
+    "id": "analysis-2",
+    "userId": "user-123",
+    "type": "analysis",
+    "cvId": "cv-2",
+    "jobId": "job-2",
+    "cvMarkdown": "# CV Two",
+    "jobDescription": "Job two",
+    "overallScore": 75.0,
+    "skillMatches": [],
+    "experienceMatch": {},
+    "educationMatch": {},
+    "strengths": [],
+    "gaps": [],
+    "recommendations": [],
+    "createdAt": _FROZEN_ISO,
+    "updatedAt": _FROZEN_ISO,
+}
+
+_ANALYSIS_SUMMARY_1 = {
+    "id": "analysis-1",
+    "cvId": "cv-1",
+    "jobId": "job-1",
+    "sourceType": "manual",
+    "overallScore": 85.0,
+    "createdAt": _FROZEN_ISO,
+}
+
+
+async def _async_items(items):
+    """Yield items like a page of the async SDK's query pager."""
+    for item in items:
+        yield item
+
+
+class _AsyncPages:
+    """Page iterator like the async SDK's ``by_page()`` result."""
+
+    def __init__(self, items, continuation_token):
+        self._pages = [items]
+        self.continuation_token = continuation_token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._pages:
+            raise StopAsyncIteration
+        return _async_items(self._pages.pop(0))
+
+
+def _query_result(items, continuation_token=None):
+    """Build a query_items result serving items as a single page."""
+    result = MagicMock()
+    result.by_page.return_value = _AsyncPages(items, continuation_token)
+    return result
+
+
+@pytest.fixture(scope="session")
+def sample_analysis_result():
+    """Analysis result shared by the write tests; the repository only reads it."""
+    return AnalysisResult(
+        id="analysis-test",
+        overall_score=85.5,
+        skill_matches=[
+            {
+                "skill_name": "Python",
+                "required": True,
+                "candidate_has": True,
+                "proficiency_level": "Expert",
+                "years_experience": 5.0,
+                "match_score": 0.95,
+            }
+        ],
+        experience_match={"years": 5, "required": 3},
+        education_match={"degree": "Bachelor"},
+        strengths=["Strong Python"],
+        gaps=["Limited Docker"],
+        recommendations=["Learn Docker"],
+    )
 
 
 @pytest.fixture
@@ -43,7 +189,21 @@ class TestCosmosDBRepository:
         # IDs should be unique
         assert cv_id != job_id
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ("\n\n  ## Senior C# Developer  \r\nDetails", "Senior C# Developer"),
+            ("**Staff Engineer**", "Staff Engineer"),
+            ("Backend Engineer", "Backend Engineer"),
+            ("   \n\t\n", "Job Description"),
+            ("###\nBody", "Job Description"),
+            ("x" * 150, "x" * 97 + "..."),
+        ],
+    )
+    def test_extract_job_title(self, repository, content, expected):
+        """Test the first non-blank line becomes the job title."""
+        assert repository._extract_job_title(content) == expected
+
     async def test_create_cv_success(self, repository, mock_container):
         """Test successful CV creation."""
         user_id = "user-123"
@@ -62,17 +222,13 @@ class TestCosmosDBRepository:
         assert doc['type'] == DocumentType.CV.value
         assert doc['characterCount'] == len(content)
 
-    @pytest.mark.asyncio
     async def test_create_cv_cosmos_error(self, repository, mock_container):
         """Test CV creation with Cosmos DB error."""
-        mock_container.create_item.side_effect = exceptions.CosmosHttpResponseError(
-            status_code=500, message="Internal error"
-        )
+        mock_container.create_item.side_effect = _SERVER_ERROR
         
         with pytest.raises(exceptions.CosmosHttpResponseError):
             await repository.create_cv("user-123", "content")
 
-    @pytest.mark.asyncio
     async def test_create_job_manual(self, repository, mock_container):
         """Test job creation with manual source."""
         user_id = "user-123"
@@ -90,7 +246,6 @@ class TestCosmosDBRepository:
         assert doc['sourceType'] == source_type
         assert doc['sourceUrl'] is None
 
-    @pytest.mark.asyncio
     async def test_create_job_linkedin(self, repository, mock_container):
         """Test job creation with LinkedIn URL."""
         user_id = "user-123"
@@ -104,61 +259,116 @@ class TestCosmosDBRepository:
         doc = mock_container.create_item.call_args.kwargs['body']
         assert doc['sourceUrl'] == source_url
 
-    @pytest.mark.asyncio
-    async def test_create_analysis(self, repository, mock_container):
+    async def test_create_analysis(
+        self, repository, fake_container, mock_container, sample_analysis_result
+    ):
         """Test analysis creation."""
         user_id = "user-123"
-        cv_id = "cv-456"
-        job_id = "job-789"
-        
-        # Create mock analysis result
-        result = AnalysisResult(
-            id="analysis-test",
-            overall_score=85.5,
-            skill_matches=[
-                SkillMatch(
-                    skill_name="Python",
-                    required=True,
-                    candidate_has=True,
-                    proficiency_level="Expert",
-                    years_experience=5.0,
-                    match_score=0.95,
-                )
-            ],
-            experience_match={"years": 5, "required": 3},
-            education_match={"degree": "Bachelor"},
-            strengths=["Strong Python"],
-            gaps=["Limited Docker"],
-            recommendations=["Learn Docker"],
-        )
         
-        analysis_id = await repository.create_analysis(user_id, cv_id, job_id, result)
+        analysis_id = await repository.create_analysis(
+            user_id=user_id,
+            cv_markdown="# John Doe\n\nExperience: 5 years Python",
+            job_description="Senior Python Developer needed",
+            source_type="linkedin_url",
+            source_url="https://www.linkedin.com/jobs/view/123456789",
+            result=sample_analysis_result,
+            cv_id="cv-456",
+            job_id="job-789",
+        )
         
         assert analysis_id.startswith("analysis-")
         mock_container.create_item.assert_called_once()
         
-        doc = mock_container.create_item.call_args.kwargs['body']
+        doc = fake_container.items[(user_id, analysis_id)]
+        assert doc['id'] == analysis_id
         assert doc['userId'] == user_id
-        assert doc['cvId'] == cv_id
-        assert doc['jobId'] == job_id
+        assert doc['type'] == "analysis"
+        assert doc['cvId'] == "cv-456"
+        assert doc['jobId'] == "job-789"
+        assert doc['cvMarkdown'] == "# John Doe\n\nExperience: 5 years Python"
+        assert doc['jobDescription'] == "Senior Python Developer needed"
+        assert doc['sourceType'] == "linkedin_url"
+        assert doc['sourceUrl'] == "https://www.linkedin.com/jobs/view/123456789"
         assert doc['overallScore'] == 85.5
-        assert len(doc['skillMatches']) == 1
+        assert doc['skillMatches'] == sample_analysis_result.skill_matches
+
+    async def test_create_analysis_bundle(self, repository, mock_container, sample_analysis_result):
+        """Test CV, job and analysis are written in one partition batch."""
+        user_id = "user-123"
+        result = sample_analysis_result
+
+        cv_id, job_id, analysis_id = await repository.create_analysis_bundle(
+            user_id=user_id,
+            cv_markdown="# John Doe\n\nExperience: 5 years Python",
+            job_description="Senior Python Developer needed",
+            source_type="manual",
+            source_url=None,
+            result=result,
+        )
+
+        assert cv_id.startswith("cv-")
+        assert job_id.startswith("job-")
+        assert analysis_id.startswith("analysis-")
+        mock_container.create_item.assert_not_called()
+        mock_container.execute_item_batch.assert_called_once()
+
+        call_kwargs = mock_container.execute_item_batch.call_args.kwargs
+        assert call_kwargs["partition_key"] == user_id
+        operations = call_kwargs["batch_operations"]
+        assert [op for op, _ in operations] == ["create", "create", "create"]
+        cv_doc, job_doc, analysis_doc = (args[0] for _, args in operations)
+        assert cv_doc["id"] == cv_id
+        assert job_doc["id"] == job_id
+        assert analysis_doc["id"] == analysis_id
+        assert analysis_doc["cvId"] == cv_id
+        assert analysis_doc["jobId"] == job_id
+        assert analysis_doc["overallScore"] == 85.5
+
+    async def test_create_analysis_bundle_too_large_for_batch(
+        self, repository, mock_container, sample_analysis_result
+    ):
+        """Test an oversized bundle falls back to individual writes."""
+        mock_container.execute_item_batch.side_effect = exceptions.CosmosHttpResponseError(
+            status_code=413, message="Request size is too large"
+        )
+        result = sample_analysis_result
 
-    @pytest.mark.asyncio
-    async def test_get_cv_by_id_success(self, repository, mock_container):
+        cv_id, job_id, analysis_id = await repository.create_analysis_bundle(
+            user_id="user-123",
+            cv_markdown="# John Doe",
+            job_description="Senior Python Developer needed",
+            source_type="manual",
+            source_url=None,
+            result=result,
+        )
+
+        written = [call.kwargs["body"] for call in mock_container.create_item.call_args_list]
+        assert [doc["id"] for doc in written] == [cv_id, job_id, analysis_id]
+        assert written[2]["cvId"] == cv_id
+        assert written[2]["jobId"] == job_id
+
+    async def test_save_many_batches_by_partition(self, repository, mock_container):
+        """Test save_many groups anonymous analyses into batch requests."""
+        results = [AnalysisResult(overall_score=float(score)) for score in range(5)]
+
+        analysis_ids = await repository.save_many(results, batch_size=2)
+
+        assert analysis_ids == [result.id for result in results]
+        mock_container.create_item.assert_not_called()
+        assert mock_container.execute_item_batch.call_count == 3
+
+        batched_ids = []
+        for call in mock_container.execute_item_batch.call_args_list:
+            assert call.kwargs["partition_key"] == "anonymous"
+            batched_ids.extend(args[0]["id"] for _, args in call.kwargs["batch_operations"])
+        assert sorted(batched_ids) == sorted(analysis_ids)
+
+    async def test_get_cv_by_id_success(self, repository, mock_container, fake_container):
         """Test successful CV retrieval."""
         user_id = "user-123"
         cv_id = "cv-456"
         
-        mock_container.read_item.return_value = {
-            "id": cv_id,
-            "userId": user_id,
-            "type": "cv",
-            "content": "# CV Content",
-            "characterCount": 12,
-            "createdAt": datetime.utcnow().isoformat(),
-            "updatedAt": datetime.utcnow().isoformat(),
-        }
+        fake_container.put(_CV_DOC)
         
         cv = await repository.get_cv_by_id(user_id, cv_id)
         
@@ -167,63 +377,34 @@ class TestCosmosDBRepository:
         assert cv.userId == user_id
         mock_container.read_item.assert_called_once_with(item=cv_id, partition_key=user_id)
 
-    @pytest.mark.asyncio
     async def test_get_cv_by_id_not_found(self, repository, mock_container):
         """Test CV retrieval when not found."""
-        mock_container.read_item.side_effect = exceptions.CosmosResourceNotFoundError(
-            status_code=404, message="Not found"
-        )
+        mock_container.read_item.side_effect = _NOT_FOUND
         
         cv = await repository.get_cv_by_id("user-123", "cv-nonexistent")
         
         assert cv is None
 
-    @pytest.mark.asyncio
-    async def test_get_job_by_id_success(self, repository, mock_container):
+    async def test_get_job_by_id_success(self, repository, mock_container, fake_container):
         """Test successful job retrieval."""
         user_id = "user-123"
         job_id = "job-456"
         
-        mock_container.read_item.return_value = {
-            "id": job_id,
-            "userId": user_id,
-            "type": "job",
-            "content": "Job content",
-            "sourceType": "manual",
-            "sourceUrl": None,
-            "characterCount": 11,
-            "createdAt": datetime.utcnow().isoformat(),
-            "updatedAt": datetime.utcnow().isoformat(),
-        }
+        fake_container.put(_JOB_DOC)
         
         job = await repository.get_job_by_id(user_id, job_id)
         
         assert job is not None
         assert job.id == job_id
+        assert job.title == "Senior Python Developer"
         assert job.sourceType == "manual"
 
-    @pytest.mark.asyncio
-    async def test_get_analysis_by_id_success(self, repository, mock_container):
+    async def test_get_analysis_by_id_success(self, repository, mock_container, fake_container):
         """Test successful analysis retrieval."""
         user_id = "user-123"
         analysis_id = "analysis-456"
         
-        mock_container.read_item.return_value = {
-            "id": analysis_id,
-            "userId": user_id,
-            "type": "analysis",
-            "cvId": "cv-123",
-            "jobId": "job-123",
-            "overallScore": 85.5,
-            "skillMatches": [],
-            "experienceMatch": {},
-            "educationMatch": {},
-            "strengths": [],
-            "gaps": [],
-            "recommendations": [],
-            "createdAt": datetime.utcnow().isoformat(),
-            "updatedAt": datetime.utcnow().isoformat(),
-        }
+        fake_container.put(_ANALYSIS_DOC)
         
         analysis = await repository.get_analysis_by_id(user_id, analysis_id)
         
@@ -231,56 +412,114 @@ class TestCosmosDBRepository:
         assert analysis.id == analysis_id
         assert analysis.overallScore == 85.5
 
-    @pytest.mark.asyncio
-    async def test_list_analyses(self, repository, mock_container):
+    async def test_analysis_text_compressed_round_trip(self, repository, mock_container):
+        """Test large CV and job text are stored compressed and read back intact."""
+        cv_markdown = "# John Doe\n\n" + "- Built scalable APIs with FastAPI\n" * 200
+        job_description = "Senior Python Developer\n\n" + "Requirements: Python, Azure\n" * 200
+
+        analysis_id = await repository.create_analysis(
+            "user-123", cv_markdown, job_description, "manual", None, AnalysisResult(overall_score=85.5)
+        )
+
+        stored = mock_container.create_item.call_args.kwargs["body"]
+        assert stored["contentEncoding"] == "zlib+b64"
+        assert len(stored["cvMarkdown"]) < len(cv_markdown) // 3
+
+        analysis = await repository.get_analysis_by_id("user-123", analysis_id)
+
+        assert analysis.cvMarkdown == cv_markdown
+        assert analysis.jobDescription == job_description
+        assert analysis.contentEncoding is None
+
+    async def test_warm_up_tolerates_errors(self, repository, mock_container):
+        """Test warm_up reads container metadata and does not raise on failure."""
+        mock_container.read.side_effect = exceptions.CosmosHttpResponseError(
+            status_code=503, message="Unavailable"
+        )
+
+        await repository.warm_up()
+
+        mock_container.read.assert_called_once()
+
+    async def test_get_by_id_point_read(self, repository, mock_container, fake_container):
+        """Test get_by_id reads the item within the user's partition."""
+        fake_container.put(_ANALYSIS_DOC)
+
+        result = await repository.get_by_id("analysis-456", "user-123")
+
+        assert isinstance(result, AnalysisResult)
+        assert result.id == "analysis-456"
+        assert result.overall_score == 85.5
+        assert result.strengths == ["Python"]
+        mock_container.read_item.assert_called_once_with(
+            item="analysis-456", partition_key="user-123"
+        )
+        mock_container.query_items.assert_not_called()
+
+    async def test_get_by_id_not_found(self, repository, mock_container):
+        """Test get_by_id returns None when the item does not exist."""
+        mock_container.read_item.side_effect = _NOT_FOUND
+
+        assert await repository.get_by_id("analysis-missing", "user-123") is None
+
+    async def test_list_analyses(self, repository, mock_container, fake_container):
         """Test listing analyses for a user."""
         user_id = "user-123"
         
-        mock_container.query_items.return_value = [
-            {
-                "id": "analysis-1",
-                "userId": user_id,
-                "type": "analysis",
-                "cvId": "cv-1",
-                "jobId": "job-1",
-                "overallScore": 85.0,
-                "skillMatches": [],
-                "experienceMatch": {},
-                "educationMatch": {},
-                "strengths": [],
-                "gaps": [],
-                "recommendations": [],
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat(),
-            },
-            {
-                "id": "analysis-2",
-                "userId": user_id,
-                "type": "analysis",
-                "cvId": "cv-2",
-                "jobId": "job-2",
-                "overallScore": 75.0,
-                "skillMatches": [],
-                "experienceMatch": {},
-                "educationMatch": {},
-                "strengths": [],
-                "gaps": [],
-                "recommendations": [],
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat(),
-            },
-        ]
-        
-        analyses = await repository.list_analyses(user_id, limit=10, offset=0)
+        # Served by the fake's pager, which streams each page through a
+        # one-shot async generator like the SDK
+        fake_container.put(_ANALYSIS_DOC_1)
+        fake_container.put(_ANALYSIS_DOC_2)
+        fake_container.put({**_ANALYSIS_DOC_1, "id": "analysis-3", "userId": "user-456"})
+        
+        analyses, continuation_token = await repository.list_analyses(user_id, limit=10)
         
+        assert continuation_token is None
         assert len(analyses) == 2
         assert analyses[0].id == "analysis-1"
         assert analyses[1].id == "analysis-2"
         mock_container.query_items.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_delete_cv_success(self, repository, mock_container):
+    async def test_list_analyses_summary(self, repository, mock_container):
+        """Test listing analysis summaries projects only summary fields."""
+        user_id = "user-123"
+
+        mock_container.query_items.return_value = _query_result(
+            [_ANALYSIS_SUMMARY_1], continuation_token="token-2"
+        )
+
+        summaries, continuation_token = await repository.list_analyses_summary(
+            user_id, limit=10, continuation_token="token-1"
+        )
+
+        assert continuation_token == "token-2"
+        mock_container.query_items.return_value.by_page.assert_called_once_with("token-1")
+        assert mock_container.query_items.call_args.kwargs["max_item_count"] == 10
+        assert len(summaries) == 1
+        assert summaries[0].id == "analysis-1"
+        assert summaries[0].overallScore == 85.0
+        query = mock_container.query_items.call_args.kwargs["query"]
+        assert "SELECT *" not in query
+        assert "OFFSET" not in query
+        assert mock_container.query_items.call_args.kwargs["partition_key"] == user_id
+        assert mock_container.query_items.call_args.kwargs["throughput_bucket"] == 1
+
+    async def test_get_analysis_bundle_skips_empty_ids(self, repository, mock_container, fake_container):
+        """Test get_analysis_bundle reads only the referenced documents."""
+        fake_container.put(_CV_DOC)
+
+        cv_doc, job_doc, analysis_doc = await repository.get_analysis_bundle(
+            "user-123", "cv-456", ""
+        )
+
+        assert cv_doc.filename == "resume.pdf"
+        assert job_doc is None
+        assert analysis_doc is None
+        mock_container.read_item.assert_called_once_with(item="cv-456", partition_key="user-123")
+
+    async def test_delete_cv_success(self, repository, mock_container, fake_container):
         """Test successful CV deletion."""
+        fake_container.put({"id": "cv-456", "userId": "user-123", "type": "cv"})
         result = await repository.delete_cv("user-123", "cv-456")
         
         assert result is True
@@ -288,28 +527,25 @@ class TestCosmosDBRepository:
             item="cv-456", partition_key="user-123"
         )
 
-    @pytest.mark.asyncio
     async def test_delete_cv_not_found(self, repository, mock_container):
         """Test CV deletion when not found."""
-        mock_container.delete_item.side_effect = exceptions.CosmosResourceNotFoundError(
-            status_code=404, message="Not found"
-        )
+        mock_container.delete_item.side_effect = _NOT_FOUND
         
         result = await repository.delete_cv("user-123", "cv-nonexistent")
         
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_delete_job_success(self, repository, mock_container):
+    async def test_delete_job_success(self, repository, mock_container, fake_container):
         """Test successful job deletion."""
+        fake_container.put({"id": "job-456", "userId": "user-123", "type": "job"})
         result = await repository.delete_job("user-123", "job-456")
         
         assert result is True
         mock_container.delete_item.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_delete_analysis_success(self, repository, mock_container):
+    async def test_delete_analysis_success(self, repository, mock_container, fake_container):
         """Test successful analysis deletion."""
+        fake_container.put({"id": "analysis-456", "userId": "user-123", "type": "analysis"})
         result = await repository.delete_analysis("user-123", "analysis-456")
         
         assert result is True
@@ -322,14 +558,13 @@ class TestCosmosDBRepositoryFactory:
     @patch("app.repositories.cosmos_repository.CosmosClient.from_connection_string")
     def test_create_from_settings_with_account_key(self, mock_client_class):
         """Test repository creation with connection string."""
-        from app.config import Settings
-        
-        # Mock settings
-        settings = Mock(spec=Settings)
-        settings.is_cosmos_enabled = True
-        settings.cosmos_connection_string = "AccountEndpoint=https://test.documents.azure.com:443/;AccountKey=test123=="
-        settings.cosmos_database_name = "test-db"
-        settings.cosmos_container_name = "test-container"
+        # Only the attributes the factory reads
+        settings = SimpleNamespace(
+            is_cosmos_enabled=True,
+            cosmos_connection_string="AccountEndpoint=https://test.documents.azure.com:443/;AccountKey=test123==",
+            cosmos_database_name="test-db",
+            cosmos_container_name="test-container",
+        )
         
         # Mock Cosmos client chain
         mock_client = MagicMock()
@@ -345,14 +580,87 @@ class TestCosmosDBRepositoryFactory:
         
         assert repo is not None
         assert repo.container == mock_container
-        mock_client_class.assert_called_once_with(settings.cosmos_connection_string)
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args.args == (settings.cosmos_connection_string,)
+        assert isinstance(mock_client_class.call_args.kwargs["transport"], _PooledAioHttpTransport)
+        assert mock_client_class.call_args.kwargs["no_response_on_write"] is True
+
+    @patch("app.repositories.cosmos_repository.CosmosClient.from_connection_string")
+    async def test_create_from_settings_with_shared_client(self, mock_client_class):
+        """Test repository creation binds the container on an injected client."""
+        settings = SimpleNamespace(
+            is_cosmos_enabled=True,
+            cosmos_database_name="test-db",
+            cosmos_container_name="test-container",
+        )
+
+        shared_client = MagicMock()
+        shared_client.close = AsyncMock()
+        mock_container = MagicMock()
+        shared_client.get_database_client.return_value.get_container_client.return_value = mock_container
+
+        repo = CosmosDBRepository.create_from_settings(settings, client=shared_client)
+        await repo.close()
+
+        assert repo.container == mock_container
+        mock_client_class.assert_not_called()
+        # The shared client belongs to the application, not the repository
+        shared_client.close.assert_not_called()
+
+    async def test_pooled_transport_opens_tuned_session(self):
+        """Test the transport builds its session on a tuned connection pool."""
+        transport = _PooledAioHttpTransport()
+
+        await transport.open()
+        try:
+            connector = transport.session.connector
+            assert connector.limit == 200
+            assert connector.limit_per_host == 100
+        finally:
+            await transport.close()
 
     def test_create_from_settings_not_enabled(self):
         """Test repository creation when Cosmos DB not enabled."""
-        from app.config import Settings
-        
-        settings = Mock(spec=Settings)
-        settings.is_cosmos_enabled = False
+        settings = SimpleNamespace(is_cosmos_enabled=False)
         
         with pytest.raises(ValueError, match="Cosmos DB is not configured"):
             CosmosDBRepository.create_from_settings(settings)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None, reason="pytest-benchmark not installed"
+)
+class TestCosmosDBRepositoryBenchmarks:
+    """
+    Microbenchmarks of the repository's serialization hot paths.
+
+    The repository talks to the fake container directly, so call recording
+    neither skews the timings nor grows across rounds. Each round runs on a
+    dedicated event loop that is created once, keeping loop setup out of the
+    measurement. Run only these with ``pytest --benchmark-only``.
+    """
+
+    @pytest.fixture
+    def run(self):
+        loop = asyncio.new_event_loop()
+        yield loop.run_until_complete
+        loop.close()
+
+    def test_create_cv_perf(self, benchmark, run, fake_container):
+        """Benchmark building and writing a CV document."""
+        repository = CosmosDBRepository(fake_container)
+        content = "c" * 10_000
+
+        cv_id = benchmark(lambda: run(repository.create_cv("user-123", content)))
+
+        assert ("user-123", cv_id) in fake_container.items
+
+    def test_list_analyses_perf(self, benchmark, run, fake_container):
+        """Benchmark decoding and validating a page of 100 analyses."""
+        repository = CosmosDBRepository(fake_container)
+        for i in range(100):
+            fake_container.put({**_ANALYSIS_DOC, "id": f"analysis-{i}"})
+
+        analyses, _ = benchmark(lambda: run(repository.list_analyses("user-123", limit=100)))
+
+        assert len(analyses) == 100
@@ -5,9 +5,14 @@ Note: These tests use mocked Playwright to avoid actual web requests.
 Integration tests with real LinkedIn should be run in staging only.
 """
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from unittest.mock import AsyncMock, MagicMock
 
+from app.services import linkedin_scraper
 from app.services.linkedin_scraper import (
     AntiBotDetected,
     ContentNotFound,
@@ -17,171 +22,275 @@ from app.services.linkedin_scraper import (
 )
 
 
+_SAMPLE_URL = "https://www.linkedin.com/jobs/view/123456789/"
+
+# In-page lookup result for a job description found on the page
+_DESCRIPTION = {
+    "selector": ".description__text",
+    "text": "This is a sample job description with more than 100 characters to meet the minimum content length requirement.",
+}
+
+
+@pytest.fixture(autouse=True)
+def shared_browser(monkeypatch):
+    """Give each test its own shared-browser holder."""
+    holder = linkedin_scraper._SharedBrowser()
+    monkeypatch.setattr(linkedin_scraper, "_shared_browser", holder)
+    return holder
+
+
 @pytest.fixture
-async def scraper():
-    """Create LinkedIn scraper instance."""
-    service = LinkedInScraperService(timeout=15000)
-    yield service
-    await service.close()
+def mock_pw_stack(monkeypatch):
+    """
+    Mock Playwright stack: playwright, browser, context and page.
+    
+    Launching goes through the patched ``async_playwright``, and every
+    context and page created is the same mock. The page loads, finds a job
+    description and no anti-bot challenge; tests override what differs.
+    """
+    page = AsyncMock()
+    page.is_closed = MagicMock(return_value=False)
+    page.wait_for_function = AsyncMock()
+    page.evaluate = AsyncMock(return_value=_DESCRIPTION)  # No CAPTCHA
+    
+    context = AsyncMock()
+    context.new_page = AsyncMock(return_value=page)
+    page.context = context
+    
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.new_context = AsyncMock(return_value=context)
+    browser.close = AsyncMock()
+    context.browser = browser
+    
+    playwright = AsyncMock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+    async_playwright = MagicMock()
+    async_playwright.return_value.start = AsyncMock(return_value=playwright)
+    monkeypatch.setattr(linkedin_scraper, "async_playwright", async_playwright)
+    
+    return SimpleNamespace(playwright=playwright, browser=browser, context=context, page=page)
+
+
+@pytest.fixture(scope="class")
+def scraper():
+    """Create a LinkedIn scraper instance shared by the test class."""
+    return LinkedInScraperService(timeout=15000)
+
+
+@pytest.fixture(autouse=True)
+async def _reset_scraper(scraper):
+    """Close the shared scraper after each test and undo the test's changes to it."""
+    pool_size = scraper.pool_size
+    yield
+    await scraper.close()
+    scraper.pool_size = pool_size
+    scraper._cache.clear()
+    scraper._in_flight.clear()
 
 
-@pytest.mark.asyncio
 class TestLinkedInScraperService:
     """Test cases for LinkedInScraperService."""
     
-    async def test_initialize_browser(self, scraper):
+    async def test_initialize_browser(self, scraper, mock_pw_stack):
         """Test browser initialization."""
-        with patch("app.services.linkedin_scraper.async_playwright") as mock_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_playwright_instance)
-            
-            mock_browser = AsyncMock()
-            mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-            
-            await scraper.initialize()
-            
-            assert scraper.browser is not None
-            mock_playwright_instance.chromium.launch.assert_called_once()
-    
-    async def test_scrape_job_description_success(self, scraper):
+        await scraper.initialize()
+        
+        assert scraper.browser is mock_pw_stack.browser
+        mock_pw_stack.playwright.chromium.launch.assert_called_once()
+        args = mock_pw_stack.playwright.chromium.launch.call_args.kwargs["args"]
+        assert {"--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"} <= set(args)
+    
+    async def test_scrape_job_description_success(self, scraper, mock_pw_stack):
         """Test successful job description scraping."""
-        with patch("app.services.linkedin_scraper.async_playwright") as mock_playwright:
-            # Setup mocks
-            mock_playwright_instance = AsyncMock()
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_playwright_instance)
-            
-            mock_browser = AsyncMock()
-            mock_page = AsyncMock()
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-            
-            # Mock page navigation and content extraction
-            mock_page.goto = AsyncMock()
-            mock_page.wait_for_selector = AsyncMock()
-            mock_page.evaluate = AsyncMock(return_value="This is a sample job description with more than 100 characters to meet the minimum content length requirement.")
-            mock_page.query_selector = AsyncMock(return_value=None)  # No CAPTCHA
-            mock_page.close = AsyncMock()
-            
-            scraper.browser = mock_browser
-            scraper.playwright = mock_playwright_instance
-            
-            url = "https://www.linkedin.com/jobs/view/123456789/"
-            result = await scraper.scrape_job_description(url)
-            
-            assert len(result) > 100
-            assert "sample job description" in result
-            mock_page.goto.assert_called_once()
-            mock_page.close.assert_called_once()
-    
-    async def test_scrape_job_description_page_timeout(self, scraper):
+        scraper.browser = mock_pw_stack.browser
+        
+        url = _SAMPLE_URL
+        result = await scraper.scrape_job_description(url)
+        
+        assert len(result) > 100
+        assert "sample job description" in result
+        mock_pw_stack.page.goto.assert_any_await(url, timeout=15000, wait_until="commit")
+        mock_pw_stack.context.close.assert_not_called()  # Page returned to the pool
+    
+    async def test_scrape_job_description_page_timeout(self, scraper, mock_pw_stack):
         """Test scraping fails with page load timeout."""
-        with patch("app.services.linkedin_scraper.async_playwright") as mock_playwright:
-            from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-            
-            mock_playwright_instance = AsyncMock()
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_playwright_instance)
-            
-            mock_browser = AsyncMock()
-            mock_page = AsyncMock()
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-            
-            # Mock timeout on page.goto
-            mock_page.goto = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
-            mock_page.close = AsyncMock()
-            
-            scraper.browser = mock_browser
-            scraper.playwright = mock_playwright_instance
-            
-            url = "https://www.linkedin.com/jobs/view/123456789/"
-            
-            with pytest.raises(PageLoadTimeout):
-                await scraper.scrape_job_description(url)
-            
-            mock_page.close.assert_called_once()
-    
-    async def test_scrape_job_description_content_not_found(self, scraper):
+        mock_pw_stack.page.goto.side_effect = PlaywrightTimeoutError("Timeout")
+        scraper.browser = mock_pw_stack.browser
+        
+        url = _SAMPLE_URL
+        
+        with pytest.raises(PageLoadTimeout):
+            await scraper.scrape_job_description(url)
+        
+        mock_pw_stack.context.close.assert_awaited_once()
+    
+    async def test_scrape_job_description_content_not_found(self, scraper, mock_pw_stack):
         """Test scraping fails when content not found."""
-        with patch("app.services.linkedin_scraper.async_playwright") as mock_playwright:
-            from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-            
-            mock_playwright_instance = AsyncMock()
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_playwright_instance)
-            
-            mock_browser = AsyncMock()
-            mock_page = AsyncMock()
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-            
-            mock_page.goto = AsyncMock()
-            # All selectors timeout (content not found)
-            mock_page.wait_for_selector = AsyncMock(side_effect=PlaywrightTimeoutError("Selector timeout"))
-            mock_page.query_selector = AsyncMock(return_value=None)
-            mock_page.close = AsyncMock()
-            
-            scraper.browser = mock_browser
-            scraper.playwright = mock_playwright_instance
-            
-            url = "https://www.linkedin.com/jobs/view/123456789/"
-            
-            with pytest.raises(ContentNotFound):
-                await scraper.scrape_job_description(url)
-            
-            mock_page.close.assert_called_once()
-    
-    async def test_scrape_job_description_anti_bot_detected(self, scraper):
+        # The page loads, but no description selector ever matches
+        mock_pw_stack.page.evaluate.return_value = None
+        scraper.browser = mock_pw_stack.browser
+        
+        url = _SAMPLE_URL
+        
+        with pytest.raises(ContentNotFound):
+            await scraper.scrape_job_description(url)
+        
+        mock_pw_stack.context.close.assert_not_called()
+    
+    async def test_scrape_job_description_anti_bot_detected(self, scraper, mock_pw_stack):
         """Test scraping fails when anti-bot challenge detected."""
-        with patch("app.services.linkedin_scraper.async_playwright") as mock_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_playwright_instance)
-            
-            mock_browser = AsyncMock()
-            mock_page = AsyncMock()
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-            
-            mock_page.goto = AsyncMock()
-            # Mock CAPTCHA element found
-            mock_captcha_element = MagicMock()
-            mock_page.query_selector = AsyncMock(return_value=mock_captcha_element)
-            mock_page.close = AsyncMock()
-            
-            scraper.browser = mock_browser
-            scraper.playwright = mock_playwright_instance
-            
-            url = "https://www.linkedin.com/jobs/view/123456789/"
-            
-            with pytest.raises(AntiBotDetected):
-                await scraper.scrape_job_description(url)
-            
-            mock_page.close.assert_called_once()
-    
-    async def test_is_anti_bot_page_detected(self, scraper):
-        """Test anti-bot page detection."""
-        mock_page = AsyncMock()
-        mock_captcha = MagicMock()
-        mock_page.query_selector = AsyncMock(return_value=mock_captcha)
+        mock_pw_stack.page.evaluate.return_value = {"antiBot": '[id*="captcha"]'}
+        scraper.browser = mock_pw_stack.browser
+        
+        url = _SAMPLE_URL
         
-        result = await scraper._is_anti_bot_page(mock_page)
-        assert result is True
+        with pytest.raises(AntiBotDetected):
+            await scraper.scrape_job_description(url)
+        
+        mock_pw_stack.context.close.assert_not_called()
+    
+    async def test_extract_job_description_single_round_trip(self, scraper):
+        """Test the description and anti-bot checks are made by one in-page lookup."""
+        mock_page = MagicMock()
+        mock_page.evaluate = AsyncMock(return_value={"selector": ".description__text", "text": "Short text"})
+        
+        result = await scraper._extract_job_description(mock_page)
+        
+        assert result == "Short text"
+        mock_page.evaluate.assert_awaited_once()
+        assert mock_page.evaluate.call_args.args[0] == linkedin_scraper._FIND_CONTENT_JS
     
-    async def test_is_anti_bot_page_not_detected(self, scraper):
-        """Test anti-bot page not detected."""
-        mock_page = AsyncMock()
-        mock_page.query_selector = AsyncMock(return_value=None)
+    async def test_extract_job_description_anti_bot_detected(self, scraper):
+        """Test anti-bot page detection."""
+        mock_page = MagicMock()
+        mock_page.evaluate = AsyncMock(return_value={"antiBot": 'iframe[src*="captcha"]'})
         
-        result = await scraper._is_anti_bot_page(mock_page)
-        assert result is False
+        with pytest.raises(AntiBotDetected):
+            await scraper._extract_job_description(mock_page)
     
-    async def test_close_browser(self, scraper):
+    async def test_close_browser(self, scraper, mock_pw_stack):
         """Test browser and playwright cleanup."""
-        mock_browser = AsyncMock()
-        mock_playwright = AsyncMock()
+        await scraper.initialize()
+        
+        await scraper.close()
+        
+        assert scraper.browser is None
+        mock_pw_stack.browser.close.assert_called_once()
+        mock_pw_stack.playwright.stop.assert_called_once()
+    
+    async def test_close_browser_times_out(self, scraper, mock_pw_stack, monkeypatch):
+        """Test a browser that hangs on close does not block shutdown."""
+        monkeypatch.setattr(linkedin_scraper, "_SHUTDOWN_TIMEOUT", 0.01)
+        hung = asyncio.Event()
+        mock_pw_stack.browser.close = AsyncMock(side_effect=hung.wait)
+        await scraper.initialize()
+        
+        await asyncio.wait_for(scraper.close(), timeout=1)
+        
+        mock_pw_stack.playwright.stop.assert_awaited_once()
+        hung.set()  # Let the abandoned close finish
+    
+    async def test_close_survives_dead_playwright(self, scraper, mock_pw_stack):
+        """Test a Playwright driver that fails to stop does not break shutdown."""
+        mock_pw_stack.playwright.stop.side_effect = RuntimeError("driver exited")
+        await scraper.initialize()
+        
+        await scraper.close()
+        
+        mock_pw_stack.browser.close.assert_awaited_once()
+    
+    async def test_scrapers_share_browser(self, scraper, mock_pw_stack):
+        """Test scrapers share one browser, stopped when the last one closes."""
+        other = LinkedInScraperService()
+        await scraper.initialize()
+        await other.initialize()
         
-        scraper.browser = mock_browser
-        scraper.playwright = mock_playwright
+        assert scraper.browser is other.browser is mock_pw_stack.browser
+        mock_pw_stack.playwright.chromium.launch.assert_awaited_once()
         
+        await other.close()
+        mock_pw_stack.browser.close.assert_not_called()
         await scraper.close()
+        mock_pw_stack.browser.close.assert_called_once()
+        mock_pw_stack.playwright.stop.assert_called_once()
+    
+    async def test_page_pool_reuses_pages(self, scraper, mock_pw_stack):
+        """Test consecutive scrapes reuse one pooled page and its context."""
+        scraper.browser = mock_pw_stack.browser
+        scraper.pool_size = 1
+        
+        await scraper.scrape_job_description(_SAMPLE_URL)
+        await scraper.scrape_job_description("https://www.linkedin.com/jobs/view/987654321/")
+        
+        mock_pw_stack.browser.new_context.assert_called_once()
+        mock_pw_stack.context.new_page.assert_called_once()
+        mock_pw_stack.context.route.assert_awaited_once_with("**/*", linkedin_scraper._route_request)
+        # Each scrape's page is blanked before going back to the pool
+        assert [c.args[0] for c in mock_pw_stack.page.goto.call_args_list] == [
+            _SAMPLE_URL,
+            "about:blank",
+            "https://www.linkedin.com/jobs/view/987654321/",
+            "about:blank",
+        ]
+        assert mock_pw_stack.context.clear_cookies.await_count == 2
+        mock_pw_stack.context.close.assert_not_called()
+    
+    @pytest.mark.parametrize(
+        "resource_type, blocked",
+        [("image", True), ("font", True), ("media", True), ("document", False), ("stylesheet", False)],
+    )
+    async def test_scrape_blocks_heavy_resources(self, resource_type, blocked):
+        """Test the context route aborts heavy resource types and continues the rest."""
+        route = AsyncMock()
+        route.request.resource_type = resource_type
+        
+        await linkedin_scraper._route_request(route)
+        
+        assert route.abort.await_count == int(blocked)
+        assert route.continue_.await_count == int(not blocked)
+    
+    async def test_scrape_caches_by_normalized_url(self, scraper, mock_pw_stack):
+        """Test duplicate scrapes share one navigation and later ones hit the cache."""
+        scraper.browser = mock_pw_stack.browser
+        
+        url = _SAMPLE_URL
+        results = await asyncio.gather(
+            scraper.scrape_job_description(url),
+            scraper.scrape_job_description(f"{url}?trackingId=abc"),
+        )
+        cached = await scraper.scrape_job_description(f"{url}#top")
+        
+        assert results[0] == results[1] == cached
+        assert [c.args[0] for c in mock_pw_stack.page.goto.call_args_list] == [url, "about:blank"]
+    
+    async def test_scrape_cache_entries_expire(self, monkeypatch):
+        """Test cached descriptions expire after the TTL and the LRU bound evicts the oldest."""
+        scraper = LinkedInScraperService(cache_size=2, cache_ttl=60)
+        now = 1000.0
+        monkeypatch.setattr(linkedin_scraper.time, "monotonic", lambda: now)
+        
+        scraper._put_cached("a", "A")
+        scraper._put_cached("b", "B")
+        assert scraper._get_cached("a") == "A"
+        scraper._put_cached("c", "C")  # evicts "b", the least recently used
+        
+        assert scraper._get_cached("b") is None
+        now += 60
+        assert scraper._get_cached("a") is None
+        assert scraper._get_cached("c") is None
+    
+    async def test_scrape_timeout_discards_context(self, scraper, mock_pw_stack):
+        """Test a page whose load timed out is not reused, nor is its context."""
+        mock_pw_stack.page.goto.side_effect = PlaywrightTimeoutError("Timeout")
+        scraper.browser = mock_pw_stack.browser
+        scraper.pool_size = 1
+        
+        url = _SAMPLE_URL
+        with pytest.raises(PageLoadTimeout):
+            await scraper.scrape_job_description(url)
+        with pytest.raises(PageLoadTimeout):
+            await scraper.scrape_job_description(url)
         
-        mock_browser.close.assert_called_once()
-        mock_playwright.stop.assert_called_once()
+        assert mock_pw_stack.browser.new_context.await_count == 2
+        assert mock_pw_stack.context.close.await_count == 2
@@ -1,11 +1,17 @@
 """Unit tests for data models."""
 
+from typing import Literal, get_args, get_origin
+
 import pytest
 from pydantic import ValidationError
 
 from app.models.domain import AnalysisResult, CVDocument, JobDescription, SkillMatch
 from app.models.requests import AnalyzeRequest
-from app.models.responses import AnalyzeResponse, HealthCheckResponse
+from app.models.responses import (
+    AnalyzeResponse,
+    HealthCheckResponse,
+    JobSubmissionResponse,
+)
 
 
 class TestSkillMatch:
@@ -64,6 +70,15 @@ class TestAnalysisResult:
                 education_match={},
             )
 
+    def test_analysis_result_new_fills_defaults(self):
+        """Test AnalysisResult.new populates id, timestamp and field defaults."""
+        result = AnalysisResult.new(overall_score=72.0, strengths=["Python"])
+        assert result.id
+        assert result.created_at.tzinfo is not None
+        assert result.partition_key == "analysis"
+        assert result.gaps == []
+        assert result.strengths == ["Python"]
+
 
 class TestAnalyzeRequest:
     """Test AnalyzeRequest model."""
@@ -101,6 +116,9 @@ class TestAnalyzeResponse:
         """Test creating a valid AnalyzeResponse."""
         response = AnalyzeResponse(
             analysis_id="test-id",
+            cv_markdown="# CV",
+            job_description="Job description",
+            source_type="manual",
             overall_score=85.5,
             skill_matches=[],
             experience_match={},
@@ -112,6 +130,34 @@ class TestAnalyzeResponse:
         assert response.overall_score == 85.5
         assert response.analysis_id == "test-id"
 
+    def test_analyze_response_accepts_raw_parser_output(self):
+        """Test non-canonical LLM parser values pass through the match payloads."""
+        response = AnalyzeResponse(
+            analysis_id="test-id",
+            cv_markdown="# CV",
+            job_description="Job description",
+            source_type="manual",
+            overall_score=85.5,
+            skill_matches=[],
+            experience_match={
+                "required_years": "5+",
+                "candidate_years": 6,
+                "alignment_score": 90.0,
+                "match": True,
+            },
+            education_match={
+                "required": ["BSc CS"],
+                "candidate": "BSc Computer Science",
+                "match": True,
+                "score": 100.0,
+            },
+            strengths=[],
+            gaps=[],
+            recommendations=[],
+        )
+        assert response.experience_match["required_years"] == "5+"
+        assert response.education_match["required"] == ["BSc CS"]
+
 
 class TestHealthCheckResponse:
     """Test HealthCheckResponse model."""
@@ -125,3 +171,31 @@ class TestHealthCheckResponse:
         )
         assert response.status == "healthy"
         assert response.version == "1.0.0"
+
+    def test_health_check_response_invalid_status(self):
+        """Test that an unknown status raises validation error."""
+        with pytest.raises(ValidationError):
+            HealthCheckResponse(
+                status="ok",
+                version="1.0.0",
+                service="cv-checker-api",
+            )
+
+
+class TestStatusFieldTypes:
+    """Guard that status-like response fields stay Literal (not str or Enum)."""
+
+    @pytest.mark.parametrize(
+        "model, field_name",
+        [
+            (HealthCheckResponse, "status"),
+            (AnalyzeResponse, "source_type"),
+            (JobSubmissionResponse, "source_type"),
+            (JobSubmissionResponse, "fetch_status"),
+        ],
+    )
+    def test_status_fields_are_literal(self, model, field_name):
+        """Test that the field annotation is a Literal of strings."""
+        annotation = model.model_fields[field_name].annotation
+        assert get_origin(annotation) is Literal
+        assert all(isinstance(value, str) for value in get_args(annotation))
@@ -1,34 +1,36 @@
 """Unit tests for repository implementations."""
 
-import pytest
-
-from app.models.domain import AnalysisResult, SkillMatch
+from app.models.domain import AnalysisResult
 from app.repositories.analysis import InMemoryAnalysisRepository
 
 
 class TestInMemoryAnalysisRepository:
     """Test InMemoryAnalysisRepository."""
 
-    @pytest.mark.asyncio
     async def test_save_returns_id(self, repository):
         """Test that save returns the analysis ID."""
-        result = AnalysisResult(
-            overall_score=85.5,
-            skill_matches=[],
-            experience_match={},
-            education_match={},
-        )
+        data = {
+            "overall_score": 85.5,
+            "skill_matches": [],
+            "experience_match": {},
+            "education_match": {},
+        }
+
+        analysis_id = await repository.save("analysis-123", data)
+        assert analysis_id == "analysis-123"
+
+    async def test_save_many_returns_ids(self, repository):
+        """Test that save_many returns IDs in input order."""
+        results = [AnalysisResult(overall_score=float(score)) for score in range(3)]
 
-        analysis_id = await repository.save(result)
-        assert analysis_id == result.id
+        analysis_ids = await repository.save_many(results, batch_size=2)
+        assert analysis_ids == [result.id for result in results]
 
-    @pytest.mark.asyncio
     async def test_get_by_id_returns_none(self, repository):
         """Test that get_by_id always returns None in v1."""
-        result = await repository.get_by_id("any-id")
+        result = await repository.get_by_id("any-id", "anonymous")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_list_recent_returns_empty(self, repository):
         """Test that list_recent returns empty list in v1."""
         results = await repository.list_recent()
@@ -1,15 +1,15 @@
 """Unit tests for CV Checker service."""
 
-import pytest
+from unittest.mock import AsyncMock, MagicMock
 
 from app.models.domain import AnalysisResult
+from app.repositories.analysis import InMemoryAnalysisRepository
 from app.services.cv_checker import CVCheckerService
 
 
 class TestCVCheckerService:
     """Test CVCheckerService."""
 
-    @pytest.mark.asyncio
     async def test_analyze_cv_returns_result(
         self, service, sample_cv_markdown, sample_job_description
     ):
@@ -24,28 +24,80 @@ class TestCVCheckerService:
         assert isinstance(result.gaps, list)
         assert isinstance(result.recommendations, list)
 
-    @pytest.mark.asyncio
     async def test_analyze_cv_mock_data(
         self, service, sample_cv_markdown, sample_job_description
     ):
-        """Test that mock analysis returns expected data structure."""
+        """Test that the canned agent replies produce the expected analysis."""
         result = await service.analyze_cv(sample_cv_markdown, sample_job_description)
 
-        # Verify mock data structure
-        assert result.overall_score == 85.5
+        # 60% deterministic (3/4 skills, 100% experience) + 40% LLM (80% semantic, 90% soft)
+        assert result.overall_score == 83.5
         assert len(result.skill_matches) > 0
         assert len(result.strengths) > 0
         assert len(result.gaps) > 0
         assert len(result.recommendations) > 0
 
-    @pytest.mark.asyncio
     async def test_get_analysis_returns_none(self, service):
         """Test that get_analysis returns None in v1."""
-        result = await service.get_analysis("any-id")
+        result = await service.get_analysis("any-id", "anonymous")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_list_recent_analyses_returns_empty(self, service):
         """Test that list_recent_analyses returns empty list in v1."""
         results = await service.list_recent_analyses()
         assert results == []
+
+    async def test_analyze_cv_batch_preserves_order(
+        self, sample_cv_markdown, sample_job_description
+    ):
+        """Test that analyze_cv_batch returns one result per item, in order."""
+        batch_service = CVCheckerService(InMemoryAnalysisRepository(), MagicMock())
+
+        async def execute(cv_markdown, job_description):
+            return AnalysisResult(
+                overall_score=float(len(cv_markdown) - len(sample_cv_markdown))
+            )
+
+        batch_service.orchestrator.execute = AsyncMock(side_effect=execute)
+        items = [
+            (sample_cv_markdown + "x" * length, sample_job_description)
+            for length in range(1, 6)
+        ]
+
+        results = await batch_service.analyze_cv_batch(items, batch_size=2)
+
+        assert [result.overall_score for result in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert batch_service.orchestrator.execute.await_count == 5
+
+    async def test_analyze_cv_repeated_input_served_from_cache(
+        self, sample_cv_markdown, sample_job_description
+    ):
+        """Test that an identical analysis reuses the cached result under a new ID."""
+        cached_service = CVCheckerService(InMemoryAnalysisRepository(), MagicMock())
+        cached_service.orchestrator.execute = AsyncMock(
+            return_value=AnalysisResult(overall_score=85.5, strengths=["Python"])
+        )
+
+        first = await cached_service.analyze_cv(sample_cv_markdown, sample_job_description)
+        second = await cached_service.analyze_cv(sample_cv_markdown, sample_job_description)
+        await cached_service.analyze_cv(sample_cv_markdown, f"{sample_job_description}\nRemote")
+
+        assert cached_service.orchestrator.execute.await_count == 2
+        assert second.overall_score == first.overall_score
+        assert second.strengths == first.strengths
+        assert second.id != first.id
+
+    async def test_analyze_cv_insufficient_input_skips_workflow(
+        self, sample_job_description
+    ):
+        """Test that unanalyzable input gets a zero-score result without the workflow."""
+        gated_service = CVCheckerService(InMemoryAnalysisRepository(), MagicMock())
+        gated_service.orchestrator.execute = AsyncMock()
+
+        short = await gated_service.analyze_cv("John Doe", sample_job_description)
+        unstructured = await gated_service.analyze_cv("lorem ipsum " * 20, "Engineer")
+
+        gated_service.orchestrator.execute.assert_not_awaited()
+        assert short.overall_score == 0.0
+        assert short.gaps == ["CV is too short (minimum 100 characters)"]
+        assert len(unstructured.gaps) == 2
@@ -8,93 +8,87 @@ Run this to verify all imports work correctly.
 import sys
 
 
-def test_imports():
-    """Test that all required packages can be imported."""
-    print("Testing Phase 3 imports...")
-    print("-" * 60)
+def _import_fastapi():
+    import fastapi
+    return f"FastAPI {fastapi.__version__}"
 
-    tests = []
 
-    # Test 1: FastAPI
-    try:
-        import fastapi
-        print(f"✅ FastAPI {fastapi.__version__}")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ FastAPI import failed: {e}")
-        tests.append(False)
+def _import_pydantic():
+    import pydantic
+    return f"Pydantic {pydantic.__version__}"
 
-    # Test 2: Pydantic
-    try:
-        import pydantic
-        print(f"✅ Pydantic {pydantic.__version__}")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ Pydantic import failed: {e}")
-        tests.append(False)
 
-    # Test 3: Azure Identity
-    try:
-        import azure.identity
-        print("✅ Azure Identity")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ Azure Identity import failed: {e}")
-        tests.append(False)
+def _import_azure_identity():
+    import azure.identity
+    return "Azure Identity"
 
-    # Test 4: Microsoft Agent Framework - Core
-    try:
-        import agent_framework
-        print("✅ Microsoft Agent Framework Core")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ Microsoft Agent Framework Core import failed: {e}")
-        tests.append(False)
 
-    # Test 5: Microsoft Agent Framework - Azure AI
-    try:
-        from agent_framework.azure import AzureOpenAIChatClient
-        print("✅ Microsoft Agent Framework Azure AI")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ Microsoft Agent Framework Azure AI import failed: {e}")
-        tests.append(False)
+def _import_agent_framework():
+    import agent_framework
+    return "Microsoft Agent Framework Core"
 
-    # Test 6: Application imports
-    try:
-        from app.config import get_settings
-        print("✅ App config")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ App config import failed: {e}")
-        tests.append(False)
 
-    # Test 7: Agent imports
-    try:
-        from app.agents.job_parser import JobParserAgent
-        from app.agents.cv_parser import CVParserAgent
-        from app.agents.analyzer import HybridScoringAgent
-        from app.agents.report_generator import ReportGeneratorAgent
-        from app.agents.orchestrator import CVCheckerOrchestrator
-        print("✅ All agent modules")
-        tests.append(True)
-    except ImportError as e:
-        print(f"❌ Agent import failed: {e}")
-        tests.append(False)
+def _import_agent_framework_azure():
+    from agent_framework.azure import AzureOpenAIChatClient
+    return "Microsoft Agent Framework Azure AI"
+
+
+def _import_app_config():
+    from app.config import get_settings
+    return "App config"
+
+
+def _import_agents():
+    from app.agents.job_parser import JobParserAgent
+    from app.agents.cv_parser import CVParserAgent
+    from app.agents.analyzer import HybridScoringAgent
+    from app.agents.report_generator import ReportGeneratorAgent
+    from app.agents.orchestrator import CVCheckerOrchestrator
+    return "All agent modules"
+
+
+def _import_utils():
+    from app.utils.azure_openai import get_openai_client
+    return "Azure OpenAI utils"
+
+
+# (label used on failure, import function returning the success message)
+IMPORT_CHECKS = [
+    ("FastAPI", _import_fastapi),
+    ("Pydantic", _import_pydantic),
+    ("Azure Identity", _import_azure_identity),
+    ("Microsoft Agent Framework Core", _import_agent_framework),
+    ("Microsoft Agent Framework Azure AI", _import_agent_framework_azure),
+    ("App config", _import_app_config),
+    ("Agent", _import_agents),
+    ("Azure OpenAI utils", _import_utils),
+]
 
-    # Test 8: Utils
+
+def _try_import(check):
+    """Run one import check, returning (passed, message)."""
+    label, import_fn = check
     try:
-        from app.utils.azure_openai import get_openai_client
-        print("✅ Azure OpenAI utils")
-        tests.append(True)
+        return True, f"✅ {import_fn()}"
     except ImportError as e:
-        print(f"❌ Azure OpenAI utils import failed: {e}")
-        tests.append(False)
+        return False, f"❌ {label} import failed: {e}"
+
+
+def test_imports():
+    """Test that all required packages can be imported."""
+    print("Testing Phase 3 imports...")
+    print("-" * 60)
+
+    failed = 0
+    for check in IMPORT_CHECKS:
+        passed, message = _try_import(check)
+        print(message)
+        failed += not passed
 
     print("-" * 60)
 
-    if all(tests):
-        print(f"✅ All {len(tests)} import tests passed!")
+    if not failed:
+        print(f"✅ All {len(IMPORT_CHECKS)} import tests passed!")
         print("\nPhase 3 implementation is ready for testing.")
         print("\nNext steps:")
         print("1. Configure Azure OpenAI credentials in .env")
@@ -103,8 +97,7 @@ def test_imports():
         print("4. See TESTING_GUIDE.md for full testing instructions")
         return 0
     else:
-        failed = len([t for t in tests if not t])
-        print(f"❌ {failed}/{len(tests)} import tests failed!")
+        print(f"❌ {failed}/{len(IMPORT_CHECKS)} import tests failed!")
         print("\nPlease install missing dependencies:")
         print("pip install -r requirements.txt")
         return 1
@@ -0,0 +1,17 @@
+"""Output helpers shared by the verification scripts."""
+
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+
+@contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it out at once."""
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            yield
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
@@ -9,19 +9,47 @@ import asyncio
 import logging
 import os
 import sys
+from itertools import groupby
 from pathlib import Path
 
 # Add backend to path
 backend_path = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_path))
 
-from azure.cosmos import CosmosClient, exceptions
-from azure.identity import DefaultAzureCredential
+from azure.cosmos import exceptions
 from app.config import get_settings
+from app.repositories.cosmos_repository import create_cosmos_client
+from app.utils.credential import close_credential
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_settings = get_settings()
+
+# Cosmos client and container kept for the whole run, so connections and
+# container metadata are reused by every check
+_client = None
+_container = None
+
+
+def _get_container():
+    """Return the shared container client, creating the Cosmos client on first use."""
+    global _client, _container
+    if _container is None:
+        _client = create_cosmos_client(_settings)
+        database = _client.get_database_client(_settings.cosmos_database_name)
+        _container = database.get_container_client(_settings.cosmos_container_name)
+    return _container
+
+
+async def _close_client():
+    """Close the shared Cosmos client and credential, if they were created."""
+    global _client, _container
+    if _client is not None:
+        await _client.close()
+        _client = _container = None
+    await close_credential()
+
 
 async def test_no_duplicate_analysis():
     """Test that we don't create duplicate analysis records."""
@@ -30,105 +58,153 @@ async def test_no_duplicate_analysis():
     logger.info("Testing Fix #2: No Duplicate Analysis Records")
     logger.info("=" * 80)
     
-    settings = get_settings()
-    
-    if not settings.is_cosmos_enabled:
+    if not _settings.is_cosmos_enabled:
         logger.warning("⚠️  Cosmos DB not enabled - skipping test")
         return
     
-    # Connect to Cosmos DB using the same method as the main app
+    # Connect to Cosmos DB with the same async client as the main app, so
+    # the query does not block the event loop
     try:
-        connection_str = settings.cosmos_connection_string
-        if "AccountKey=" in connection_str:
-            # Using connection string with account key
-            client = CosmosClient.from_connection_string(connection_str)
-        else:
-            # Using Azure AD authentication
-            credential = DefaultAzureCredential()
-            client = CosmosClient(connection_str, credential)
-        
-        database = client.get_database_client(settings.cosmos_database_name)
-        container = database.get_container_client(settings.cosmos_container_name)
+        container = _get_container()
     except Exception as e:
         logger.error(f"❌ Failed to connect to Cosmos DB: {e}")
         return
     
-    # Get all analysis documents for anonymous user
-    user_id = "anonymous"
+    return await _check_analysis_records(container)
+
+
+# Page size for queries, and how many duplicates or malformed IDs are reported
+_PAGE_SIZE = 100
+_MAX_REPORTED = 10
+
+
+def _iter_query(container, query, user_id, **params):
+    """Iterate a query scoped to the user's partition, page by page."""
+    parameters = [{"name": "@userId", "value": user_id}]
+    parameters += [{"name": f"@{name}", "value": value} for name, value in params.items()]
+    return container.query_items(
+        query=query,
+        parameters=parameters,
+        partition_key=user_id,
+        max_item_count=_PAGE_SIZE,
+    )
+
+
+async def _query(container, query, user_id, **params):
+    """Run a query scoped to the user's partition and collect the results."""
+    return [item async for item in _iter_query(container, query, user_id, **params)]
+
+
+async def _check_analysis_records(container):
+    """Check the anonymous user's analysis records for duplicates and ID format."""
     
-    query = """
-    SELECT c.id, c.userId, c.cvId, c.jobId, c.createdAt
-    FROM c
-    WHERE c.userId = @userId
-    AND c.documentType = 'analysis'
-    ORDER BY c.createdAt DESC
-    """
+    # Counts and grouping run server-side, so only duplicates are shipped
+    user_id = "anonymous"
+    where = "WHERE c.userId = @userId AND c.type = 'analysis'"
     
     try:
-        items = list(container.query_items(
-            query=query,
-            parameters=[{"name": "@userId", "value": user_id}],
-            partition_key=user_id,
-            enable_cross_partition_query=False
-        ))
+        [total] = await _query(container, f"SELECT VALUE COUNT(1) FROM c {where}", user_id)
         
-        logger.info(f"\n📊 Found {len(items)} analysis document(s) for user '{user_id}'")
+        logger.info(f"\n📊 Found {total} analysis document(s) for user '{user_id}'")
         
-        if not items:
+        if not total:
             logger.info("✅ No analysis documents found (clean state)")
             return
         
-        # Group by timestamp to find potential duplicates
-        from collections import defaultdict
-        by_timestamp = defaultdict(list)
-        
-        for item in items:
-            created_at = item.get('createdAt', 'unknown')
-            by_timestamp[created_at].append(item)
+        # Fast path: with as many distinct timestamps as documents there are no
+        # duplicates, and the per-timestamp groups never need to be shipped
+        [distinct] = await _query(
+            container,
+            f"SELECT VALUE COUNT(1) FROM (SELECT DISTINCT VALUE c.createdAt FROM c {where})",
+            user_id,
+        )
         
-        # Check for duplicates
-        duplicates_found = False
-        for timestamp, docs in by_timestamp.items():
-            if len(docs) > 1:
-                duplicates_found = True
-                logger.error(f"\n❌ DUPLICATE FOUND at {timestamp}:")
-                for doc in docs:
-                    logger.error(f"   - ID: {doc['id']}")
-                    logger.error(f"     CV ID: {doc.get('cvId', 'N/A')}")
-                    logger.error(f"     Job ID: {doc.get('jobId', 'N/A')}")
+        # Cosmos DB has no HAVING clause, so single timestamps are dropped here;
+        # stop paging once enough duplicates have been found to report
+        timestamps = []
+        if distinct < total:
+            async for group in _iter_query(
+                container,
+                f"SELECT c.createdAt, COUNT(1) AS cnt FROM c {where} GROUP BY c.createdAt",
+                user_id,
+            ):
+                if group['cnt'] > 1:
+                    timestamps.append(group.get('createdAt'))
+                    if len(timestamps) == _MAX_REPORTED:
+                        break
         
-        if not duplicates_found:
+        if timestamps:
+            docs = await _query(
+                container,
+                f"""
+                SELECT c.id, c.cvId, c.jobId, c.createdAt
+                FROM c {where} AND ARRAY_CONTAINS(@timestamps, c.createdAt)
+                ORDER BY c.createdAt DESC
+                """,
+                user_id,
+                timestamps=timestamps,
+            )
+            # The docs are sorted by createdAt, so each duplicate set is adjacent;
+            # one log record per report rather than per line
+            lines = []
+            for timestamp, group in groupby(docs, key=lambda doc: doc.get('createdAt')):
+                lines.append(f"\n❌ DUPLICATE FOUND at {timestamp or 'unknown'}:")
+                lines += [
+                    f"   - ID: {doc['id']}\n"
+                    f"     CV ID: {doc.get('cvId', 'N/A')}\n"
+                    f"     Job ID: {doc.get('jobId', 'N/A')}"
+                    for doc in group
+                ]
+            logger.error("\n".join(lines))
+        else:
             logger.info("\n✅ No duplicate analysis records found!")
-            logger.info("\nAnalysis documents:")
-            for item in items[:5]:  # Show first 5
-                logger.info(f"  - {item['id']} (created: {item.get('createdAt', 'unknown')})")
-                logger.info(f"    CV: {item.get('cvId', 'N/A')}, Job: {item.get('jobId', 'N/A')}")
+            latest = await _query(
+                container,
+                f"SELECT TOP 5 c.id, c.cvId, c.jobId, c.createdAt FROM c {where} "
+                "ORDER BY c.createdAt DESC",
+                user_id,
+            )
+            rows = [
+                f"  - {item['id']} (created: {item.get('createdAt', 'unknown')})\n"
+                f"    CV: {item.get('cvId', 'N/A')}, Job: {item.get('jobId', 'N/A')}"
+                for item in latest
+            ]
+            logger.info("\nAnalysis documents:\n" + "\n".join(rows))
         
         # Check ID format
         logger.info("\n📋 Checking ID formats:")
-        correct_format = 0
-        incorrect_format = 0
+        [incorrect_format] = await _query(
+            container,
+            f"SELECT VALUE COUNT(1) FROM c {where} AND NOT STARTSWITH(c.id, 'analysis-')",
+            user_id,
+        )
+        correct_format = total - incorrect_format
         
-        for item in items:
-            doc_id = item['id']
-            if doc_id.startswith('analysis-'):
-                correct_format += 1
-                logger.info(f"  ✅ {doc_id} (correct format)")
-            else:
-                incorrect_format += 1
-                logger.error(f"  ❌ {doc_id} (incorrect format - should start with 'analysis-')")
-        
-        logger.info(f"\n📈 Summary:")
-        logger.info(f"  Correct format: {correct_format}")
-        logger.info(f"  Incorrect format: {incorrect_format}")
+        logger.info(
+            f"\n📈 Summary:\n"
+            f"  Correct format: {correct_format}\n"
+            f"  Incorrect format: {incorrect_format}"
+        )
         
         if incorrect_format > 0:
+            offenders = await _query(
+                container,
+                f"SELECT TOP {_MAX_REPORTED} VALUE c.id FROM c {where} "
+                "AND NOT STARTSWITH(c.id, 'analysis-')",
+                user_id,
+            )
+            logger.error(
+                "\n".join(
+                    f"  ❌ {doc_id} (incorrect format - should start with 'analysis-')"
+                    for doc_id in offenders
+                )
+            )
             logger.error("\n❌ Found analysis records with incorrect ID format!")
             logger.error("   This suggests old code or duplicate save logic is still active.")
         else:
             logger.info("\n✅ All analysis records have correct ID format!")
         
-        return not duplicates_found and incorrect_format == 0
+        return not timestamps and incorrect_format == 0
         
     except exceptions.CosmosHttpResponseError as e:
         logger.error(f"❌ Cosmos DB query failed: {e}")
@@ -184,7 +260,10 @@ async def main():
     test_frontend_navigation()
     
     # Test 2: Automated backend test
-    result = await test_no_duplicate_analysis()
+    try:
+        result = await test_no_duplicate_analysis()
+    finally:
+        await _close_client()
     
     logger.info("\n" + "=" * 80)
     logger.info("TEST SUMMARY")
@@ -16,11 +16,14 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
+from app.models.cosmos_models import CVDocument, JobDocument
+from app.models.requests import AnalyzeRequest
+from app.repositories.cosmos_repository import CosmosDBRepository
+from report_output import buffered_stdout
+
 
 async def test_cosmos_models():
     """Test Cosmos DB models have new fields."""
-    from app.models.cosmos_models import CVDocument, JobDocument
-    
     print("✓ Testing Cosmos DB models...")
     
     # Test CV document with filename
@@ -51,8 +54,6 @@ async def test_cosmos_models():
 
 async def test_repository_title_extraction():
     """Test job title extraction logic."""
-    from app.repositories.cosmos_repository import CosmosDBRepository
-    
     print("✓ Testing job title extraction...")
     
     # Create a mock repository (without container)
@@ -87,8 +88,6 @@ async def test_repository_title_extraction():
 
 async def test_request_models():
     """Test request models have new fields."""
-    from app.models.requests import AnalyzeRequest
-    
     print("✓ Testing request models...")
     
     # Test AnalyzeRequest with filename
@@ -118,10 +117,18 @@ async def main():
     print("=" * 60)
     print()
     
+    # The checks are independent, so run them together and report the first failure
+    results = await asyncio.gather(
+        test_cosmos_models(),
+        test_repository_title_extraction(),
+        test_request_models(),
+        return_exceptions=True,
+    )
+    
     try:
-        await test_cosmos_models()
-        await test_repository_title_extraction()
-        await test_request_models()
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         
         print("=" * 60)
         print("✅ ALL BACKEND TESTS PASSED")
@@ -145,4 +152,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # One write for the whole report rather than one per line
+    with buffered_stdout():
+        asyncio.run(main())
@@ -4,9 +4,27 @@ Quick verification that the fixes are in place.
 Checks the actual code to ensure changes were applied.
 """
 
+import mmap
+import re
 import sys
 from pathlib import Path
 
+from report_output import buffered_stdout
+
+
+def find_markers(file_path, markers):
+    """Return the markers present in a file, found in a single pass over it."""
+    # The lookahead lets overlapping markers all match
+    pattern = re.compile(
+        b"(?=(" + b"|".join(re.escape(marker.encode()) for marker in markers) + b"))"
+    )
+    with open(file_path, "rb") as f:
+        if not f.seek(0, 2):
+            return set()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return {match.group(1).decode() for match in pattern.finditer(content)}
+
+
 def check_frontend_fix():
     """Verify the frontend fix is in place."""
     print("=" * 80)
@@ -19,7 +37,11 @@ def check_frontend_fix():
         print(f"❌ File not found: {file_path}")
         return False
     
-    content = file_path.read_text()
+    content = find_markers(file_path, (
+        "partialize: (state) => ({",
+        "currentView: state.currentView",
+        "partialize: () => ({})",
+    ))
     
     # Check that the old persistence config is NOT present
     if "partialize: (state) => ({" in content and "currentView: state.currentView" in content:
@@ -51,7 +73,12 @@ def check_backend_fix():
         print(f"❌ File not found: {file_path}")
         return False
     
-    content = file_path.read_text()
+    content = find_markers(file_path, (
+        "await self.repository.save(result)",
+        "analysis_id = await self.repository.save",
+        "async def analyze_cv(",
+        "return result",
+    ))
     
     # Check that the duplicate save call is NOT present
     if "await self.repository.save(result)" in content:
@@ -127,4 +154,7 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # One write for the whole report rather than one per line
+    with buffered_stdout():
+        code = main()
+    sys.exit(code)
@@ -5,14 +5,55 @@ Tests the /api/v1/analyze/stream endpoint to verify progress updates.
 """
 
 import asyncio
-import json
+import os
 import sys
 
 import aiohttp
+import orjson
 
+# Number of analyses streamed at once; raise it to load-test the backend
+STREAM_CONCURRENCY = int(os.environ.get("STREAM_CONCURRENCY", "1"))
 
-async def test_streaming_endpoint():
-    """Test the streaming analysis endpoint."""
+# HTTP session shared by every request of the run, so connections are kept alive
+_SESSION: aiohttp.ClientSession | None = None
+
+
+async def _session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+        )
+    return _SESSION
+
+
+async def _close_session() -> None:
+    """Close the shared HTTP session, if it was created."""
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
+
+async def iter_frames(content, chunk_size=4096):
+    """Yield the non-empty newline-delimited frames of a streamed body."""
+    buffer = bytearray()
+    async for chunk in content.iter_chunked(chunk_size):
+        buffer += chunk
+        while (newline := buffer.find(b"\n")) != -1:
+            # orjson skips surrounding whitespace, so frames aren't stripped
+            frame = bytes(buffer[:newline])
+            del buffer[:newline + 1]
+            if frame and not frame.isspace():
+                yield frame
+    # The last frame may not end with a newline
+    if buffer and not buffer.isspace():
+        yield bytes(buffer)
+
+
+async def test_streaming_endpoint(concurrency=STREAM_CONCURRENCY):
+    """Test the streaming analysis endpoint with one or more concurrent streams."""
     url = "http://localhost:8000/api/v1/analyze/stream"
     
     # Sample test data
@@ -40,79 +81,97 @@ Software Engineer
     
     print("🚀 Testing streaming analysis endpoint...")
     print(f"📍 URL: {url}")
+    if concurrency > 1:
+        print(f"🔀 Concurrent streams: {concurrency}")
     print("=" * 60)
     
+    # All runs share the session and the encoded request body
+    session = await _session()
+    body = orjson.dumps(payload)
+    async with asyncio.TaskGroup() as tg:
+        runs = [
+            tg.create_task(_stream_analysis(session, url, body))
+            for _ in range(concurrency)
+        ]
+    
+    passed = sum(run.result() for run in runs)
+    if concurrency > 1:
+        print(f"\n📈 Concurrent streams passed: {passed}/{concurrency}")
+    return passed == concurrency
+
+
+async def _stream_analysis(session, url, body):
+    """Stream one analysis and check its progress updates and result."""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    print(f"❌ Error: HTTP {response.status}")
-                    text = await response.text()
-                    print(f"Response: {text}")
-                    return False
-                
-                print(f"✅ Connection established (HTTP {response.status})")
-                print("=" * 60)
-                print("\n📊 Progress Updates:\n")
-                
-                step_count = 0
-                result_received = False
-                
-                # Read streaming response
-                async for line in response.content:
-                    line_str = line.decode('utf-8').strip()
-                    if not line_str:
-                        continue
+        async with session.post(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            if response.status != 200:
+                print(f"❌ Error: HTTP {response.status}")
+                text = await response.text()
+                print(f"Response: {text}")
+                return False
+            
+            print(f"✅ Connection established (HTTP {response.status})")
+            print("=" * 60)
+            print("\n📊 Progress Updates:\n")
+            
+            step_count = 0
+            result_received = False
+            
+            # Read streaming response
+            async for frame in iter_frames(response.content):
+                try:
+                    chunk = orjson.loads(frame)
                     
-                    try:
-                        chunk = json.loads(line_str)
+                    if chunk.get("type") == "progress":
+                        step = chunk.get("step")
+                        total = chunk.get("total_steps")
+                        message = chunk.get("message")
+                        status = chunk.get("status")
                         
-                        if chunk.get("type") == "progress":
-                            step = chunk.get("step")
-                            total = chunk.get("total_steps")
-                            message = chunk.get("message")
-                            status = chunk.get("status")
-                            
-                            step_count += 1
-                            
-                            # Print progress update
-                            if status == "in_progress":
-                                print(f"⏳ Step {step}/{total}: {message}")
-                            elif status == "completed":
-                                print(f"✅ Step {step}/{total}: {message}")
-                            
-                        elif chunk.get("type") == "result":
-                            result_received = True
-                            data = chunk.get("data", {})
-                            score = data.get("overall_score")
-                            analysis_id = data.get("analysis_id")
-                            
-                            print("\n" + "=" * 60)
-                            print("🎯 Final Result:")
-                            print(f"   Analysis ID: {analysis_id}")
-                            print(f"   Overall Score: {score}/100")
-                            print("=" * 60)
-                            
-                        elif chunk.get("type") == "error":
-                            print(f"\n❌ Error: {chunk.get('message')}")
-                            return False
-                            
-                    except json.JSONDecodeError as e:
-                        print(f"⚠️  Failed to parse chunk: {line_str[:100]}...")
-                        print(f"   Error: {e}")
-                
-                # Verify we got all expected updates
-                print(f"\n📈 Summary:")
-                print(f"   Progress updates received: {step_count}")
-                print(f"   Result received: {result_received}")
+                        step_count += 1
+                        
+                        # Print progress update
+                        if status == "in_progress":
+                            print(f"⏳ Step {step}/{total}: {message}")
+                        elif status == "completed":
+                            print(f"✅ Step {step}/{total}: {message}")
+                        
+                    elif chunk.get("type") == "result":
+                        result_received = True
+                        data = chunk.get("data", {})
+                        score = data.get("overall_score")
+                        analysis_id = data.get("analysis_id")
+                        
+                        print("\n" + "=" * 60)
+                        print("🎯 Final Result:")
+                        print(f"   Analysis ID: {analysis_id}")
+                        print(f"   Overall Score: {score}/100")
+                        print("=" * 60)
+                        
+                    elif chunk.get("type") == "error":
+                        print(f"\n❌ Error: {chunk.get('message')}")
+                        return False
+                        
+                except orjson.JSONDecodeError as e:
+                    print(f"⚠️  Failed to parse chunk: {frame[:100].decode('utf-8', 'replace')}...")
+                    print(f"   Error: {e}")
+            
+            # Verify we got all expected updates
+            print(f"\n📈 Summary:")
+            print(f"   Progress updates received: {step_count}")
+            print(f"   Result received: {result_received}")
+            
+            if result_received and step_count >= 4:
+                print("\n✅ Test PASSED - All progress updates and result received!")
+                return True
+            else:
+                print(f"\n❌ Test FAILED - Missing updates or result")
+                return False
                 
-                if result_received and step_count >= 4:
-                    print("\n✅ Test PASSED - All progress updates and result received!")
-                    return True
-                else:
-                    print(f"\n❌ Test FAILED - Missing updates or result")
-                    return False
-                    
     except aiohttp.ClientError as e:
         print(f"\n❌ Connection Error: {e}")
         print("   Make sure the backend is running on http://localhost:8000")
@@ -130,7 +189,10 @@ async def main():
     print("  Progress Tracking Streaming Test")
     print("=" * 60 + "\n")
     
-    success = await test_streaming_endpoint()
+    try:
+        success = await test_streaming_endpoint()
+    finally:
+        await _close_session()
     
     print("\n" + "=" * 60)
     if success: